@@ -2,9 +2,11 @@
 Admin configuration for the news application.
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from .models import CustomUser, Article, PublishingHouse
+from .search import get_search_backend
 
 # ---------------------------------------
 # CUSTOM USER ADMIN
@@ -47,9 +49,28 @@ class ArticleAdmin(admin.ModelAdmin):
     list_display = ['title', 'journalist', 'approved', 'created_at',
                     'publishing_house']
     list_filter = ['approved', 'created_at', 'publishing_house']
-    search_fields = ['title', 'content', 'journalist__username']
+    search_fields = ['journalist__username']
     ordering = ['-created_at']
 
+    def get_search_results(self, request, queryset, search_term):
+        """Match title/content through the full-text index instead of
+        LIKE scans, and the journalist's username as before."""
+        by_username, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        if not search_term:
+            return by_username, may_have_duplicates
+
+        matching_ids = get_search_backend().search(
+            search_term,
+            approved_only=False,
+            limit=settings.SEARCH_ADMIN_MAX_RESULTS,
+        )
+        return (
+            queryset.filter(id__in=matching_ids) | by_username,
+            may_have_duplicates,
+        )
+
 
 admin.site.register(Article, ArticleAdmin)
 
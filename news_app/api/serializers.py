@@ -1,4 +1,5 @@
 """Serializers for the news app."""
+from django.conf import settings
 from rest_framework import serializers
 from news_app.models import Article, PublishingHouse
 
@@ -23,9 +24,70 @@ class ArticleSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class ArticleListSerializer(serializers.ModelSerializer):
+    """Compact Article serializer for list responses.
+
+    Ships the stored excerpt instead of the full content. Pair it with
+    ``optimize_queryset`` so a whole page is read in a single query.
+    """
+    journalist = serializers.CharField(
+        source='journalist.username', read_only=True
+    )
+    publishing_house = serializers.CharField(
+        source='publishing_house.name', read_only=True, default=None
+    )
+
+    class Meta:
+        """Meta class for ArticleListSerializer."""
+        model = Article
+        fields = [
+            'id',
+            'title',
+            'excerpt',
+            'publishing_house',
+            'journalist',
+            'approved',
+            'created_at',
+        ]
+        read_only_fields = fields
+
+    COLUMNS = [
+        'id',
+        'title',
+        'excerpt',
+        'approved',
+        'created_at',
+        'journalist__username',
+        'publishing_house__name',
+    ]
+
+    @classmethod
+    def optimize_queryset(cls, queryset, prefix=''):
+        """Join and project exactly the columns the serializer reads.
+
+        ``prefix`` is the lookup path to the article when ``queryset`` is
+        over another model, e.g. ``'article__'`` for feed entries.
+        """
+        related = [f'{prefix}journalist', f'{prefix}publishing_house']
+        columns = [prefix + column for column in cls.COLUMNS]
+        if prefix:
+            columns.append(prefix.rstrip('_'))
+        return queryset.select_related(*related).only(*columns)
+
+
 class PublishingHouseSerializer(serializers.ModelSerializer):
     """Serializer for the PublishingHouse model."""
     class Meta:
         """Meta class for PublishingHouseSerializer."""
         model = PublishingHouse
         fields = '__all__'
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    """Validates a bulk approve/reject request from an editor."""
+    action = serializers.ChoiceField(choices=("approve", "reject"))
+    article_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.BULK_REVIEW_MAX_ARTICLES,
+    )
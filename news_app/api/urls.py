@@ -1,6 +1,14 @@
 """news_project/news_app/api/urls.py"""
 from django.urls import path
-from .views import SubscribedArticlesAPIView
+from .views import (
+    ArticleExportAPIView,
+    ArticleSearchAPIView,
+    BulkReviewAPIView,
+    SubscribedArticlesAPIView,
+    SubscriptionAPIView,
+    SubscriptionListAPIView,
+)
+from news_app.subscriptions import JOURNALISTS, PUBLISHING_HOUSES
 
 urlpatterns = [
     path(
@@ -8,4 +16,36 @@ urlpatterns = [
         SubscribedArticlesAPIView.as_view(),
         name="api_articles"
     ),
+    path(
+        "articles/search/",
+        ArticleSearchAPIView.as_view(),
+        name="api_article_search"
+    ),
+    path(
+        "articles/export/",
+        ArticleExportAPIView.as_view(),
+        name="api_article_export"
+    ),
+    path(
+        "articles/review/",
+        BulkReviewAPIView.as_view(),
+        name="api_bulk_review"
+    ),
+    path(
+        "subscriptions/",
+        SubscriptionListAPIView.as_view(),
+        name="api_subscriptions"
+    ),
+    path(
+        "subscriptions/journalists/<int:target_id>/",
+        SubscriptionAPIView.as_view(),
+        {"kind": JOURNALISTS},
+        name="api_journalist_subscription"
+    ),
+    path(
+        "subscriptions/publishing-houses/<int:target_id>/",
+        SubscriptionAPIView.as_view(),
+        {"kind": PUBLISHING_HOUSES},
+        name="api_publishing_house_subscription"
+    ),
 ]
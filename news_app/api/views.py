@@ -4,13 +4,50 @@ API views for the news app.
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import (
+    AllowAny,
+    IsAdminUser,
+    IsAuthenticated,
+)
+from rest_framework import status
+from rest_framework.exceptions import (
+    NotFound,
+    PermissionDenied,
+    ValidationError,
+)
+from rest_framework.utils.urls import replace_query_param
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db.models import Q
-from news_app.models import PublishingHouse, Article
+from django.http import JsonResponse, StreamingHttpResponse
+from news_app.caching import serialize_articles
+from news_app.exports import FORMATS, ArticleExport, parse_since
+from news_app.feeds import feed_mode_enabled, reader_feed_page
+from news_app.models import (
+    PUBLISHED,
+    Article,
+    CustomUser,
+    PublishingHouse,
+)
+from news_app.pagination import (
+    InvalidCursor,
+    apaginate_articles,
+    get_page_size,
+    paginate_articles,
+)
+from news_app.reviews import bulk_review
+from news_app.search import get_search_backend
+from news_app.subscriptions import (
+    JOURNALISTS,
+    asubscription_ids,
+    subscribe,
+    subscription_ids,
+    unsubscribe,
+)
 from news_app.api.serializers import (
     PublishingHouseSerializer,
-    ArticleSerializer,
+    ArticleListSerializer,
+    BulkReviewSerializer,
 )
 from rest_framework import generics
 
@@ -22,10 +59,36 @@ class SubscribedArticlesAPIView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
+    @staticmethod
+    def cursor_link(request, cursor):
+        """Absolute URL of this endpoint positioned at ``cursor``."""
+        if cursor is None:
+            return None
+        return replace_query_param(
+            request.build_absolute_uri(), "cursor", cursor
+        )
+
+    @staticmethod
+    def read_time_feed(user, ids=None):
+        """Approved articles from the reader's subscriptions.
+
+        The subscribed ids come from the cache, so this is a single
+        index-driven query on the article table.
+        """
+        if ids is None:
+            ids = subscription_ids(user)
+        articles = Article.objects.filter(
+            PUBLISHED
+        ).filter(
+            Q(publishing_house_id__in=ids.publishing_houses) |
+            Q(journalist_id__in=ids.journalists)
+        )
+        return ArticleListSerializer.optimize_queryset(articles)
+
     def get(self, request):
         """
-        Returns approved articles based on reader subscriptions.
-        Only accessible to authenticated readers.
+        Returns a page of approved articles based on reader subscriptions,
+        newest first, with opaque ``next``/``previous`` cursor links.
         """
         user = request.user
 
@@ -33,16 +96,243 @@ class SubscribedArticlesAPIView(APIView):
         if user.role != "reader":
             raise PermissionDenied("Only readers can access this endpoint.")
 
-        # Use publishing_house instead of publisher
-        articles = Article.objects.filter(
-            approved=True
-        ).filter(
-            Q(publishing_house__in=user.subscribed_publishing_houses.all()) |
-            Q(journalist__in=user.subscribed_journalists.all())
-        ).distinct()
+        cursor = request.query_params.get("cursor")
+        page_size = get_page_size(request.query_params.get("page_size"))
+
+        try:
+            if feed_mode_enabled():
+                page = reader_feed_page(user, cursor, page_size)
+            else:
+                page = paginate_articles(
+                    self.read_time_feed(user), cursor, page_size
+                )
+        except InvalidCursor as exc:
+            raise ValidationError({"cursor": "Invalid cursor."}) from exc
+
+        return Response({
+            "next": self.cursor_link(request, page.next_cursor),
+            "previous": self.cursor_link(request, page.prev_cursor),
+            "results": serialize_articles(
+                page.items, ArticleListSerializer
+            ),
+        })
+
+
+async def asubscribed_articles(request):
+    """
+    Async ``SubscribedArticlesAPIView`` for the ASGI deployment.
+
+    Session-authenticated readers' GETs are served on the event loop.
+    Everything else (other methods, authentication schemes, non-readers)
+    is handed to the DRF view, so those responses are exactly the same.
+    """
+    user = await request.auser()
+    if (request.method not in ("GET", "HEAD") or
+            not user.is_authenticated or user.role != "reader"):
+        return await sync_to_async(
+            SubscribedArticlesAPIView.as_view()
+        )(request)
+
+    cursor = request.GET.get("cursor")
+    page_size = get_page_size(request.GET.get("page_size"))
+    try:
+        if feed_mode_enabled():
+            page = await sync_to_async(reader_feed_page)(
+                user, cursor, page_size
+            )
+        else:
+            page = await apaginate_articles(
+                SubscribedArticlesAPIView.read_time_feed(
+                    user, await asubscription_ids(user)
+                ),
+                cursor,
+                page_size,
+            )
+    except InvalidCursor:
+        return JsonResponse({"cursor": ["Invalid cursor."]}, status=400)
+
+    cursor_link = SubscribedArticlesAPIView.cursor_link
+    return JsonResponse({
+        "next": cursor_link(request, page.next_cursor),
+        "previous": cursor_link(request, page.prev_cursor),
+        "results": await sync_to_async(serialize_articles)(
+            page.items, ArticleListSerializer
+        ),
+    })
+
+
+class ArticleSearchAPIView(APIView):
+    """
+    Ranked full-text search over approved articles.
+    Accepts ``q`` and a 1-based ``page`` query parameter.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        """Returns one page of approved articles matching ``q``, best first."""
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "A search term is required."})
+
+        try:
+            page = int(request.query_params.get("page", 1))
+        except ValueError as exc:
+            raise ValidationError({"page": "Invalid page."}) from exc
+        if not 1 <= page <= settings.SEARCH_MAX_PAGES:
+            raise ValidationError({"page": "Invalid page."})
+
+        page_size = settings.SEARCH_PAGE_SIZE
+        ids = get_search_backend().search(
+            query,
+            limit=page_size + 1,
+            offset=(page - 1) * page_size,
+        )
+        has_next = len(ids) > page_size and page < settings.SEARCH_MAX_PAGES
+        ids = ids[:page_size]
+
+        articles = ArticleListSerializer.optimize_queryset(
+            Article.objects.all()
+        ).in_bulk(ids)
+        results = serialize_articles(
+            [articles[pk] for pk in ids if pk in articles],
+            ArticleListSerializer,
+        )
+        url = request.build_absolute_uri()
+        return Response({
+            "next": replace_query_param(url, "page", page + 1)
+            if has_next else None,
+            "previous": replace_query_param(url, "page", page - 1)
+            if page > 1 else None,
+            "results": results,
+        })
+
+
+class ArticleExportAPIView(APIView):
+    """
+    Streams the article archive as NDJSON or CSV for analytics and
+    indexing jobs. Staff only.
+
+    Query parameters: ``export_format`` (ndjson/csv; DRF reserves
+    ``format``), ``since`` and ``after_id``
+    for incremental exports, ``gzip=1`` and ``include_pending=1``.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        """Returns a streaming response; memory use is independent of size."""
+        params = request.query_params
+        export_format = params.get("export_format", "ndjson")
+        if export_format not in FORMATS:
+            raise ValidationError({"export_format": "Use ndjson or csv."})
+
+        try:
+            since = parse_since(params["since"]) if "since" in params else None
+        except ValueError as exc:
+            raise ValidationError({"since": str(exc)}) from exc
+        try:
+            after_id = int(params.get("after_id", 0))
+        except ValueError as exc:
+            raise ValidationError(
+                {"after_id": "An integer article id is required."}
+            ) from exc
+
+        compress = params.get("gzip") == "1"
+        export = ArticleExport(
+            since=since,
+            after_id=after_id,
+            approved_only=params.get("include_pending") != "1",
+        )
+        filename = f"articles.{export_format}"
+        if compress:
+            response = StreamingHttpResponse(
+                export.chunks(export_format, compress=True),
+                content_type="application/gzip",
+            )
+            filename += ".gz"
+        else:
+            response = StreamingHttpResponse(
+                export.chunks(export_format),
+                content_type=FORMATS[export_format],
+            )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class BulkReviewAPIView(APIView):
+    """
+    Approves or rejects a set of pending articles in one request.
+    Only accessible to editors, scoped to their publishing house.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Applies ``action`` to ``article_ids`` and returns the count."""
+        if request.user.role != "editor":
+            raise PermissionDenied("Only editors can review articles.")
+
+        serializer = BulkReviewSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        action = serializer.validated_data["action"]
+        updated = bulk_review(
+            request.user, serializer.validated_data["article_ids"], action
+        )
+        return Response({"action": action, "updated": updated})
+
+
+class SubscriptionListAPIView(APIView):
+    """
+    Lists the journalists and publishing houses the reader follows.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Returns the followed ids, served from the per-reader cache."""
+        if request.user.role != "reader":
+            raise PermissionDenied("Only readers have subscriptions.")
+
+        ids = subscription_ids(request.user)
+        return Response({
+            "journalists": sorted(ids.journalists),
+            "publishing_houses": sorted(ids.publishing_houses),
+        })
+
+
+class SubscriptionAPIView(APIView):
+    """
+    Follows (POST) or unfollows (DELETE) one journalist or publishing
+    house. ``kind`` comes from the URL pattern.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @staticmethod
+    def check(request, kind, target_id):
+        """Reject non-readers and unknown journalists or houses."""
+        if request.user.role != "reader":
+            raise PermissionDenied("Only readers can subscribe.")
+        if kind == JOURNALISTS:
+            exists = CustomUser.objects.filter(
+                id=target_id, role="journalist"
+            ).exists()
+        else:
+            exists = PublishingHouse.objects.filter(id=target_id).exists()
+        if not exists:
+            raise NotFound()
+
+    def post(self, request, kind, target_id):
+        """Subscribes; 201 for a new subscription, 200 if it existed."""
+        self.check(request, kind, target_id)
+        created = subscribe(request.user, kind, target_id)
+        return Response(
+            {"subscribed": True},
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
 
-        serializer = ArticleSerializer(articles, many=True)
-        return Response(serializer.data)
+    def delete(self, request, kind, target_id):
+        """Unsubscribes; 404 if the reader was not subscribed."""
+        self.check(request, kind, target_id)
+        if not unsubscribe(request.user, kind, target_id):
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class PublishingHouseListView(generics.ListAPIView):
@@ -0,0 +1,129 @@
+"""
+Fingerprinted, precompressed static assets.
+
+``collectstatic`` with ``CompressedManifestStaticFilesStorage`` copies every
+asset under a content-hashed name (``styles.3f2a9c1b7d4e.css``, listed in
+``staticfiles.json``) and writes ``.gz`` and, when the optional ``brotli``
+package is installed, ``.br`` variants next to each text asset.
+
+``serve`` hands those files out from ``STATIC_ROOT``: it picks the smallest
+variant the client accepts and marks hashed names immutable, so repeat
+visits never ask for them again.
+"""
+import gzip
+import mimetypes
+import os
+from functools import cache
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import (
+    ManifestFilesMixin,
+    ManifestStaticFilesStorage,
+    staticfiles_storage,
+)
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = (
+    ".css", ".js", ".mjs", ".map", ".json", ".svg", ".txt", ".xml",
+    ".html",
+)
+# (Accept-Encoding token, file suffix), best first.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def compress(path):
+    """Write ``path.gz`` (and ``path.br``) if they are smaller."""
+    with open(path, "rb") as source:
+        content = source.read()
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content)
+    for suffix, compressed in variants.items():
+        if len(compressed) < len(content):
+            with open(path + suffix, "wb") as target:
+                target.write(compressed)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """Manifest storage that also precompresses text assets."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        for name, hashed_name, processed in super().post_process(
+            paths, dry_run, **options
+        ):
+            if not isinstance(processed, Exception):
+                for path in {name, hashed_name}:
+                    if path and path.endswith(COMPRESSIBLE_EXTENSIONS):
+                        compress(self.path(path))
+            yield name, hashed_name, processed
+
+
+@cache
+def hashed_names():
+    """Fingerprinted names from the manifest (read once per process)."""
+    if not isinstance(staticfiles_storage, ManifestFilesMixin):
+        return frozenset()
+    return frozenset(staticfiles_storage.hashed_files.values())
+
+
+def accepted_encodings(header):
+    """Content codings listed in an ``Accept-Encoding`` header."""
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def serve(request, path):
+    """Serve a collected static file, precompressed when possible."""
+    try:
+        fullpath = safe_join(settings.STATIC_ROOT, path)
+    except ValueError as exc:
+        raise Http404(path) from exc
+    if not os.path.isfile(fullpath):
+        raise Http404(path)
+
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    encoding = None
+    for coding, suffix in ENCODINGS:
+        if coding in accepted and os.path.isfile(fullpath + suffix):
+            encoding, fullpath = coding, fullpath + suffix
+            break
+
+    stat = os.stat(fullpath)
+    if not was_modified_since(
+        request.headers.get("If-Modified-Since"), stat.st_mtime
+    ):
+        return HttpResponseNotModified()
+
+    content_type, _ = mimetypes.guess_type(path)
+    response = FileResponse(
+        open(fullpath, "rb"),  # pylint: disable=consider-using-with
+        content_type=content_type or "application/octet-stream",
+        filename=os.path.basename(path),
+    )
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    response["Vary"] = "Accept-Encoding"
+    if encoding:
+        response["Content-Encoding"] = encoding
+    response["Cache-Control"] = (
+        IMMUTABLE if path in hashed_names()
+        else f"public, max-age={settings.STATIC_MAX_AGE}"
+    )
+    return response
@@ -0,0 +1,84 @@
+"""
+Authentication backend that serves ``request.user`` from the cache.
+
+A logged-in request normally costs a user query on top of the session
+lookup. ``CachedModelBackend`` keeps a slim snapshot of each user (the
+fields views and templates check, plus the session verification hash)
+in the cache and rebuilds the user from it. Any other field is loaded
+from the database on first access. Saving or deleting the user drops the
+snapshot (see ``signals.py``).
+
+Dropping the snapshot only reaches other processes through a shared
+cache, so without ``CACHE_SHARED`` the backend behaves like
+``ModelBackend``: a deactivated user or a changed password must take
+effect everywhere at once.
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from .models import CustomUser
+
+SNAPSHOT_FIELDS = (
+    "id",
+    "username",
+    "role",
+    "publishing_house_id",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+def user_cache_key(user_id):
+    """Cache key of a user's snapshot."""
+    return f"auth:user:{user_id}"
+
+
+def invalidate_user(user_id):
+    """Drop a user's cached snapshot."""
+    cache.delete(user_cache_key(user_id))
+
+
+def take_snapshot(user):
+    """The cached representation of ``user``."""
+    snapshot = {field: getattr(user, field) for field in SNAPSHOT_FIELDS}
+    snapshot["session_auth_hash"] = user.get_session_auth_hash()
+    return snapshot
+
+
+def user_from_snapshot(snapshot):
+    """A ``CustomUser`` with the snapshot fields loaded, others deferred."""
+    # from_db() expects the values in model field order.
+    fields = [
+        field.attname for field in CustomUser._meta.concrete_fields
+        if field.attname in SNAPSHOT_FIELDS
+    ]
+    user = CustomUser.from_db(
+        DEFAULT_DB_ALIAS, fields, [snapshot[field] for field in fields]
+    )
+    user.cached_session_auth_hash = snapshot["session_auth_hash"]
+    return user
+
+
+class CachedModelBackend(ModelBackend):
+    """``ModelBackend`` whose ``get_user`` reads a cached snapshot."""
+
+    def get_user(self, user_id):
+        if not settings.CACHE_SHARED:
+            return super().get_user(user_id)
+
+        snapshot = cache.get(user_cache_key(user_id))
+        if snapshot is not None:
+            user = user_from_snapshot(snapshot)
+            return user if self.user_can_authenticate(user) else None
+
+        user = super().get_user(user_id)
+        if user is not None:
+            cache.set(
+                user_cache_key(user_id),
+                take_snapshot(user),
+                settings.USER_CACHE_SECONDS,
+            )
+        return user
@@ -0,0 +1,4 @@
+"""
+Performance tooling: a reproducible synthetic dataset (``seed_synthetic``)
+and a benchmark runner for the hot views (``run_benchmarks``).
+"""
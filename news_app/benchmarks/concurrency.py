@@ -0,0 +1,119 @@
+"""
+Concurrent throughput of the WSGI and ASGI deployments.
+
+The WSGI side mimics a threaded server: ``concurrency`` threads each
+drive a test client against the sync views. The ASGI side runs the same
+number of concurrent tasks on one event loop against the async views of
+``news_project.asgi_urls``. Both report requests per second and latency
+percentiles for the same sequence of URLs.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+from django.test import AsyncClient, Client, override_settings
+
+from .runner import SCENARIOS, BenchmarkRunner, percentile
+
+ASGI_URLCONF = "news_project.asgi_urls"
+ASYNC_SCENARIOS = ("article_list", "article_detail", "api_articles")
+
+
+def summarize(latencies, seconds):
+    """Throughput and latency percentiles of one run."""
+    return {
+        "requests": len(latencies),
+        "requests_per_second": round(len(latencies) / seconds, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+class ConcurrencyBenchmark(BenchmarkRunner):
+    """Compare WSGI threads with ASGI tasks for one scenario."""
+
+    def __init__(self, scenario_name, requests=200, **kwargs):
+        super().__init__(**kwargs)
+        self.scenario = next(
+            scenario for scenario in SCENARIOS
+            if scenario.name == scenario_name
+        )
+        self.requests = requests
+        self.user = None
+        if self.scenario.role:
+            self.user = self.user_for(self.scenario)
+
+    def urls(self):
+        """The URL sequence both deployments request."""
+        return [self.url_for(self.scenario) for _ in range(self.requests)]
+
+    def run_wsgi(self, urls, concurrency):
+        """Drive the sync views from ``concurrency`` threads."""
+        def worker(chunk):
+            client = Client(raise_request_exception=False)
+            if self.user:
+                client.force_login(self.user)
+            latencies = []
+            try:
+                for url in chunk:
+                    started = time.perf_counter()
+                    client.get(url)
+                    latencies.append(
+                        (time.perf_counter() - started) * 1000
+                    )
+            finally:
+                close_old_connections()
+            return latencies
+
+        chunks = [urls[start::concurrency] for start in range(concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(worker, chunks))
+        seconds = time.perf_counter() - started
+        return summarize(
+            [latency for result in results for latency in result], seconds
+        )
+
+    async def _run_asgi(self, urls, concurrency):
+        async def worker(chunk):
+            client = AsyncClient(raise_request_exception=False)
+            if self.user:
+                await client.aforce_login(self.user)
+            latencies = []
+            for url in chunk:
+                started = time.perf_counter()
+                await client.get(url)
+                latencies.append((time.perf_counter() - started) * 1000)
+            return latencies
+
+        chunks = [urls[start::concurrency] for start in range(concurrency)]
+        started = time.perf_counter()
+        results = await asyncio.gather(*(worker(chunk) for chunk in chunks))
+        seconds = time.perf_counter() - started
+        return summarize(
+            [latency for result in results for latency in result], seconds
+        )
+
+    def run_asgi(self, urls, concurrency):
+        """Drive the async views from ``concurrency`` tasks."""
+        with override_settings(ROOT_URLCONF=ASGI_URLCONF):
+            return asyncio.run(self._run_asgi(urls, concurrency))
+
+    def run(self, levels=(1, 8, 32)):
+        """Run both deployments at each concurrency level."""
+        urls = self.urls()
+        results = {}
+        for concurrency in levels:
+            wsgi = self.run_wsgi(urls, concurrency)
+            asgi = self.run_asgi(urls, concurrency)
+            results[str(concurrency)] = {
+                "wsgi": wsgi,
+                "asgi": asgi,
+                "asgi_speedup": round(
+                    asgi["requests_per_second"] /
+                    wsgi["requests_per_second"], 2
+                ),
+            }
+        return results
@@ -0,0 +1,194 @@
+"""
+Benchmark runner for the hot views.
+
+Each scenario requests one URL through the Django test client as a
+synthetic user and records wall-clock latency and the number of DB
+queries per request. Peak Python memory is measured in a separate,
+shorter pass under ``tracemalloc`` so tracing does not skew latency.
+"""
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import django
+from django.db import connection, connections
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from ..metrics import QueryRecorder
+from ..models import Article, CustomUser
+from .synthetic import PREFIX
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+@dataclass
+class Scenario:
+    """One benchmarked URL and the kind of user requesting it."""
+    name: str
+    url_name: str
+    role: str = None
+    needs_article: bool = False
+
+
+SCENARIOS = [
+    Scenario("article_list", "article_list"),
+    Scenario("article_detail", "article_detail", needs_article=True),
+    Scenario("editor_dashboard", "editor_dashboard", role="editor"),
+    Scenario("journalist_dashboard", "journalist_dashboard",
+             role="journalist"),
+    Scenario("api_articles", "api_articles", role="reader"),
+]
+
+
+def git_commit():
+    """The current git commit, if the tree is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, check=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class BenchmarkRunner:
+    """Run scenarios and collect latency, query and memory figures."""
+
+    def __init__(self, iterations=100, warmup=5, memory_samples=5, seed=0):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.memory_samples = memory_samples
+        self.random = random.Random(seed)
+        self.article_ids = list(
+            Article.objects.filter(approved=True).order_by("id")
+            .values_list("id", flat=True)[:1000]
+        )
+
+    @staticmethod
+    def user_for(scenario):
+        """The first synthetic user with the scenario's role, if any."""
+        return CustomUser.objects.filter(
+            role=scenario.role,
+            is_active=True,
+            username__startswith=f"{PREFIX}_",
+        ).order_by("id").first()
+
+    def client_for(self, scenario):
+        """A test client logged in as a user with the scenario's role."""
+        client = Client(raise_request_exception=False)
+        if scenario.role:
+            user = self.user_for(scenario)
+            if user is None:
+                return None
+            client.force_login(user)
+        return client
+
+    def url_for(self, scenario):
+        """URL of the next request, picking a random article if needed."""
+        if scenario.needs_article:
+            return reverse(
+                scenario.url_name,
+                args=[self.random.choice(self.article_ids)],
+            )
+        return reverse(scenario.url_name)
+
+    def request(self, client, scenario):
+        """Issue one request; return ``(seconds, queries, status)``."""
+        recorder = QueryRecorder()
+        url = self.url_for(scenario)
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for database in connections.all():
+                stack.enter_context(database.execute_wrapper(recorder))
+            response = client.get(url)
+        return (
+            time.perf_counter() - started,
+            recorder.count,
+            response.status_code,
+        )
+
+    def run_scenario(self, scenario):
+        """Benchmark one scenario and return its summary."""
+        client = self.client_for(scenario)
+        if client is None:
+            return {"skipped": f"no synthetic {scenario.role} user"}
+        if scenario.needs_article and not self.article_ids:
+            return {"skipped": "no approved articles"}
+
+        for _ in range(self.warmup):
+            self.request(client, scenario)
+
+        latencies, queries, statuses = [], [], Counter()
+        for _ in range(self.iterations):
+            seconds, count, status = self.request(client, scenario)
+            latencies.append(seconds * 1000)
+            queries.append(count)
+            statuses[str(status)] += 1
+
+        tracemalloc.start()
+        try:
+            for _ in range(self.memory_samples):
+                self.request(client, scenario)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "requests": self.iterations,
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "mean_ms": round(sum(latencies) / len(latencies), 3),
+            "queries_per_request": round(sum(queries) / len(queries), 2),
+            "max_queries": max(queries),
+            "peak_memory_kib": round(peak / 1024, 1),
+            "status_codes": dict(statuses),
+        }
+
+    def run(self, names=None):
+        """Run the selected scenarios (all by default); return a report."""
+        scenarios = [
+            scenario for scenario in SCENARIOS
+            if not names or scenario.name in names
+        ]
+        return {
+            "meta": {
+                "commit": git_commit(),
+                "started_at": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "iterations": self.iterations,
+                "articles": Article.objects.count(),
+                "users": CustomUser.objects.count(),
+            },
+            "scenarios": {
+                scenario.name: self.run_scenario(scenario)
+                for scenario in scenarios
+            },
+        }
+
+
+def compare(baseline, current, metric="p95_ms"):
+    """Yield ``(scenario, before, after, change %)`` for ``metric``."""
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name, {}).get(metric)
+        after = result.get(metric)
+        if before is None or after is None:
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        yield name, before, after, change
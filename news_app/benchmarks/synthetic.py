@@ -0,0 +1,186 @@
+"""
+Deterministic synthetic data for benchmarks.
+
+Everything is generated from one random seed and written with bulk
+inserts, so the same arguments always produce the same dataset. Synthetic
+users and publishing houses share a name prefix and can be removed again
+with ``clear``.
+"""
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from ..imports import ArticleImporter
+from ..models import (
+    CustomUser,
+    JournalistSubscription,
+    PublishingHouse,
+    PublishingHouseSubscription,
+)
+
+PREFIX = "synthetic"
+PASSWORD = "synthetic-password"
+
+WORDS = (
+    "election market storm council budget transfer museum harbour vaccine "
+    "festival drought railway senate protest satellite tariff bridge "
+    "orchestra wildfire league startup pension summit verdict airport "
+    "glacier refinery campus parliament tournament reactor housing"
+).split()
+
+
+@dataclass
+class SeedCounts:
+    """How much synthetic data to generate."""
+    publishing_houses: int = 20
+    journalists: int = 200
+    editors: int = 20
+    readers: int = 5000
+    subscriptions: int = 50000
+    articles: int = 20000
+    approved_ratio: float = 0.9
+    days: int = 365
+
+
+def synthetic_exists():
+    """Whether a previous synthetic dataset is still present."""
+    return CustomUser.objects.filter(
+        username__startswith=f"{PREFIX}_"
+    ).exists()
+
+
+def clear():
+    """Delete every synthetic user, article and publishing house."""
+    CustomUser.objects.filter(username__startswith=f"{PREFIX}_").delete()
+    PublishingHouse.objects.filter(name__startswith=f"{PREFIX} ").delete()
+
+
+class SyntheticSeeder:
+    """Generate a synthetic dataset of the given size."""
+
+    def __init__(self, counts, seed=0, batch_size=1000):
+        self.counts = counts
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+        self.password = make_password(PASSWORD)
+        self.now = timezone.now()
+
+    def users(self, role, count, house_ids=()):
+        """Bulk create ``count`` users with ``role``; return their ids."""
+        users = [
+            CustomUser(
+                username=f"{PREFIX}_{role}_{number}",
+                email=f"{PREFIX}_{role}_{number}@example.com",
+                password=self.password,
+                role=role,
+                is_staff=role == "editor",
+                publishing_house_id=(
+                    house_ids[number % len(house_ids)] if house_ids else None
+                ),
+            )
+            for number in range(count)
+        ]
+        CustomUser.objects.bulk_create(users, batch_size=self.batch_size)
+        return list(
+            CustomUser.objects.filter(
+                username__startswith=f"{PREFIX}_{role}_"
+            ).order_by("id").values_list("id", flat=True)
+        )
+
+    def article_rows(self, journalists):
+        """Yield import rows for the synthetic articles."""
+        seconds = self.counts.days * 24 * 60 * 60
+        for number in range(self.counts.articles):
+            username, house = self.random.choice(journalists)
+            words = self.random.choices(WORDS, k=self.random.randint(80, 400))
+            yield {
+                "title": f"{' '.join(words[:6]).capitalize()} {number}",
+                "content": " ".join(words),
+                "journalist": username,
+                "publishing_house": house,
+                "approved": self.random.random() < self.counts.approved_ratio,
+                "created_at": (
+                    self.now - timedelta(
+                        seconds=self.random.randint(0, seconds)
+                    )
+                ).isoformat(),
+            }
+
+    def subscriptions(self, model, field, reader_ids, target_ids, count):
+        """Bulk insert ``count`` distinct reader -> target edges."""
+        per_reader = min(len(target_ids), -(-count // len(reader_ids)))
+        edges = []
+        created = 0
+        for reader_id in reader_ids:
+            remaining = count - created - len(edges)
+            if remaining <= 0:
+                break
+            edges.extend(
+                model(reader_id=reader_id, **{field: target_id})
+                for target_id in self.random.sample(
+                    target_ids, min(per_reader, remaining)
+                )
+            )
+            if len(edges) >= self.batch_size:
+                model.objects.bulk_create(edges, ignore_conflicts=True)
+                created += len(edges)
+                edges = []
+        model.objects.bulk_create(edges, ignore_conflicts=True)
+        return created + len(edges)
+
+    def seed(self):
+        """Create the dataset; return ``{kind: rows created}``."""
+        counts = self.counts
+        with transaction.atomic():
+            PublishingHouse.objects.bulk_create([
+                PublishingHouse(name=f"{PREFIX} House {number}")
+                for number in range(counts.publishing_houses)
+            ])
+            houses = list(
+                PublishingHouse.objects.filter(
+                    name__startswith=f"{PREFIX} "
+                ).order_by("id").values_list("id", "name")
+            )
+            house_ids = [house_id for house_id, _ in houses]
+            journalist_ids = self.users(
+                "journalist", counts.journalists, house_ids
+            )
+            self.users("editor", counts.editors, house_ids)
+            reader_ids = self.users("reader", counts.readers)
+
+            # Half the edges follow journalists, half publishing houses.
+            subscriptions = 0
+            if reader_ids:
+                subscriptions += self.subscriptions(
+                    JournalistSubscription, "journalist_id", reader_ids,
+                    journalist_ids,
+                    counts.subscriptions - counts.subscriptions // 2,
+                )
+                subscriptions += self.subscriptions(
+                    PublishingHouseSubscription, "publishing_house_id",
+                    reader_ids, house_ids,
+                    counts.subscriptions // 2,
+                )
+
+        journalists = [
+            (
+                f"{PREFIX}_journalist_{number}",
+                houses[number % len(houses)][1] if houses else None,
+            )
+            for number in range(counts.journalists)
+        ]
+        report = ArticleImporter(batch_size=self.batch_size).import_rows(
+            self.article_rows(journalists) if journalists else []
+        )
+        return {
+            "publishing_houses": len(houses),
+            "journalists": len(journalist_ids),
+            "editors": counts.editors,
+            "readers": len(reader_ids),
+            "subscriptions": subscriptions,
+            "articles": report.created,
+        }
@@ -0,0 +1,233 @@
+"""
+Server-side caching of public article pages, API payloads and rendered
+article fragments.
+
+Cache keys embed version counters for the article list, each article and
+each publishing house. Saving or deleting an article, or renaming a
+house, bumps the relevant counters (see ``signals.py``), so stale
+entries are simply never read again and expire on their own. An
+article's own counter also keys its template fragments. Other processes
+only see a bump through a shared cache, which is why production
+defaults to ``CACHE_BACKEND=redis``.
+"""
+import hashlib
+from functools import wraps
+from inspect import iscoroutinefunction
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+LIST_VERSION_KEY = "version:article_list"
+# Bumped when an article is scheduled; wakes run_publish_scheduler.
+SCHEDULE_VERSION_KEY = "version:publish_schedule"
+HITS_KEY = "stats:page_cache:hits"
+MISSES_KEY = "stats:page_cache:misses"
+
+# Per-article template fragments, see render_article_fragments().
+FRAGMENT_TEMPLATES = {
+    "card": "news_app/_article_card.html",
+    "body": "news_app/_article_body.html",
+}
+
+
+def article_version_key(article_id):
+    """Cache key of an article's version counter."""
+    return f"version:article:{article_id}"
+
+
+def house_version_key(house_id):
+    """Cache key of a publishing house's version counter."""
+    return f"version:publishing_house:{house_id}"
+
+
+def _increment(key):
+    """Atomically increment a counter, creating it if it is missing."""
+    cache.add(key, 0, timeout=None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr(); start again from one.
+        cache.set(key, 1, timeout=None)
+        return 1
+
+
+def get_versions(keys):
+    """Return ``{key: version}`` for version counters, defaulting to 1."""
+    found = cache.get_many(keys)
+    return {key: found.get(key, 1) for key in keys}
+
+
+def bump_versions(articles):
+    """Invalidate every cached page and payload showing ``articles``."""
+    _increment(LIST_VERSION_KEY)
+    for article in articles:
+        _increment(article_version_key(article.id))
+
+
+def bump_schedule_version():
+    """Tell a sleeping publish scheduler that publish times changed."""
+    _increment(SCHEDULE_VERSION_KEY)
+
+
+def bump_house_version(house):
+    """Invalidate cached pages and payloads naming a publishing house."""
+    _increment(LIST_VERSION_KEY)
+    _increment(house_version_key(house.id))
+
+
+def record_lookup(hit):
+    """Count a page cache hit or miss."""
+    _increment(HITS_KEY if hit else MISSES_KEY)
+
+
+def stats():
+    """Page cache hit/miss counters since the cache was last cleared."""
+    counters = cache.get_many([HITS_KEY, MISSES_KEY])
+    return {
+        "hits": counters.get(HITS_KEY, 0),
+        "misses": counters.get(MISSES_KEY, 0),
+    }
+
+
+def list_page_key(request):
+    """Cache key for one page of ``article_list``."""
+    query = hashlib.md5(
+        request.GET.urlencode().encode(), usedforsecurity=False
+    ).hexdigest()
+    version = get_versions([LIST_VERSION_KEY])[LIST_VERSION_KEY]
+    return f"page:article_list:{version}:{query}"
+
+
+def detail_page_key(request, article_id):
+    """Cache key for ``article_detail`` of one article."""
+    key = article_version_key(article_id)
+    return f"page:article_detail:{article_id}:{get_versions([key])[key]}"
+
+
+def cache_public_page(key_func):
+    """Serve anonymous GETs of a view from the cache.
+
+    ``key_func`` receives the view's arguments and returns a key that
+    already includes the relevant version counters. Only successful
+    responses are stored. Works on sync and async views; for async views
+    the cache is read and written in a thread, off the event loop.
+    """
+    def lookup(request, *args, **kwargs):
+        key = key_func(request, *args, **kwargs)
+        cached = cache.get(key)
+        record_lookup(cached is not None)
+        if cached is not None:
+            content, content_type = cached
+            return key, HttpResponse(content, content_type=content_type)
+        return key, None
+
+    def store(key, response):
+        if response.status_code == 200 and not response.streaming:
+            cache.set(
+                key,
+                (response.content, response["Content-Type"]),
+                settings.PAGE_CACHE_SECONDS,
+            )
+        return response
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request, *args, **kwargs):
+                user = await request.auser()
+                if request.method != "GET" or user.is_authenticated:
+                    return await view(request, *args, **kwargs)
+                key, response = await sync_to_async(lookup)(
+                    request, *args, **kwargs
+                )
+                if response is not None:
+                    return response
+                return await sync_to_async(store)(
+                    key, await view(request, *args, **kwargs)
+                )
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != "GET" or request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+            key, response = lookup(request, *args, **kwargs)
+            if response is not None:
+                return response
+            return store(key, view(request, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def serialize_articles(articles, serializer_class):
+    """Serialize ``articles`` reusing cached payloads.
+
+    Payloads are keyed by the article's and its publishing house's
+    versions, so either changing invalidates them.
+    """
+    keys_per_article = [
+        (
+            article_version_key(article.id),
+            house_version_key(article.publishing_house_id),
+        )
+        for article in articles
+    ]
+    versions = get_versions(
+        [key for keys in keys_per_article for key in keys]
+    )
+    payload_keys = [
+        f"api:article:{article.id}:{versions[article_key]}:"
+        f"{versions[house_key]}"
+        for article, (article_key, house_key)
+        in zip(articles, keys_per_article)
+    ]
+    cached = cache.get_many(payload_keys)
+
+    missing = {
+        key: article
+        for key, article in zip(payload_keys, articles)
+        if key not in cached
+    }
+    if missing:
+        fresh = serializer_class(list(missing.values()), many=True).data
+        fresh = dict(zip(missing.keys(), fresh))
+        cache.set_many(fresh, settings.PAGE_CACHE_SECONDS)
+        cached.update(fresh)
+
+    return [cached[key] for key in payload_keys]
+
+
+def render_article_fragments(name, articles):
+    """Render the ``name`` fragment of each article, reusing cached HTML.
+
+    Fragments are keyed by article id and version, so one rendering is
+    shared by every page showing the article. A page costs two cache
+    round trips; only missing fragments are rendered.
+    """
+    version_keys = [article_version_key(article.id) for article in articles]
+    versions = get_versions(version_keys)
+    fragment_keys = [
+        f"fragment:{name}:{article.id}:{versions[version_key]}"
+        for article, version_key in zip(articles, version_keys)
+    ]
+    cached = cache.get_many(fragment_keys)
+
+    missing = [
+        (key, article)
+        for key, article in zip(fragment_keys, articles)
+        if key not in cached
+    ]
+    if missing:
+        template = get_template(FRAGMENT_TEMPLATES[name])
+        fresh = {
+            key: template.render({"article": article})
+            for key, article in missing
+        }
+        cache.set_many(fresh, settings.PAGE_CACHE_SECONDS)
+        cached.update(fresh)
+
+    return [mark_safe(cached[key]) for key in fragment_keys]
@@ -0,0 +1,56 @@
+"""
+Aggregates shown on the journalist dashboard.
+
+Both are computed by the database over the ``(journalist, created_at)``
+index, so the dashboard costs the same few queries however many articles
+the journalist has written.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import Article
+
+
+def status_counts(journalist):
+    """Total, approved, pending and rejected article counts, one query."""
+    # Aggregate aliases may not shadow the fields the filters refer to.
+    counts = Article.objects.filter(journalist=journalist).aggregate(
+        total_count=Count("id"),
+        approved_count=Count("id", filter=Q(approved=True)),
+        pending_count=Count("id", filter=Q(approved=False, rejected=False)),
+        rejected_count=Count("id", filter=Q(approved=False, rejected=True)),
+    )
+    return {
+        name.removesuffix("_count"): value for name, value in counts.items()
+    }
+
+
+def month_starts(count, now=None):
+    """The first instants of the last ``count`` months, newest first."""
+    month = timezone.localtime(now).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    starts = []
+    for _ in range(count):
+        starts.append(month)
+        month = (month - timedelta(days=1)).replace(day=1)
+    return starts
+
+
+def monthly_output(journalist, months=None):
+    """``[(month, articles written), ...]`` for recent months, newest
+    first, including months without articles. One query."""
+    starts = month_starts(months or settings.DASHBOARD_MONTHS)
+    counts = {
+        row["month"].date(): row["count"]
+        for row in Article.objects.filter(
+            journalist=journalist, created_at__gte=starts[-1]
+        ).annotate(
+            month=TruncMonth("created_at")
+        ).values("month").annotate(count=Count("id")).order_by()
+    }
+    return [(start.date(), counts.get(start.date(), 0)) for start in starts]
@@ -0,0 +1,19 @@
+"""
+MySQL/MariaDB backend with pooled connections.
+
+Set ``ENGINE`` to ``news_app.db_backends.mysql`` and pool options in
+``OPTIONS["pool"]`` (see ``news_app.pool.DEFAULTS``); everything else is
+Django's MySQL backend.
+"""
+from django.db.backends.mysql import base
+
+from news_app.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    """Django's MySQL ``DatabaseWrapper`` drawing from a shared pool."""
+
+    @staticmethod
+    def ping(connection):
+        # mysqlclient's ping() is a protocol round trip, no query parsing.
+        connection.ping()
@@ -0,0 +1,226 @@
+"""
+Materialised (fan-out-on-write) reader feeds.
+
+With ``FEED_MODE = "write"`` every approved article is copied into a
+``FeedEntry`` row per subscribed reader by the notification worker, so a
+reader's feed is one indexed range scan instead of an OR across two
+subscription subqueries. Publishing houses with more than
+``FEED_FANOUT_MAX_FOLLOWERS`` followers are not fanned out; their articles
+are merged into the feed at read time instead.
+
+Entries stay in sync with subscriptions (``signals.py``): following adds
+the target's most recent articles, unfollowing removes articles the
+reader no longer follows in any way. Articles that stop being public are
+filtered out when the feed is read.
+"""
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from .api.serializers import ArticleListSerializer
+from .models import (
+    PUBLISHED,
+    Article,
+    FeedEntry,
+    JournalistSubscription,
+    PublishingHouse,
+    PublishingHouseSubscription,
+)
+from .pagination import (
+    NEXT,
+    PREVIOUS,
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+    paginate_articles,
+)
+from .subscriptions import subscribed_readers, subscription_ids
+
+LARGE_HOUSES_CACHE_KEY = "feeds:large_publishing_houses"
+
+
+def feed_mode_enabled():
+    """Whether approvals are fanned out into materialised feeds."""
+    return settings.FEED_MODE == "write"
+
+
+def large_publishing_house_ids():
+    """Ids of houses whose articles are merged at read time.
+
+    The follower counts are a GROUP BY over all subscriptions, so the
+    result is cached briefly.
+    """
+    house_ids = cache.get(LARGE_HOUSES_CACHE_KEY)
+    if house_ids is None:
+        house_ids = set(
+            PublishingHouse.objects.annotate(
+                followers=Count("subscribers")
+            ).filter(
+                followers__gt=settings.FEED_FANOUT_MAX_FOLLOWERS
+            ).values_list("id", flat=True)
+        )
+        cache.set(LARGE_HOUSES_CACHE_KEY, house_ids,
+                  settings.FEED_LARGE_HOUSES_CACHE_SECONDS)
+    return house_ids
+
+
+def fan_out_article(article):
+    """Insert the article into its subscribers' feeds in batches.
+
+    Followers of a large publishing house are skipped; they receive the
+    article through the read-time merge in ``reader_feed_page``.
+    """
+    readers = subscribed_readers(
+        article,
+        include_house=(
+            article.publishing_house_id not in large_publishing_house_ids()
+        ),
+    )
+    reader_ids = readers.values_list("id", flat=True).iterator(
+        chunk_size=settings.FEED_FANOUT_BATCH_SIZE
+    )
+    while True:
+        batch = list(islice(reader_ids, settings.FEED_FANOUT_BATCH_SIZE))
+        if not batch:
+            return
+        FeedEntry.objects.bulk_create(
+            [
+                FeedEntry(
+                    reader_id=reader_id,
+                    article=article,
+                    created_at=article.created_at,
+                )
+                for reader_id in batch
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def backfill_feeds(reader_ids, field, target_ids):
+    """Add the latest articles of newly followed targets to feeds.
+
+    ``field`` is the article field the targets are matched on
+    (``journalist_id`` or ``publishing_house_id``); at most
+    ``FEED_BACKFILL_ARTICLES`` articles are added.
+    """
+    if not feed_mode_enabled():
+        return
+    target_ids = set(target_ids)
+    if field == "publishing_house_id":
+        target_ids -= large_publishing_house_ids()
+    if not target_ids:
+        return
+    articles = list(
+        Article.objects.filter(
+            PUBLISHED, **{f"{field}__in": target_ids}
+        ).order_by("-created_at", "-id").values_list(
+            "id", "created_at"
+        )[:settings.FEED_BACKFILL_ARTICLES]
+    )
+    FeedEntry.objects.bulk_create(
+        [
+            FeedEntry(
+                reader_id=reader_id,
+                article_id=article_id,
+                created_at=created_at,
+            )
+            for reader_id in reader_ids
+            for article_id, created_at in articles
+        ],
+        batch_size=settings.FEED_FANOUT_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def prune_feeds(reader_ids, field, target_ids):
+    """Remove articles of unfollowed targets from the readers' feeds,
+    keeping those the reader still follows through the other relation."""
+    for reader_id in reader_ids:
+        FeedEntry.objects.filter(
+            reader_id=reader_id, **{f"article__{field}__in": target_ids}
+        ).exclude(
+            article__journalist_id__in=JournalistSubscription.objects.filter(
+                reader_id=reader_id
+            ).values("journalist_id")
+        ).exclude(
+            article__publishing_house_id__in=(
+                PublishingHouseSubscription.objects.filter(
+                    reader_id=reader_id
+                ).values("publishing_house_id")
+            )
+        ).delete()
+
+
+def _merge_pages(first, second, page_size, direction):
+    """Combine two newest-first keyset pages of the same cursor."""
+    by_id = {article.id: article for article in first.items + second.items}
+    merged = sorted(
+        by_id.values(),
+        key=lambda article: (article.created_at, article.id),
+        reverse=True,
+    )
+    overflow = len(merged) > page_size
+
+    if direction == NEXT:
+        items = merged[:page_size]
+        has_older = overflow or bool(first.next_cursor or second.next_cursor)
+        has_newer = bool(first.prev_cursor or second.prev_cursor)
+    else:
+        items = merged[-page_size:]
+        has_older = bool(first.next_cursor or second.next_cursor)
+        has_newer = overflow or bool(first.prev_cursor or second.prev_cursor)
+
+    if not items:
+        return KeysetPage(items=items)
+    return KeysetPage(
+        items=items,
+        next_cursor=encode_cursor(
+            items[-1].created_at, items[-1].id, NEXT
+        ) if has_older else None,
+        prev_cursor=encode_cursor(
+            items[0].created_at, items[0].id, PREVIOUS
+        ) if has_newer else None,
+    )
+
+
+def reader_feed_page(reader, cursor=None, page_size=None):
+    """Return one page of a reader's materialised feed as articles.
+
+    Raises ``InvalidCursor`` when the cursor is malformed.
+    """
+    page_size = page_size or settings.ARTICLES_PAGE_SIZE
+    # Entries outlive unapproval and re-embargo; skip those articles.
+    entries = ArticleListSerializer.optimize_queryset(
+        FeedEntry.objects.filter(
+            reader=reader,
+            article__approved=True,
+            article__publish_at__isnull=True,
+        ),
+        prefix="article__",
+    )
+    stored = paginate_articles(
+        entries, cursor, page_size, id_field="article_id"
+    )
+    stored.items = [entry.article for entry in stored.items]
+
+    large_house_ids = large_publishing_house_ids()
+    if not large_house_ids:
+        return stored
+    pulled_house_ids = large_house_ids.intersection(
+        subscription_ids(reader).publishing_houses
+    )
+    if not pulled_house_ids:
+        return stored
+
+    pulled = paginate_articles(
+        ArticleListSerializer.optimize_queryset(Article.objects.filter(
+            PUBLISHED,
+            publishing_house_id__in=pulled_house_ids
+        )),
+        cursor,
+        page_size,
+    )
+    direction = decode_cursor(cursor)[2] if cursor else NEXT
+    return _merge_pages(stored, pulled, page_size, direction)
@@ -51,5 +51,5 @@ class ArticleForm(forms.ModelForm):
     class Meta:
         """Meta class for ArticleForm."""
         model = Article
-        fields = ["title", "content", "publishing_house"]
+        fields = ["title", "content", "publishing_house", "publish_at"]
 
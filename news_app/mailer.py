@@ -0,0 +1,159 @@
+"""
+Bulk email delivery for subscriber fan-out.
+
+Recipients are streamed from the database in chunks and every reader gets
+an individually addressed message, all sent over one reused connection.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchReport:
+    """Outcome of sending one chunk of messages."""
+    number: int
+    sent: int
+    seconds: float
+    failed_emails: list = field(default_factory=list)
+
+    @property
+    def failed(self):
+        """Messages the mail backend rejected."""
+        return len(self.failed_emails)
+
+    @property
+    def rate(self):
+        """Messages per second for this batch."""
+        return self.sent / self.seconds if self.seconds else float(self.sent)
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome of a whole bulk delivery."""
+    batches: list = field(default_factory=list)
+
+    @property
+    def sent(self):
+        """Total messages accepted by the mail backend."""
+        return sum(batch.sent for batch in self.batches)
+
+    @property
+    def failed(self):
+        """Total messages the mail backend rejected."""
+        return sum(batch.failed for batch in self.batches)
+
+    @property
+    def failed_emails(self):
+        """Addresses whose message was rejected, for a later retry."""
+        return [
+            email for batch in self.batches for email in batch.failed_emails
+        ]
+
+    @property
+    def seconds(self):
+        """Wall-clock time spent sending."""
+        return sum(batch.seconds for batch in self.batches)
+
+    @property
+    def rate(self):
+        """Overall messages per second."""
+        return self.sent / self.seconds if self.seconds else float(self.sent)
+
+
+def iter_chunks(items, chunk_size):
+    """Yield lists of up to ``chunk_size`` items from any iterable."""
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BulkMailer:
+    """Send many individually addressed messages over one connection.
+
+    ``send`` mails the same subject and body to every recipient;
+    ``deliver`` sends pre-built ``(email, subject, body)`` messages such
+    as per-reader digests.
+    """
+
+    def __init__(self, subject="", body="", from_email=None,
+                 chunk_size=None, connection=None):
+        self.subject = subject
+        self.body = body
+        self.from_email = from_email or settings.DEFAULT_FROM_EMAIL
+        self.chunk_size = (
+            chunk_size or settings.NOTIFICATION_EMAIL_CHUNK_SIZE
+        )
+        self.connection = connection or get_connection()
+
+    def _message(self, email, subject, body):
+        return EmailMessage(
+            subject=subject,
+            body=body,
+            from_email=self.from_email,
+            to=[email],
+            connection=self.connection,
+        )
+
+    def send_batch(self, number, messages):
+        """Send one chunk over the open connection and report on it."""
+        started = time.perf_counter()
+        sent = 0
+        failed_emails = []
+        for email, subject, body in messages:
+            try:
+                sent += self.connection.send_messages(
+                    [self._message(email, subject, body)]
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to email %s", email)
+                failed_emails.append(email)
+
+        report = BatchReport(
+            number=number,
+            sent=sent,
+            seconds=time.perf_counter() - started,
+            failed_emails=failed_emails,
+        )
+        logger.info(
+            "Mail batch %s: %s sent, %s failed, %.1f msg/s",
+            report.number, report.sent, report.failed, report.rate,
+        )
+        return report
+
+    def deliver(self, messages):
+        """Send ``(email, subject, body)`` tuples in chunks; return report."""
+        report = DeliveryReport()
+        self.connection.open()
+        try:
+            for number, chunk in enumerate(
+                iter_chunks(messages, self.chunk_size), start=1
+            ):
+                report.batches.append(self.send_batch(number, chunk))
+        finally:
+            self.connection.close()
+
+        logger.info(
+            "Bulk mail finished: %s sent, %s failed in %s batch(es), "
+            "%.1f msg/s",
+            report.sent, report.failed, len(report.batches), report.rate,
+        )
+        return report
+
+    def send(self, recipients):
+        """Deliver to every user in ``recipients`` and return the report."""
+        emails = recipients.exclude(
+            email=""
+        ).values_list("email", flat=True).iterator(chunk_size=self.chunk_size)
+        return self.deliver(
+            (email, self.subject, self.body) for email in emails
+        )
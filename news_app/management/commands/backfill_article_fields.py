@@ -0,0 +1,60 @@
+"""Fill in content-derived article fields for existing rows."""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from news_app.models import Article, derived_fields
+
+
+class Command(BaseCommand):
+    """Compute excerpt, word count, reading time and body HTML in batches."""
+    help = (
+        "Store the excerpt, word count, reading time and rendered body of "
+        "articles saved before those fields existed. Walks the table by "
+        "id in batches, one bulk UPDATE per batch; safe to re-run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.IMPORT_BATCH_SIZE,
+            help="Articles per batch and transaction.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every article, not only unfilled ones.",
+        )
+
+    def handle(self, *args, **options):
+        fields = list(derived_fields(""))
+        queryset = Article.objects.only("id", "content").order_by("id")
+        if not options["all"]:
+            queryset = queryset.filter(body_html="").exclude(content="")
+
+        started = time.monotonic()
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(
+                queryset.filter(id__gt=last_id)[:options["batch_size"]]
+            )
+            if not batch:
+                break
+            for article in batch:
+                for name, value in derived_fields(article.content).items():
+                    setattr(article, name, value)
+            with transaction.atomic():
+                Article.objects.bulk_update(batch, fields)
+            updated += len(batch)
+            last_id = batch[-1].id
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{updated} article(s) up to id {last_id}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfilled {updated} article(s) in "
+            f"{time.monotonic() - started:.1f}s."
+        ))
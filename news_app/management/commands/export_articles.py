@@ -0,0 +1,79 @@
+"""Stream the article archive to a file or stdout."""
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news_app.exports import FORMATS, ArticleExport, parse_since
+
+
+class Command(BaseCommand):
+    """Export articles as NDJSON or CSV with constant memory."""
+    help = "Export articles as NDJSON or CSV, optionally gzip-compressed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=sorted(FORMATS),
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write to (defaults to stdout).",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only export articles changed at or after this ISO "
+                 "datetime (the updated_at of the last export).",
+        )
+        parser.add_argument(
+            "--after-id",
+            type=int,
+            default=0,
+            help="With --since, skip articles at that exact time with an "
+                 "id up to this one (the id of the last export).",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Compress the output with gzip.",
+        )
+        parser.add_argument(
+            "--include-pending",
+            action="store_true",
+            help="Also export articles that are not approved or still "
+                 "embargoed.",
+        )
+        parser.add_argument("--chunk-size", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            since = parse_since(options["since"]) if options["since"] else None
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        export = ArticleExport(
+            since=since,
+            after_id=options["after_id"],
+            approved_only=not options["include_pending"],
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["output"]:
+            output = open(options["output"], "wb")
+        else:
+            output = sys.stdout.buffer
+        try:
+            for chunk in export.chunks(options["format"], options["gzip"]):
+                output.write(chunk)
+        finally:
+            if options["output"]:
+                output.close()
+            else:
+                output.flush()
+
+        if export.last_key:
+            updated_at, pk = export.last_key
+            self.stderr.write(
+                "Resume with: "
+                f"--since {updated_at.isoformat()} --after-id {pk}"
+            )
@@ -0,0 +1,62 @@
+"""Bulk import articles from a JSONL or CSV file."""
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from news_app.imports import ArticleImporter, read_rows
+
+
+class Command(BaseCommand):
+    """Import a back catalogue of articles without per-row side effects."""
+    help = (
+        "Import articles from JSONL or CSV with batched bulk inserts. "
+        "Columns: title, content, journalist (username), publishing_house "
+        "(name), approved, created_at."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSONL or CSV file to import.")
+        parser.add_argument(
+            "--format",
+            choices=["jsonl", "csv"],
+            help="Input format (guessed from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows per bulk insert and transaction.",
+        )
+        parser.add_argument(
+            "--create-houses",
+            action="store_true",
+            help="Create publishing houses that do not exist yet.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Checkpoint name (defaults to the file's absolute path).",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the rows committed by a previous run.",
+        )
+
+    def handle(self, *args, **options):
+        importer = ArticleImporter(
+            batch_size=options["batch_size"],
+            create_houses=options["create_houses"],
+            checkpoint=(
+                options["checkpoint"] or os.path.abspath(options["path"])
+            ),
+        )
+        try:
+            rows = read_rows(options["path"], options["format"])
+            report = importer.import_rows(rows, resume=options["resume"])
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report.created} article(s), skipped "
+            f"{report.skipped}, {report.read} row(s) read in "
+            f"{report.seconds:.1f}s ({report.rate:.0f} rows/s)."
+        ))
@@ -0,0 +1,86 @@
+"""Benchmark the hot views against the current database."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from news_app.benchmarks.runner import SCENARIOS, BenchmarkRunner, compare
+
+
+class Command(BaseCommand):
+    """Report latency percentiles, queries and peak memory as JSON."""
+    help = (
+        "Drive the hot views through the test client and report p50/p95/"
+        "p99 latency, queries per request and peak memory. Seed data with "
+        "seed_synthetic first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=[scenario.name for scenario in SCENARIOS],
+            help="Scenario to run (repeatable; default: all).",
+        )
+        parser.add_argument("--iterations", type=int, default=100,
+                            help="Measured requests per scenario.")
+        parser.add_argument("--warmup", type=int, default=5,
+                            help="Unmeasured requests per scenario.")
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Random seed for picking articles.")
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Run with a dummy cache to measure uncached views.",
+        )
+        parser.add_argument("--output",
+                            help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--compare",
+            help="Earlier JSON report to print p95 changes against.",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["compare"]:
+            try:
+                with open(options["compare"], encoding="utf-8") as report:
+                    baseline = json.load(report)
+            except (OSError, ValueError) as exc:
+                raise CommandError(str(exc)) from exc
+
+        overrides = {}
+        if options["no_cache"]:
+            overrides["CACHES"] = {"default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+            }}
+
+        # Allows the test client's host and keeps outgoing mail in memory.
+        setup_test_environment()
+        try:
+            with override_settings(**overrides):
+                report = BenchmarkRunner(
+                    iterations=options["iterations"],
+                    warmup=options["warmup"],
+                    seed=options["seed"],
+                ).run(options["scenario"])
+        finally:
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as target:
+                target.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+        if baseline:
+            for name, before, after, change in compare(baseline, report):
+                self.stderr.write(
+                    f"{name}: p95 {before:.1f}ms -> {after:.1f}ms "
+                    f"({change:+.1f}%)"
+                )
@@ -0,0 +1,80 @@
+"""Compare concurrent throughput of the WSGI and ASGI deployments."""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from news_app.benchmarks.concurrency import (
+    ASYNC_SCENARIOS,
+    ConcurrencyBenchmark,
+)
+
+
+class Command(BaseCommand):
+    """Report requests/s and latency for WSGI threads vs ASGI tasks."""
+    help = (
+        "Run the same requests through the sync views from a thread pool "
+        "and through the async views on one event loop, at several "
+        "concurrency levels. Seed data with seed_synthetic first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            choices=ASYNC_SCENARIOS,
+            default="article_detail",
+            help="View to benchmark.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            action="append",
+            help="Concurrent requests (repeatable; default 1, 8 and 32).",
+        )
+        parser.add_argument("--requests", type=int, default=200,
+                            help="Requests per deployment and level.")
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Run with a dummy cache to measure uncached views.",
+        )
+        parser.add_argument("--output",
+                            help="Write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        overrides = {}
+        if options["no_cache"]:
+            overrides["CACHES"] = {"default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+            }}
+
+        setup_test_environment()
+        try:
+            with override_settings(**overrides):
+                benchmark = ConcurrencyBenchmark(
+                    options["scenario"], requests=options["requests"]
+                )
+                if benchmark.scenario.role and benchmark.user is None:
+                    raise CommandError(
+                        f"No synthetic {benchmark.scenario.role}; run "
+                        "seed_synthetic first."
+                    )
+                report = {
+                    "scenario": options["scenario"],
+                    "levels": benchmark.run(
+                        options["concurrency"] or (1, 8, 32)
+                    ),
+                }
+        finally:
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as target:
+                target.write(output + "\n")
+        else:
+            self.stdout.write(output)
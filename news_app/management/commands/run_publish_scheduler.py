@@ -0,0 +1,81 @@
+"""Take embargoed articles live when their publish time comes."""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+from news_app import scheduling
+
+
+class Command(BaseCommand):
+    """Publish due embargoed articles, sleeping until the next one."""
+    help = (
+        "Publish approved articles whose publish_at has passed and queue "
+        "their notifications. Sleeps until the next scheduled article, or "
+        "until another article is scheduled. Needs a cache shared with the "
+        "web processes (CACHE_BACKEND=redis or file): publishing expires "
+        "their cached pages and scheduling wakes this command through it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PUBLISH_BATCH_SIZE,
+            help="Articles taken live per UPDATE and transaction.",
+        )
+        parser.add_argument(
+            "--max-sleep",
+            type=float,
+            default=settings.PUBLISH_MAX_SLEEP,
+            help="Longest sleep; a safety net in case a wake-up from the "
+                 "cache is missed.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no articles are due instead of sleeping.",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.CACHE_SHARED:
+            raise CommandError(
+                "run_publish_scheduler needs a cache shared with the web "
+                "processes; set CACHE_BACKEND to redis or file."
+            )
+
+        total = 0
+        while True:
+            close_old_connections()
+            published = scheduling.publish_due(options["batch_size"])
+            if published:
+                total += published
+                self.stdout.write(f"Published {published} article(s)")
+            if options["once"]:
+                break
+
+            self.wait(options["max_sleep"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Published {total} scheduled article(s)."
+        ))
+
+    @staticmethod
+    def wait(max_sleep):
+        """Sleep until the next article is due or the schedule changes.
+
+        Only the cached schedule version is read while sleeping; the
+        database is not queried until there is something to do.
+        """
+        version = scheduling.schedule_version()
+        next_at = scheduling.next_publish_time()
+        delay = max_sleep
+        if next_at is not None:
+            delay = min(delay, (next_at - timezone.now()).total_seconds())
+        deadline = time.monotonic() + delay
+        while (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(remaining, settings.PUBLISH_WAKE_CHECK_SECONDS))
+            if scheduling.schedule_version() != version:
+                return
@@ -0,0 +1,82 @@
+"""Generate a reproducible synthetic dataset for benchmarks."""
+from django.core.management.base import BaseCommand, CommandError
+
+from news_app.benchmarks import synthetic
+
+
+class Command(BaseCommand):
+    """Bulk insert synthetic houses, users, subscriptions and articles."""
+    help = (
+        "Create a synthetic dataset with bulk inserts. The same --seed "
+        "always produces the same data."
+    )
+
+    def add_arguments(self, parser):
+        defaults = synthetic.SeedCounts()
+        for name, text in (
+            ("publishing-houses", "Publishing houses to create."),
+            ("journalists", "Journalists, spread over the houses."),
+            ("editors", "Editors, spread over the houses."),
+            ("readers", "Readers to create."),
+            ("subscriptions", "Reader subscription edges in total."),
+            ("articles", "Articles to create."),
+        ):
+            parser.add_argument(
+                f"--{name}",
+                type=int,
+                default=getattr(defaults, name.replace("-", "_")),
+                help=text,
+            )
+        parser.add_argument(
+            "--approved-ratio",
+            type=float,
+            default=defaults.approved_ratio,
+            help="Share of articles that are approved.",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=defaults.days,
+            help="Spread article dates over this many past days.",
+        )
+        parser.add_argument("--seed", type=int, default=0,
+                            help="Random seed.")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Rows per bulk insert.")
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete an existing synthetic dataset first.",
+        )
+
+    def handle(self, *args, **options):
+        if synthetic.synthetic_exists():
+            if not options["clear"]:
+                raise CommandError(
+                    "Synthetic data already exists; pass --clear to "
+                    "replace it."
+                )
+            synthetic.clear()
+
+        seeder = synthetic.SyntheticSeeder(
+            synthetic.SeedCounts(
+                publishing_houses=options["publishing_houses"],
+                journalists=options["journalists"],
+                editors=options["editors"],
+                readers=options["readers"],
+                subscriptions=options["subscriptions"],
+                articles=options["articles"],
+                approved_ratio=options["approved_ratio"],
+                days=options["days"],
+            ),
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+        )
+        created = seeder.seed()
+
+        self.stdout.write(self.style.SUCCESS(
+            "Created " + ", ".join(
+                f"{count} {kind.replace('_', ' ')}"
+                for kind, count in created.items()
+            ) + "."
+        ))
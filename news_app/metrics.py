@@ -0,0 +1,339 @@
+"""
+Per-view request metrics in Prometheus text format.
+
+``MetricsMiddleware`` times every request, counts its DB queries and DB
+time through ``execute_wrapper`` and records the response size, keyed by
+URL name. Values are aggregated in-process; when ``METRICS_DIR`` is set
+each worker process also writes its totals to ``<METRICS_DIR>/<pid>.json``
+and ``/metrics`` sums the files of every process. Connection pool stats
+(``news_app.pool``) are included the same way.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+from . import caching, reviews
+from .pool import COUNTERS, pool_stats
+
+PREFIX = "news"
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that counts queries and their total time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+def _merge(total, other):
+    """Add the numbers in snapshot ``other`` into ``total`` in place."""
+    for key, value in other.items():
+        if isinstance(value, dict):
+            _merge(total.setdefault(key, {}), value)
+        elif isinstance(value, list):
+            current = total.setdefault(key, [0] * len(value))
+            for index, item in enumerate(value):
+                current[index] += item
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+class Registry:
+    """Thread-safe in-process metric store."""
+
+    def __init__(self, buckets):
+        self.buckets = list(buckets)
+        self.lock = threading.Lock()
+        self.data = {}
+        self.last_flush = 0.0
+
+    def observe_request(self, view, status, seconds, queries, db_seconds,
+                        size):
+        """Record one finished request."""
+        bucket = bisect_left(self.buckets, seconds)
+        with self.lock:
+            latency = self.data.setdefault("latency", {}).setdefault(
+                view,
+                {"buckets": [0] * (len(self.buckets) + 1), "sum": 0.0,
+                 "count": 0},
+            )
+            latency["buckets"][bucket] += 1
+            latency["sum"] += seconds
+            latency["count"] += 1
+
+            requests = self.data.setdefault("requests", {})
+            requests[f"{view}\t{status}"] = (
+                requests.get(f"{view}\t{status}", 0) + 1
+            )
+            _merge(self.data, {
+                "db_queries": {view: queries},
+                "db_seconds": {view: db_seconds},
+                "response_bytes": {view: size},
+            })
+
+    def snapshot(self):
+        """A deep copy of the current totals."""
+        with self.lock:
+            return json.loads(json.dumps(self.data))
+
+    def process_totals(self):
+        """This process's request totals plus its connection pool stats."""
+        return {**self.snapshot(), "db_pool": pool_stats()}
+
+    def reset(self):
+        """Forget everything recorded so far (used by tests)."""
+        with self.lock:
+            self.data = {}
+            self.last_flush = 0.0
+
+    def flush(self, force=False):
+        """Write this process's totals to ``METRICS_DIR`` (throttled)."""
+        directory = settings.METRICS_DIR
+        now = time.monotonic()
+        if not directory or (
+                not force and
+                now - self.last_flush < settings.METRICS_FLUSH_SECONDS):
+            return
+        self.last_flush = now
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{os.getpid()}.json")
+        with open(f"{path}.tmp", "w", encoding="utf-8") as snapshot:
+            json.dump(self.process_totals(), snapshot)
+        os.replace(f"{path}.tmp", path)
+
+    def collect(self):
+        """Totals across every process that has written a snapshot."""
+        total = self.process_totals()
+        directory = settings.METRICS_DIR
+        if not directory or not os.path.isdir(directory):
+            return total
+        own = f"{os.getpid()}.json"
+        for name in os.listdir(directory):
+            if not name.endswith(".json") or name == own:
+                continue
+            try:
+                with open(os.path.join(directory, name),
+                          encoding="utf-8") as snapshot:
+                    _merge(total, json.load(snapshot))
+            except (OSError, ValueError):
+                continue
+        return total
+
+
+REGISTRY = Registry(settings.METRICS_LATENCY_BUCKETS)
+atexit.register(REGISTRY.flush, force=True)
+
+
+class MetricsMiddleware:
+    """Record latency, DB queries, DB time and response size per view.
+
+    Works natively in both WSGI and ASGI stacks, so async views are not
+    pushed through a thread by this middleware. Under ASGI the queries
+    run on the request's thread-sensitive worker thread, whose
+    connections are not the event loop's, so the recorder is installed
+    there.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def install(recorder):
+        """Wrap every connection of the calling thread with ``recorder``;
+        closing the returned stack removes the wrappers again."""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        return stack
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with self.install(recorder):
+            response = self.get_response(request)
+        return self.record(request, response, started, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        stack = await sync_to_async(self.install)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.record(request, response, started, recorder)
+
+    @staticmethod
+    def record(request, response, started, recorder):
+        """Add one finished request to the registry."""
+        elapsed = time.perf_counter() - started
+        match = request.resolver_match
+        view = "unresolved"
+        if match:
+            view = match.url_name or match.view_name
+        size = 0 if response.streaming else len(response.content)
+        REGISTRY.observe_request(
+            view, response.status_code, elapsed,
+            recorder.count, recorder.seconds, size,
+        )
+        REGISTRY.flush()
+        return response
+
+
+def _escape(value):
+    """Escape a label value for the text exposition format."""
+    return (
+        str(value).replace("\\", "\\\\").replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def _labels(**labels):
+    pairs = ",".join(
+        f'{key}="{_escape(value)}"' for key, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def render_prometheus(data, page_cache, queues=()):
+    """Render collected totals in the Prometheus text exposition format.
+
+    ``queues`` are review queue rows from ``reviews.queue_stats``; they
+    come straight from the database, so they are not summed per process.
+    """
+    lines = []
+
+    def header(name, kind, text):
+        lines.append(f"# HELP {PREFIX}_{name} {text}")
+        lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+
+    name = "http_request_duration_seconds"
+    header(name, "histogram", "Request latency by URL name.")
+    bounds = [str(bound) for bound in REGISTRY.buckets] + ["+Inf"]
+    for view, latency in sorted(data.get("latency", {}).items()):
+        cumulative = 0
+        for bound, count in zip(bounds, latency["buckets"]):
+            cumulative += count
+            lines.append(
+                f"{PREFIX}_{name}_bucket{_labels(view=view, le=bound)} "
+                f"{cumulative}"
+            )
+        lines.append(
+            f"{PREFIX}_{name}_sum{_labels(view=view)} {latency['sum']}"
+        )
+        lines.append(
+            f"{PREFIX}_{name}_count{_labels(view=view)} {latency['count']}"
+        )
+
+    header("http_requests_total", "counter",
+           "Requests by URL name and status code.")
+    for key, count in sorted(data.get("requests", {}).items()):
+        view, status = key.split("\t")
+        lines.append(
+            f"{PREFIX}_http_requests_total"
+            f"{_labels(view=view, status=status)} {count}"
+        )
+
+    for key, name, kind, text in (
+        ("db_queries", "db_queries_total", "counter",
+         "Database queries by URL name."),
+        ("db_seconds", "db_query_duration_seconds_total", "counter",
+         "Time spent in database queries by URL name."),
+        ("response_bytes", "http_response_size_bytes_total", "counter",
+         "Response body bytes by URL name."),
+    ):
+        header(name, kind, text)
+        for view, value in sorted(data.get(key, {}).items()):
+            lines.append(f"{PREFIX}_{name}{_labels(view=view)} {value}")
+
+    lookups = page_cache["hits"] + page_cache["misses"]
+    header("page_cache_hits_total", "counter", "Page cache hits.")
+    lines.append(f"{PREFIX}_page_cache_hits_total {page_cache['hits']}")
+    header("page_cache_misses_total", "counter", "Page cache misses.")
+    lines.append(f"{PREFIX}_page_cache_misses_total {page_cache['misses']}")
+    header("page_cache_hit_ratio", "gauge", "Page cache hit ratio.")
+    lines.append(
+        f"{PREFIX}_page_cache_hit_ratio "
+        f"{page_cache['hits'] / lookups if lookups else 0.0}"
+    )
+
+    pools = data.get("db_pool", {})
+    header("db_pool_connections", "gauge",
+           "Pooled database connections by alias and state.")
+    for alias, stats in sorted(pools.items()):
+        for state in ("in_use", "idle"):
+            lines.append(
+                f"{PREFIX}_db_pool_connections"
+                f"{_labels(alias=alias, state=state)} {stats[state]}"
+            )
+    header("db_pool_max_size", "gauge", "Pool size limit by alias.")
+    for alias, stats in sorted(pools.items()):
+        lines.append(
+            f"{PREFIX}_db_pool_max_size{_labels(alias=alias)} "
+            f"{stats['max_size']}"
+        )
+    for counter in COUNTERS:
+        name = f"db_pool_{counter}_total"
+        header(name, "counter",
+               f"Pool {counter.replace('_', ' ')} by alias.")
+        for alias, stats in sorted(pools.items()):
+            lines.append(
+                f"{PREFIX}_{name}{_labels(alias=alias)} {stats[counter]}"
+            )
+
+    for key, name, text in (
+        ("depth", "review_queue_depth", "Pending articles by house."),
+        ("claimed", "review_queue_claimed",
+         "Pending articles claimed by an editor, by house."),
+        ("age", "review_queue_oldest_age_seconds",
+         "Age of the oldest pending article by house."),
+    ):
+        header(name, "gauge", text)
+        for queue in queues:
+            house = queue["publishing_house_id"] or "none"
+            lines.append(
+                f"{PREFIX}_{name}{_labels(house=house)} {queue[key]}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """Expose all metrics to Prometheus."""
+    allowed = settings.METRICS_ALLOWED_IPS
+    if allowed and request.META.get("REMOTE_ADDR") not in allowed:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_prometheus(
+            REGISTRY.collect(), caching.stats(), reviews.queue_stats()
+        ),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
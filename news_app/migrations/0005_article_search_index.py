@@ -0,0 +1,44 @@
+# Generated by Django 6.0 on 2026-10-17 23:40
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    """Create the full-text index for the current database vendor."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE news_app_article_fts USING fts5("
+            "title, content, tokenize='porter unicode61')"
+        )
+        schema_editor.execute(
+            "INSERT INTO news_app_article_fts (rowid, title, content) "
+            "SELECT id, title, content FROM news_app_article"
+        )
+    elif vendor == 'mysql':
+        schema_editor.execute(
+            "ALTER TABLE news_app_article "
+            "ADD FULLTEXT INDEX article_fulltext_idx (title, content)"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """Drop the full-text index created by ``create_search_index``."""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE news_app_article_fts")
+    elif vendor == 'mysql':
+        schema_editor.execute(
+            "ALTER TABLE news_app_article DROP INDEX article_fulltext_idx"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0004_feedentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
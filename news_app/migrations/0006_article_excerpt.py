@@ -0,0 +1,35 @@
+# Generated by Django 6.0 on 2026-10-18 00:05
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def fill_excerpts(apps, schema_editor):
+    """Store excerpts for articles written before the field existed."""
+    Article = apps.get_model('news_app', 'Article')
+    batch = []
+    for article in Article.objects.only('id', 'content').iterator(
+            chunk_size=1000):
+        article.excerpt = Truncator(
+            " ".join(article.content.split())).chars(300)
+        batch.append(article)
+        if len(batch) == 1000:
+            Article.objects.bulk_update(batch, ['excerpt'])
+            batch = []
+    Article.objects.bulk_update(batch, ['excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0005_article_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, help_text='Start of the content, kept in sync on save', max_length=300),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-17 22:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0006_article_excerpt'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-17 22:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0007_article_created_at_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='rejected',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='notificationjob',
+            name='payload',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='notificationjob',
+            name='article',
+            field=models.ForeignKey(blank=True, help_text='Empty for jobs covering several articles', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notification_jobs', to='news_app.article'),
+        ),
+        migrations.AlterField(
+            model_name='notificationjob',
+            name='channel',
+            field=models.CharField(choices=[('email', 'Email'), ('x', 'X (Twitter)'), ('feed', 'Reader feeds'), ('email_digest', 'Email digest')], max_length=20),
+        ),
+    ]
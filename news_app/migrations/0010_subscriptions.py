@@ -0,0 +1,59 @@
+# Generated by Django 6.0 on 2026-10-17 23:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0009_article_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JournalistSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('journalist', models.ForeignKey(db_index=False, limit_choices_to={'role': 'journalist'}, on_delete=django.db.models.deletion.CASCADE, related_name='reader_subscriptions', to=settings.AUTH_USER_MODEL)),
+                ('reader', models.ForeignKey(db_index=False, limit_choices_to={'role': 'reader'}, on_delete=django.db.models.deletion.CASCADE, related_name='journalist_subscriptions', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='subscribed_journalists',
+            field=models.ManyToManyField(blank=True, related_name='subscribers', through='news_app.JournalistSubscription', through_fields=('reader', 'journalist'), to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='PublishingHouseSubscription',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('publishing_house', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='subscriptions', to='news_app.publishinghouse')),
+                ('reader', models.ForeignKey(db_index=False, limit_choices_to={'role': 'reader'}, on_delete=django.db.models.deletion.CASCADE, related_name='publishing_house_subscriptions', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='subscribed_publishing_houses',
+            field=models.ManyToManyField(blank=True, related_name='subscribers', through='news_app.PublishingHouseSubscription', to='news_app.publishinghouse'),
+        ),
+        migrations.AddIndex(
+            model_name='journalistsubscription',
+            index=models.Index(fields=['journalist', 'reader'], name='journalist_subscribers_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='journalistsubscription',
+            constraint=models.UniqueConstraint(fields=('reader', 'journalist'), name='unique_journalist_subscription'),
+        ),
+        migrations.AddIndex(
+            model_name='publishinghousesubscription',
+            index=models.Index(fields=['publishing_house', 'reader'], name='house_subscribers_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='publishinghousesubscription',
+            constraint=models.UniqueConstraint(fields=('reader', 'publishing_house'), name='unique_publishing_house_subscription'),
+        ),
+    ]
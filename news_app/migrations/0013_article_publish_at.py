@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-17 23:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0012_article_review_claims'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, help_text='Hold the article back until this time', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publish_at'], name='article_publish_at_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-17 23:51
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def start_from_created_at(apps, schema_editor):
+    """Existing articles count as last changed when they were created, so
+    exports resuming from a created_at cursor do not start over."""
+    Article = apps.get_model('news_app', 'Article')
+    Article.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0013_article_publish_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(start_from_created_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['updated_at', 'id'], name='article_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-18 00:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0015_importcheckpoint'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='article_publish_at_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('publish_at__isnull', False)), fields=['publish_at'], name='article_publish_at_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-18 00:27
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0016_article_publish_at_idx_partial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='journalist',
+            field=models.ForeignKey(db_index=False, limit_choices_to={'role': 'journalist'}, on_delete=django.db.models.deletion.CASCADE, related_name='articles', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='publishing_house',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='articles', to='news_app.publishinghouse'),
+        ),
+    ]
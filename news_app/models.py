@@ -1,8 +1,40 @@
 """Models for the news application, including 
 custom user roles and articles."""
+import math
+
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
+from django.utils.html import linebreaks
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+
+
+# Articles readers may see: approved and not (or no longer) embargoed.
+PUBLISHED = models.Q(approved=True, publish_at__isnull=True)
+
+
+def build_excerpt(content):
+    """Plain-text teaser stored alongside an article's full content."""
+    return Truncator(" ".join(content.split())).chars(EXCERPT_LENGTH)
+
+
+def derived_fields(content):
+    """Values stored with an article that are computed from its content.
+
+    ``body_html`` is the escaped content split into paragraphs, ready to
+    be output as is by the detail page.
+    """
+    words = len(content.split())
+    return {
+        "excerpt": build_excerpt(content),
+        "word_count": words,
+        "reading_minutes": math.ceil(words / WORDS_PER_MINUTE),
+        "body_html": linebreaks(content, autoescape=True),
+    }
 
 
 class PublishingHouse(models.Model):
@@ -37,19 +69,137 @@ class CustomUser(AbstractUser):
         help_text="Required for editors and journalists only"
     )
 
+    subscribed_publishing_houses = models.ManyToManyField(
+        PublishingHouse,
+        through="PublishingHouseSubscription",
+        related_name="subscribers",
+        blank=True
+    )
+    subscribed_journalists = models.ManyToManyField(
+        "self",
+        through="JournalistSubscription",
+        through_fields=("reader", "journalist"),
+        symmetrical=False,
+        related_name="subscribers",
+        blank=True
+    )
+
     def __str__(self):
         return str(self.username)
 
+    def get_session_auth_hash(self):
+        """Use the hash cached by ``CachedModelBackend`` when the password
+        was not loaded, so verifying the session needs no query."""
+        if "password" not in self.__dict__ and hasattr(
+                self, "cached_session_auth_hash"):
+            return self.cached_session_auth_hash
+        return super().get_session_auth_hash()
+
+
+class PublishingHouseSubscription(models.Model):
+    """A reader following a publishing house.
+
+    The unique constraint serves "houses of a reader"; the reverse index
+    serves "readers of a house" when an article is approved.
+    """
+    reader = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        db_index=False,
+        limit_choices_to={"role": "reader"},
+        related_name="publishing_house_subscriptions"
+    )
+    publishing_house = models.ForeignKey(
+        PublishingHouse,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="subscriptions"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta class for PublishingHouseSubscription."""
+        constraints = [
+            models.UniqueConstraint(
+                fields=["reader", "publishing_house"],
+                name="unique_publishing_house_subscription"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["publishing_house", "reader"],
+                name="house_subscribers_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.reader_id} follows house {self.publishing_house_id}"
+
+
+class JournalistSubscription(models.Model):
+    """A reader following a journalist, indexed in both directions."""
+    reader = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        db_index=False,
+        limit_choices_to={"role": "reader"},
+        related_name="journalist_subscriptions"
+    )
+    journalist = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        db_index=False,
+        limit_choices_to={"role": "journalist"},
+        related_name="reader_subscriptions"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta class for JournalistSubscription."""
+        constraints = [
+            models.UniqueConstraint(
+                fields=["reader", "journalist"],
+                name="unique_journalist_subscription"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["journalist", "reader"],
+                name="journalist_subscribers_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.reader_id} follows journalist {self.journalist_id}"
+
 
 class Article(models.Model):
     """News article model."""
 
     title = models.CharField(max_length=200)
     content = models.TextField()
+    excerpt = models.CharField(
+        max_length=EXCERPT_LENGTH,
+        blank=True,
+        editable=False,
+        help_text="Start of the content, kept in sync on save"
+    )
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_minutes = models.PositiveSmallIntegerField(
+        default=0, editable=False
+    )
+    body_html = models.TextField(
+        blank=True,
+        editable=False,
+        help_text="Escaped, paragraphed content, kept in sync on save"
+    )
 
+    # Both foreign keys lead composite indexes (see Meta), which also
+    # serve the lookups a single-column index would.
     journalist = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
         limit_choices_to={"role": "journalist"},
         related_name="articles"
     )
@@ -59,18 +209,217 @@ class Article(models.Model):
         null=True,
         blank=True,
         on_delete=models.SET_NULL,
+        db_index=False,
         related_name="articles"
     )
 
     approved = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    rejected = models.BooleanField(default=False)
+    # Embargo: an approved article stays hidden, and is not announced,
+    # until ``manage.py run_publish_scheduler`` clears this at the time.
+    publish_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Hold the article back until this time"
+    )
+    # Review queue claim (see reviews.claim_next); expired claims are
+    # simply ignored, so nothing has to release them.
+    claimed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="review_claims"
+    )
+    claimed_until = models.DateTimeField(null=True, blank=True,
+                                         editable=False)
+    # A default rather than auto_now_add so bulk imports keep their dates.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    # Incremental export cursor. QuerySet.update() does not touch it, so
+    # bulk approvals and go-lives set it themselves.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for Article.
+
+        One index per hot access path, each ending in the sort column so
+        pages are read in index order without a sort step. ``approved`` is
+        left out of the keys: SQLite cannot seek on a bare boolean test,
+        and approved rows are the vast majority anyway.
+        """
+        indexes = [
+            # Public list, search results and exports.
+            models.Index(
+                fields=["created_at", "id"],
+                name="article_recent_idx"
+            ),
+            # Journalist dashboard and journalist subscriptions.
+            models.Index(
+                fields=["journalist", "created_at"],
+                name="article_journalist_recent_idx"
+            ),
+            # Publishing house subscriptions, and the review queue on
+            # backends without partial indexes (MySQL).
+            models.Index(
+                fields=["publishing_house", "created_at"],
+                name="article_house_recent_idx"
+            ),
+            # Editor review queue; only pending rows are indexed.
+            models.Index(
+                fields=["publishing_house", "created_at"],
+                condition=models.Q(approved=False, rejected=False),
+                name="article_pending_queue_idx"
+            ),
+            # Incremental exports.
+            models.Index(
+                fields=["updated_at", "id"],
+                name="article_updated_idx"
+            ),
+            # Publish scheduler: next due and due embargoed articles. Only
+            # embargoed rows are indexed, so the index never looks like a
+            # shortcut for the "publish_at IS NULL" of every public read.
+            models.Index(
+                fields=["publish_at"],
+                condition=models.Q(publish_at__isnull=False),
+                name="article_publish_at_idx"
+            ),
+        ]
 
     def __str__(self):
         return str(self.title)
 
+    def save(self, *args, **kwargs):
+        """Refresh the content-derived fields whenever the content is
+        saved, and ``updated_at`` on every save."""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = kwargs["update_fields"] = {
+                *update_fields, "updated_at"
+            }
+        if update_fields is None or "content" in update_fields:
+            derived = derived_fields(self.content)
+            for name, value in derived.items():
+                setattr(self, name, value)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *derived}
+        super().save(*args, **kwargs)
 
 
+class NotificationJob(models.Model):
+    """A side effect of an article approval waiting to be delivered.
 
-from django.db import models
+    Jobs are written in the same transaction as the approval (a
+    transactional outbox) and drained by the ``run_notification_worker``
+    management command.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    CHANNEL_CHOICES = (
+        ("email", "Email"),
+        ("x", "X (Twitter)"),
+        ("feed", "Reader feeds"),
+        ("email_digest", "Email digest"),
+    )
+
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="notification_jobs",
+        help_text="Empty for jobs covering several articles"
+    )
+    channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=64, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta class for NotificationJob."""
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "channel"],
+                name="unique_notification_per_channel"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["status", "available_at"],
+                name="notification_due_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.channel} for article {self.article_id}"
+
+
+class FeedEntry(models.Model):
+    """An approved article materialised into one reader's feed.
+
+    ``created_at`` copies the article's timestamp so a feed page is a
+    single range scan on ``(reader, created_at)``.
+    """
+    reader = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="feed_entries"
+    )
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name="feed_entries"
+    )
+    created_at = models.DateTimeField()
 
+    class Meta:
+        """Meta class for FeedEntry."""
+        constraints = [
+            models.UniqueConstraint(
+                fields=["reader", "article"],
+                name="unique_feed_entry"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["reader", "-created_at", "-article"],
+                name="feed_reader_recent_idx"
+            ),
+        ]
 
+    def __str__(self):
+        return f"Article {self.article_id} for reader {self.reader_id}"
+
+
+class ImportCheckpoint(models.Model):
+    """Source rows an ``import_articles`` run has committed.
+
+    Updated in the same transaction as each imported batch, so a resumed
+    import never inserts a committed batch twice.
+    """
+    source = models.CharField(max_length=255, unique=True)
+    rows_done = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source}: {self.rows_done} rows"
@@ -0,0 +1,323 @@
+"""
+Notification outbox for approved articles.
+
+Approving an article only records one ``NotificationJob`` per channel;
+the jobs are delivered later by ``manage.py run_notification_worker``,
+so editors never wait on SMTP or the X API.
+"""
+import logging
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import Truncator
+
+from .feeds import fan_out_article, feed_mode_enabled
+from .mailer import BulkMailer
+from .models import Article, NotificationJob
+from .publishers import PostInFlight, PostRejected, get_x_publisher
+from .subscriptions import articles_by_subscriber, subscribed_readers
+
+logger = logging.getLogger(__name__)
+
+# Part of a job's lease a channel may spend waiting; the rest is left
+# for recording the result.
+LEASE_SHARE = 0.9
+
+
+# -------------------------
+# CHANNELS
+# -------------------------
+
+class PartialDelivery(RuntimeError):
+    """Some recipients could not be emailed.
+
+    ``payload`` replaces the job's payload, so the retry only mails the
+    recipients that failed.
+    """
+
+    def __init__(self, message, payload):
+        super().__init__(message)
+        self.payload = payload
+
+
+def raise_for_failures(report, payload):
+    """Raise ``PartialDelivery`` naming the failed recipients, if any."""
+    if report.failed:
+        raise PartialDelivery(
+            f"Could not email {report.failed} of "
+            f"{report.sent + report.failed} subscriber(s)",
+            {**payload, "emails": report.failed_emails},
+        )
+
+
+def send_article_email(article, emails=None):
+    """Email subscribed readers about a newly approved article.
+
+    Each reader gets an individually addressed message. When some fail,
+    the job is retried for those readers only (``emails``), so a retry
+    never re-sends to readers that already received the email.
+    """
+    mailer = BulkMailer(
+        subject=f"New Article Published: {article.title}",
+        body=f"""
+A new article has been published.
+
+Title: {article.title}
+Author: {article.journalist.username}
+
+{article.excerpt}
+""",
+    )
+    recipients = subscribed_readers(article)
+    if emails is not None:
+        recipients = recipients.filter(email__in=emails)
+    raise_for_failures(mailer.send(recipients), {})
+
+
+def post_to_x(article):
+    """Post an article summary to X and wait for the result.
+
+    The post goes through the shared ``XPublisher``, which reuses one
+    connection, paces posts and backs off when the API struggles. The
+    wait ends within the job's lease, so no other worker takes the job
+    over while the post may still be sent.
+    """
+    publisher = get_x_publisher()
+    deadline = time.monotonic() + LEASE_SHARE * (
+        settings.NOTIFICATION_LEASE_TIMEOUT
+    )
+
+    def remaining():
+        return min(publisher.max_wait, max(0, deadline - time.monotonic()))
+
+    future = publisher.submit(
+        f"📰 {article.title}\n\n{Truncator(article.excerpt).chars(200)}"
+    )
+    try:
+        future.result(timeout=remaining())
+    except TimeoutError:
+        if future.cancel():
+            # Still queued, so nothing was sent: the job can be retried.
+            raise
+        # Already being sent, which takes at most max_wait; a retry now
+        # could post the article twice.
+        try:
+            future.result(timeout=remaining())
+        except TimeoutError as exc:
+            future.add_done_callback(
+                lambda done: _log_late_post(article.id, done)
+            )
+            raise PostInFlight(
+                f"X post of article {article.id} did not finish in time"
+            ) from exc
+    logger.info("Article %s posted to X", article.id)
+
+
+def _log_late_post(article_id, future):
+    """Record how a post that outlived its job ended."""
+    if future.exception() is None:
+        logger.info("Article %s posted to X late", article_id)
+    else:
+        logger.error("Late X post of article %s failed: %r",
+                     article_id, future.exception())
+
+
+def send_digest_email(payload):
+    """Send each subscriber one email listing all their new articles.
+
+    Used for bulk approvals, so a reader following several of the
+    approved stories gets a single message instead of one per article.
+    A retry only mails the readers listed in ``payload["emails"]``.
+    """
+    emails = set(payload["emails"]) if "emails" in payload else None
+    articles = Article.objects.filter(
+        id__in=payload["article_ids"]
+    ).select_related("journalist").defer("content", "body_html")
+
+    def messages():
+        for email, reader_articles in articles_by_subscriber(
+                articles).items():
+            if emails is not None and email not in emails:
+                continue
+            count = len(reader_articles)
+            listing = "\n\n".join(
+                f"{article.title}\nBy {article.journalist.username}\n"
+                f"{article.excerpt}"
+                for article in reader_articles
+            )
+            yield (
+                email,
+                f"{count} new article{'s' if count != 1 else ''} published",
+                f"New articles have been published.\n\n{listing}\n",
+            )
+
+    raise_for_failures(BulkMailer().deliver(messages()), payload)
+
+
+CHANNEL_HANDLERS = {
+    "email": send_article_email,
+    "x": post_to_x,
+    "feed": fan_out_article,
+    "email_digest": send_digest_email,
+}
+
+
+# -------------------------
+# OUTBOX
+# -------------------------
+
+def active_channels():
+    """Channels every approved article is delivered to."""
+    channels = list(settings.NOTIFICATION_CHANNELS)
+    if feed_mode_enabled():
+        channels.append("feed")
+    return channels
+
+
+def enqueue_article_notifications(articles, digest=False):
+    """Record one pending job per active channel for each article.
+
+    This is a single INSERT; the unique constraint on (article, channel)
+    makes re-saving an approved article a no-op. With ``digest=True``
+    the per-article emails are replaced by one ``email_digest`` job that
+    mails every subscriber once for the whole batch.
+    """
+    channels = active_channels()
+    if digest and "email" in channels:
+        channels.remove("email")
+        jobs = [NotificationJob(
+            channel="email_digest",
+            payload={"article_ids": [article.id for article in articles]},
+        )]
+    else:
+        jobs = []
+    jobs += [
+        NotificationJob(article=article, channel=channel)
+        for article in articles
+        for channel in channels
+    ]
+    NotificationJob.objects.bulk_create(jobs, ignore_conflicts=True)
+
+
+def release_stale_jobs():
+    """Return jobs whose worker died mid-delivery to the pending state."""
+    cutoff = timezone.now() - timedelta(
+        seconds=settings.NOTIFICATION_LEASE_TIMEOUT
+    )
+    return NotificationJob.objects.filter(
+        status=NotificationJob.STATUS_RUNNING,
+        locked_at__lt=cutoff
+    ).update(status=NotificationJob.STATUS_PENDING, locked_by="")
+
+
+def claim_due_jobs(limit, token):
+    """Claim up to ``limit`` due jobs for worker ``token``; return their ids.
+
+    The claim is a conditional UPDATE, so concurrent workers never receive
+    the same job.
+    """
+    now = timezone.now()
+    due_ids = list(
+        NotificationJob.objects.filter(
+            status=NotificationJob.STATUS_PENDING,
+            available_at__lte=now
+        ).order_by("available_at", "id").values_list("id", flat=True)[:limit]
+    )
+    if not due_ids:
+        return []
+
+    NotificationJob.objects.filter(
+        id__in=due_ids,
+        status=NotificationJob.STATUS_PENDING
+    ).update(
+        status=NotificationJob.STATUS_RUNNING,
+        locked_by=token,
+        locked_at=now
+    )
+    return list(
+        NotificationJob.objects.filter(
+            id__in=due_ids,
+            locked_by=token
+        ).values_list("id", flat=True)
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff, in seconds, before the next delivery attempt."""
+    return settings.NOTIFICATION_RETRY_BACKOFF * 2 ** (attempts - 1)
+
+
+def run_job(job_id, token):
+    """Deliver a job claimed by ``token``, rescheduling it on failure.
+
+    Returns the job's new status, or ``None`` when the lease had already
+    passed to another worker: the job is then not delivered, or its
+    result is not written, so the two workers never both record it.
+    """
+    # The lease runs from the start of delivery, not from the claim.
+    if not NotificationJob.objects.filter(
+        id=job_id,
+        status=NotificationJob.STATUS_RUNNING,
+        locked_by=token
+    ).update(locked_at=timezone.now()):
+        logger.warning("Lease on notification job %s was lost", job_id)
+        return None
+
+    job = NotificationJob.objects.select_related(
+        "article__journalist", "article__publishing_house"
+    ).defer("article__content", "article__body_html").get(id=job_id)
+    job.attempts += 1
+
+    handler = CHANNEL_HANDLERS[job.channel]
+    try:
+        # Jobs covering several articles carry their ids in the payload;
+        # a partly delivered job carries the recipients still to retry.
+        if job.article_id:
+            handler(job.article, **job.payload)
+        else:
+            handler(job.payload)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception("Notification job %s failed", job.id)
+        job.last_error = repr(exc)
+        job.payload = getattr(exc, "payload", job.payload)
+        retry_at = getattr(exc, "retry_at", None)
+        # Rejected posts will not succeed, and in-flight ones may have.
+        if (isinstance(exc, (PostRejected, PostInFlight)) or
+                job.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS):
+            job.status = NotificationJob.STATUS_FAILED
+        elif retry_at:
+            # The channel said when it will take requests again.
+            job.status = NotificationJob.STATUS_PENDING
+            job.available_at = datetime.fromtimestamp(
+                retry_at, tz=dt_timezone.utc
+            )
+        else:
+            job.status = NotificationJob.STATUS_PENDING
+            job.available_at = timezone.now() + timedelta(
+                seconds=retry_delay(job.attempts)
+            )
+    else:
+        job.status = NotificationJob.STATUS_DONE
+        job.last_error = ""
+
+    if not NotificationJob.objects.filter(
+        id=job.id,
+        locked_by=token
+    ).update(
+        attempts=job.attempts,
+        status=job.status,
+        available_at=job.available_at,
+        last_error=job.last_error,
+        payload=job.payload,
+        locked_by="",
+        locked_at=None
+    ):
+        logger.warning(
+            "Lease on notification job %s expired during delivery; "
+            "result discarded", job.id
+        )
+        return None
+    return job.status
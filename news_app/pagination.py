@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination for article listings.
+
+Articles are ordered newest first by ``(created_at, id)`` and each page
+starts *after* the last row of the previous one, so fetching page N costs
+the same indexed range scan as page 1, unlike OFFSET pagination.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage:
+    """One page of results plus the opaque cursors around it."""
+    items: list
+    next_cursor: str = None
+    prev_cursor: str = None
+
+
+def encode_cursor(created_at, pk, direction):
+    """Build an opaque cursor pointing just past ``(created_at, pk)``."""
+    payload = json.dumps({
+        "t": created_at.isoformat(),
+        "id": pk,
+        "d": direction,
+    })
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return ``(created_at, id, direction)`` for an encoded cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(payload["t"])
+        pk = int(payload["id"])
+        direction = payload["d"]
+    except (TypeError, ValueError, KeyError) as exc:
+        raise InvalidCursor(cursor) from exc
+
+    if direction not in (NEXT, PREVIOUS):
+        raise InvalidCursor(cursor)
+    return created_at, pk, direction
+
+
+def get_page_size(requested=None):
+    """Clamp a client supplied page size to the configured bounds."""
+    try:
+        size = int(requested)
+    except (TypeError, ValueError):
+        return settings.ARTICLES_PAGE_SIZE
+    return max(1, min(size, settings.ARTICLES_MAX_PAGE_SIZE))
+
+
+def _keyset_query(queryset, cursor, page_size, time_field, id_field):
+    """Build the page query for ``cursor`` and a function that turns its
+    rows into a ``KeysetPage``, so sync and async callers share both."""
+    page_size = page_size or settings.ARTICLES_PAGE_SIZE
+    newest_first = (f"-{time_field}", f"-{id_field}")
+
+    def cursor_for(item, direction):
+        return encode_cursor(
+            getattr(item, time_field), getattr(item, id_field), direction
+        )
+
+    if not cursor:
+        def first_page(rows):
+            has_more = len(rows) > page_size
+            items = rows[:page_size]
+            return KeysetPage(
+                items=items,
+                next_cursor=cursor_for(items[-1], NEXT) if has_more else None,
+            )
+        return (
+            queryset.order_by(*newest_first)[:page_size + 1], first_page
+        )
+
+    created_at, pk, direction = decode_cursor(cursor)
+
+    if direction == NEXT:
+        def older_page(rows):
+            has_more = len(rows) > page_size
+            items = rows[:page_size]
+            if not items:
+                return KeysetPage(items=items)
+            return KeysetPage(
+                items=items,
+                next_cursor=cursor_for(items[-1], NEXT) if has_more else None,
+                prev_cursor=cursor_for(items[0], PREVIOUS),
+            )
+        return queryset.filter(
+            Q(**{f"{time_field}__lt": created_at}) |
+            Q(**{time_field: created_at, f"{id_field}__lt": pk})
+        ).order_by(*newest_first)[:page_size + 1], older_page
+
+    def newer_page(rows):
+        has_more = len(rows) > page_size
+        items = rows[:page_size][::-1]
+        if not items:
+            return KeysetPage(items=items)
+        return KeysetPage(
+            items=items,
+            next_cursor=cursor_for(items[-1], NEXT),
+            prev_cursor=cursor_for(items[0], PREVIOUS) if has_more else None,
+        )
+    return queryset.filter(
+        Q(**{f"{time_field}__gt": created_at}) |
+        Q(**{time_field: created_at, f"{id_field}__gt": pk})
+    ).order_by(time_field, id_field)[:page_size + 1], newer_page
+
+
+def paginate_articles(queryset, cursor=None, page_size=None,
+                      time_field="created_at", id_field="id"):
+    """Return the page of ``queryset`` (newest first) for ``cursor``.
+
+    ``time_field``/``id_field`` name the sort key, so querysets of rows
+    that denormalise an article's key (such as feed entries) page with the
+    same cursors as articles themselves. Raises ``InvalidCursor`` when the
+    cursor is malformed.
+    """
+    query, build_page = _keyset_query(
+        queryset, cursor, page_size, time_field, id_field
+    )
+    return build_page(list(query))
+
+
+async def apaginate_articles(queryset, cursor=None, page_size=None,
+                             time_field="created_at", id_field="id"):
+    """Async version of ``paginate_articles`` using the async ORM."""
+    query, build_page = _keyset_query(
+        queryset, cursor, page_size, time_field, id_field
+    )
+    return build_page([row async for row in query])
@@ -0,0 +1,225 @@
+"""
+Process-wide database connection pooling.
+
+``ConnectionPool`` hands out DB-API connections, bounded by ``max_size``.
+Connections are recycled after ``max_lifetime`` seconds, pinged before
+reuse once they have been idle for ``check_idle`` seconds, and callers
+wait up to ``timeout`` seconds for a free one before ``PoolTimeout``.
+
+``PooledDatabaseWrapperMixin`` plugs a pool into a Django backend: Django
+keeps one ``DatabaseWrapper`` per thread, so pools are shared per alias in
+``POOLS`` and "closing" a connection returns it to the pool. Pool options
+live in ``OPTIONS["pool"]``; see ``news_app.db_backends.mysql``.
+"""
+import threading
+import time
+from collections import deque
+from functools import partial
+
+from django.db import OperationalError
+
+DEFAULTS = {
+    "max_size": 10,
+    "max_lifetime": 1800.0,
+    "timeout": 10.0,
+    "check_idle": 1.0,
+}
+COUNTERS = ("created", "reused", "closed", "waits", "timeouts",
+            "failed_checks")
+
+
+class PoolTimeout(OperationalError):
+    """No connection became free within the pool's ``timeout``."""
+
+
+class ConnectionPool:
+    """Thread-safe bounded pool of DB-API connections."""
+
+    def __init__(self, max_size, max_lifetime, timeout, check_idle):
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.check_idle = check_idle
+        self.condition = threading.Condition()
+        # (connection, opened_at, released_at); newest at the right so
+        # the warmest connection is reused first.
+        self.idle = deque()
+        self.in_use = {}
+        self.opening = 0
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+    def _expired(self, opened_at, now):
+        return (self.max_lifetime is not None and
+                now - opened_at >= self.max_lifetime)
+
+    def _take(self):
+        """Pop an idle entry, or reserve a slot for a new connection
+        (``None``), waiting while the pool is exhausted."""
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        with self.condition:
+            while True:
+                if self.idle:
+                    return self.idle.pop()
+                if len(self.in_use) + self.opening < self.max_size:
+                    self.opening += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.counters["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"No database connection free after "
+                        f"{self.timeout}s (pool size {self.max_size})."
+                    )
+                if not waited:
+                    waited = True
+                    self.counters["waits"] += 1
+                self.condition.wait(remaining)
+
+    def _destroy(self, connection):
+        try:
+            connection.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+        with self.condition:
+            self.counters["closed"] += 1
+            self.condition.notify()
+
+    def acquire(self, factory, check=None):
+        """Return ``(connection, reused)``.
+
+        ``factory()`` opens a new connection; ``check(connection)`` must
+        raise if an idle connection is no longer usable.
+        """
+        while True:
+            entry = self._take()
+            if entry is None:
+                try:
+                    connection = factory()
+                except BaseException:
+                    with self.condition:
+                        self.opening -= 1
+                        self.condition.notify()
+                    raise
+                with self.condition:
+                    self.opening -= 1
+                    self.in_use[connection] = time.monotonic()
+                    self.counters["created"] += 1
+                return connection, False
+
+            connection, opened_at, released_at = entry
+            now = time.monotonic()
+            if self._expired(opened_at, now):
+                self._destroy(connection)
+                continue
+            if (check is not None and self.check_idle is not None and
+                    now - released_at >= self.check_idle):
+                try:
+                    check(connection)
+                except Exception:  # pylint: disable=broad-except
+                    with self.condition:
+                        self.counters["failed_checks"] += 1
+                    self._destroy(connection)
+                    continue
+            with self.condition:
+                self.in_use[connection] = opened_at
+                self.counters["reused"] += 1
+            return connection, True
+
+    def release(self, connection):
+        """Give a healthy connection back for reuse."""
+        now = time.monotonic()
+        with self.condition:
+            opened_at = self.in_use.pop(connection)
+            if not self._expired(opened_at, now):
+                self.idle.append((connection, opened_at, now))
+                self.condition.notify()
+                return
+        self._destroy(connection)
+
+    def discard(self, connection):
+        """Close a connection that must not be reused."""
+        with self.condition:
+            self.in_use.pop(connection, None)
+        self._destroy(connection)
+
+    def close_idle(self):
+        """Close every idle connection (used on shutdown and in tests)."""
+        with self.condition:
+            idle, self.idle = list(self.idle), deque()
+        for connection, _, _ in idle:
+            self._destroy(connection)
+
+    def stats(self):
+        """Current gauges and lifetime counters."""
+        with self.condition:
+            return {
+                "max_size": self.max_size,
+                "in_use": len(self.in_use),
+                "idle": len(self.idle),
+                **self.counters,
+            }
+
+
+POOLS = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, options):
+    """The process-wide pool for ``alias``, created on first use."""
+    with _pools_lock:
+        if alias not in POOLS:
+            POOLS[alias] = ConnectionPool(**{**DEFAULTS, **options})
+        return POOLS[alias]
+
+
+def pool_stats():
+    """``{alias: stats}`` for every pool opened in this process."""
+    with _pools_lock:
+        pools = dict(POOLS)
+    return {alias: pool.stats() for alias, pool in pools.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    """Take connections from, and return them to, a per-alias pool.
+
+    Use with ``CONN_MAX_AGE = 0`` so every request hands its connection
+    back when it finishes. Connections that errored, or were closed inside
+    a transaction or with autocommit off, are discarded instead of reused.
+    """
+
+    @property
+    def pool(self):
+        return get_pool(
+            self.alias, self.settings_dict["OPTIONS"].get("pool", {})
+        )
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    @staticmethod
+    def ping(connection):
+        """Raise if ``connection`` is no longer usable."""
+        connection.cursor().execute("SELECT 1")
+
+    def get_new_connection(self, conn_params):
+        connection, self.pool_reused = self.pool.acquire(
+            partial(super().get_new_connection, conn_params), self.ping
+        )
+        return connection
+
+    def init_connection_state(self):
+        # Session state set on first use survives in the pool.
+        if not getattr(self, "pool_reused", False):
+            super().init_connection_state()
+
+    def _close(self):
+        if self.connection is None:
+            return
+        if (self.in_atomic_block or self.errors_occurred or
+                self.autocommit != self.settings_dict["AUTOCOMMIT"]):
+            self.pool.discard(self.connection)
+        else:
+            self.pool.release(self.connection)
@@ -0,0 +1,322 @@
+"""
+Posting to the X (Twitter) API v2 from a single background sender.
+
+``XPublisher`` keeps one HTTP session (and so one pooled TLS connection)
+per process and posts from one daemon thread fed by a bounded queue, so
+every notification worker thread shares the account's rate limit. Each
+post is retried with exponential backoff and full jitter (but only when
+the request cannot have reached the API, so nothing is posted twice);
+a 429 pauses
+the publisher until the reset time the API reports, and repeated
+failures open a circuit breaker that fails new posts fast instead of
+hammering a broken API. Callers get a ``Future``.
+
+``X_API_URL`` points the publisher at a local stub in tests.
+"""
+import base64
+import hashlib
+import hmac
+import logging
+import queue
+import random
+import secrets
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import quote
+
+import requests
+from django.conf import settings
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+TWEETS_PATH = "/2/tweets"
+
+
+class PublishError(Exception):
+    """A post failed and should be retried later.
+
+    ``retry_at`` (a Unix timestamp) is set when the API said when.
+    """
+    retry_at = None
+
+
+class PublisherUnavailable(PublishError):
+    """The queue is full, the circuit is open or the API rate limited us."""
+
+    def __init__(self, message, retry_at=None):
+        super().__init__(message)
+        self.retry_at = retry_at
+
+
+class PostRejected(Exception):
+    """The API refused the post (4xx); retrying will not help."""
+
+
+class PostInFlight(Exception):
+    """The post may have been sent; retrying could post it twice."""
+
+
+def _never_sent(exc):
+    """Whether ``exc`` was raised before the request left this process."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return (isinstance(exc, requests.ConnectionError) and
+            isinstance(reason, NewConnectionError))
+
+
+def _quote(value):
+    return quote(str(value), safe="~")
+
+
+def oauth1_header(method, url, credentials, nonce=None, timestamp=None):
+    """``Authorization`` header for an OAuth 1.0a user-context request.
+
+    ``credentials`` is ``(consumer_key, consumer_secret, access_token,
+    access_token_secret)``. JSON bodies are not part of the signature.
+    """
+    consumer_key, consumer_secret, token, token_secret = credentials
+    params = {
+        "oauth_consumer_key": consumer_key,
+        "oauth_nonce": nonce or secrets.token_hex(16),
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_timestamp": str(timestamp or int(time.time())),
+        "oauth_token": token,
+        "oauth_version": "1.0",
+    }
+    normalized = "&".join(
+        f"{_quote(key)}={_quote(value)}"
+        for key, value in sorted(params.items())
+    )
+    base = "&".join(_quote(part) for part in (method, url, normalized))
+    key = f"{_quote(consumer_secret)}&{_quote(token_secret)}"
+    params["oauth_signature"] = base64.b64encode(
+        hmac.new(key.encode(), base.encode(), hashlib.sha1).digest()
+    ).decode()
+    return "OAuth " + ", ".join(
+        f'{_quote(key)}="{_quote(value)}"'
+        for key, value in sorted(params.items())
+    )
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures; after
+    ``reset_seconds`` one trial call is let through (half-open)."""
+
+    def __init__(self, threshold, reset_seconds):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def retry_at(self):
+        """When the breaker lets a trial call through (Unix time)."""
+        opened_at = self.opened_at
+        if opened_at is None:
+            return time.time()
+        return time.time() + max(
+            0.0, opened_at + self.reset_seconds - time.monotonic()
+        )
+
+    def allow(self):
+        """Whether a call may be attempted now."""
+        with self.lock:
+            return (
+                self.opened_at is None or
+                time.monotonic() - self.opened_at >= self.reset_seconds
+            )
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.threshold:
+                if self.opened_at is None:
+                    logger.warning("X API circuit breaker opened")
+                self.opened_at = time.monotonic()
+
+
+class XPublisher:
+    """Posts tweets from one background thread. See the module docstring."""
+
+    def __init__(self, credentials, base_url, timeout, queue_size,
+                 max_retries, backoff_base, backoff_max, breaker,
+                 max_rate_limit_wait):
+        self.credentials = credentials
+        self.url = base_url.rstrip("/") + TWEETS_PATH
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.session = requests.Session()
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.paused_until = 0.0
+        self.thread = None
+        self.start_lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls):
+        """A publisher configured from the ``X_*`` settings."""
+        return cls(
+            credentials=(
+                settings.X_API_KEY, settings.X_API_SECRET,
+                settings.X_ACCESS_TOKEN, settings.X_ACCESS_TOKEN_SECRET,
+            ),
+            base_url=settings.X_API_URL,
+            timeout=settings.X_TIMEOUT,
+            queue_size=settings.X_QUEUE_SIZE,
+            max_retries=settings.X_MAX_RETRIES,
+            backoff_base=settings.X_BACKOFF_BASE,
+            backoff_max=settings.X_BACKOFF_MAX,
+            breaker=CircuitBreaker(
+                settings.X_BREAKER_THRESHOLD,
+                settings.X_BREAKER_RESET_SECONDS,
+            ),
+            max_rate_limit_wait=settings.X_MAX_RATE_LIMIT_WAIT,
+        )
+
+    @property
+    def max_wait(self):
+        """Longest a single post can take, retries and waits included."""
+        return (
+            (self.timeout + self.backoff_max) * (self.max_retries + 1) +
+            self.max_rate_limit_wait
+        )
+
+    def submit(self, text):
+        """Queue a post and return a ``Future`` of the API response.
+
+        Raises ``PublisherUnavailable`` straight away instead of queueing
+        when the API is known to be down or rate limiting, or the queue
+        is full.
+        """
+        if time.time() < self.paused_until:
+            raise PublisherUnavailable(
+                "X API rate limit reached", self.paused_until
+            )
+        if not self.breaker.allow():
+            raise PublisherUnavailable(
+                "X API circuit breaker is open", self.breaker.retry_at
+            )
+        self.start()
+        future = Future()
+        try:
+            self.queue.put_nowait((text, future))
+        except queue.Full as exc:
+            raise PublisherUnavailable("X publish queue is full") from exc
+        return future
+
+    def start(self):
+        """Start the sender thread if it is not running."""
+        with self.start_lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="x-publisher", daemon=True
+                )
+                self.thread.start()
+
+    def run(self):
+        """Sender loop: post queued texts one at a time."""
+        while True:
+            text, future = self.queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self.post(text))
+                except Exception as exc:  # pylint: disable=broad-except
+                    future.set_exception(exc)
+            self.queue.task_done()
+
+    def backoff(self, attempt):
+        """Full-jitter exponential backoff before retry ``attempt``."""
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        )
+
+    def post(self, text):
+        """Post ``text`` now, retrying transient failures."""
+        error = PublishError("X API post was not attempted")
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff(attempt - 1))
+            if not self.breaker.allow():
+                raise PublisherUnavailable(
+                    "X API circuit breaker is open", self.breaker.retry_at
+                )
+            try:
+                response = self.session.post(
+                    self.url,
+                    json={"text": text},
+                    headers={"Authorization": oauth1_header(
+                        "POST", self.url, self.credentials
+                    )},
+                    timeout=self.timeout,
+                )
+            except requests.RequestException as exc:
+                logger.warning("X API request failed: %s", exc)
+                self.breaker.record_failure()
+                if not _never_sent(exc):
+                    # E.g. a read timeout: the API may have posted it.
+                    raise PostInFlight(
+                        f"X API request may have been sent: {exc}"
+                    ) from exc
+                error = PublishError(str(exc))
+                continue
+
+            if response.status_code == 429:
+                reset = self.rate_limit_reset(response)
+                self.paused_until = reset
+                if reset - time.time() > self.max_rate_limit_wait:
+                    raise PublisherUnavailable(
+                        "X API rate limit reached", reset
+                    )
+                time.sleep(max(0.0, reset - time.time()))
+                error = PublisherUnavailable(
+                    "X API rate limit reached", reset
+                )
+                continue
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+                error = PublishError(f"X API returned {response.status_code}")
+                continue
+            # A 4xx answer means the API is up, just unwilling.
+            self.breaker.record_success()
+            if response.status_code >= 400:
+                raise PostRejected(
+                    f"X API rejected the post ({response.status_code}): "
+                    f"{response.text[:200]}"
+                )
+            return response.json()
+        raise error
+
+    @staticmethod
+    def rate_limit_reset(response):
+        """Unix time the rate limit resets, from the response headers."""
+        headers = response.headers
+        if "x-rate-limit-reset" in headers:
+            return float(headers["x-rate-limit-reset"])
+        if "retry-after" in headers:
+            return time.time() + float(headers["retry-after"])
+        return time.time() + 60
+
+
+_publisher = None
+_publisher_lock = threading.Lock()
+
+
+def get_x_publisher():
+    """The process-wide ``XPublisher``."""
+    global _publisher  # pylint: disable=global-statement
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = XPublisher.from_settings()
+        return _publisher
@@ -0,0 +1,155 @@
+"""
+Editor review actions on pending articles.
+
+Pending articles form a per-house queue that editors pull from:
+``claim_next`` hands each editor the oldest articles nobody else holds,
+so several editors of one house review different stories instead of
+racing each other. Claims expire after ``REVIEW_CLAIM_SECONDS``.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from .caching import bump_schedule_version, bump_versions
+from .models import Article
+from .notifications import enqueue_article_notifications
+
+APPROVE = "approve"
+REJECT = "reject"
+ACTIONS = (APPROVE, REJECT)
+
+
+def pending_for_editor(editor):
+    """Articles waiting for review in the editor's publishing house."""
+    return Article.objects.filter(
+        approved=False,
+        rejected=False,
+        publishing_house_id=editor.publishing_house_id
+    ).order_by("created_at", "id")
+
+
+def unclaimed(now):
+    """Filter for articles without a live claim."""
+    return Q(claimed_until__isnull=True) | Q(claimed_until__lt=now)
+
+
+def reviewable_by(editor, now=None):
+    """Pending articles the editor may review: their own claims and
+    unclaimed ones."""
+    now = now or timezone.now()
+    return pending_for_editor(editor).filter(
+        unclaimed(now) | Q(claimed_by=editor)
+    )
+
+
+def is_claimed_by_other(article, editor):
+    """Whether another editor holds a live claim on ``article``."""
+    return (
+        article.claimed_by_id not in (None, editor.id) and
+        article.claimed_until >= timezone.now()
+    )
+
+
+def claimed_articles(editor, now=None):
+    """The editor's live claims, oldest article first."""
+    return pending_for_editor(editor).filter(
+        claimed_by=editor, claimed_until__gte=now or timezone.now()
+    )
+
+
+def claim_next(editor, batch=None):
+    """Top the editor's claims up to ``batch`` articles and renew them.
+
+    Where the database supports it the next articles are locked with
+    ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent editors never
+    wait on each other's rows. Elsewhere (SQLite) candidates are claimed
+    with an UPDATE that re-checks they are still unclaimed, and rows
+    taken by a concurrent editor are retried. Returns the claims.
+    """
+    batch = batch or settings.REVIEW_CLAIM_BATCH
+    now = timezone.now()
+    until = now + timedelta(seconds=settings.REVIEW_CLAIM_SECONDS)
+    held = claimed_articles(editor, now).update(claimed_until=until)
+
+    available = pending_for_editor(editor).filter(unclaimed(now))
+    for _ in range(3):
+        wanted = batch - held
+        if wanted <= 0:
+            break
+        with transaction.atomic():
+            if connection.features.has_select_for_update_skip_locked:
+                candidates = available.select_for_update(skip_locked=True)
+            else:
+                candidates = available
+            ids = list(candidates.values_list("id", flat=True)[:wanted])
+            if not ids:
+                break
+            held += available.filter(id__in=ids).update(
+                claimed_by=editor, claimed_until=until
+            )
+    return claimed_articles(editor, now)
+
+
+def queue_stats(house_id=None):
+    """Per-house review queue depth, live claims and oldest pending
+    article, in one GROUP BY over the pending-queue index."""
+    now = timezone.now()
+    queryset = Article.objects.filter(approved=False, rejected=False)
+    if house_id is not None:
+        queryset = queryset.filter(publishing_house_id=house_id)
+    rows = queryset.values("publishing_house_id").annotate(
+        depth=Count("id"),
+        claimed=Count("id", filter=Q(claimed_until__gte=now)),
+        oldest=Min("created_at"),
+    ).order_by("publishing_house_id")
+    return [
+        {**row, "age": (now - row["oldest"]).total_seconds()}
+        for row in rows
+    ]
+
+
+def bulk_review(editor, article_ids, action):
+    """Approve or reject many pending articles at once.
+
+    The articles are updated with one scoped UPDATE (ids outside the
+    editor's house, already reviewed or claimed by another editor are
+    ignored) and approvals queue a single digest notification for the
+    whole batch, leaving embargoed articles to the publish scheduler.
+    Returns the number of articles changed.
+    """
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown review action: {action!r}")
+
+    scope = reviewable_by(editor).filter(id__in=article_ids)
+
+    if action == REJECT:
+        return scope.update(
+            rejected=True, claimed_by=None, claimed_until=None,
+            updated_at=timezone.now()
+        )
+
+    with transaction.atomic():
+        articles = list(
+            scope.select_for_update().only(
+                "id", "journalist_id", "publishing_house_id", "publish_at"
+            )
+        )
+        if not articles:
+            return 0
+        Article.objects.filter(
+            id__in=[article.id for article in articles]
+        ).update(
+            approved=True, rejected=False, claimed_by=None,
+            claimed_until=None, updated_at=timezone.now()
+        )
+        live = [article for article in articles if article.publish_at is None]
+        if live:
+            enqueue_article_notifications(live, digest=True)
+
+    bump_versions(articles)
+    if len(live) < len(articles):
+        bump_schedule_version()
+    return len(articles)
@@ -0,0 +1,144 @@
+"""
+Read replica routing with read-your-writes stickiness.
+
+Reads go to a replica only inside requests that
+``ReplicaPinningMiddleware`` marked as replica-safe: GET/HEAD requests
+from clients that have not written recently. Everything else (writes,
+transactions, unsafe requests, management commands and workers) uses
+the primary. Once a request writes, its remaining reads use the primary
+too, and the client gets a short-lived cookie that pins its following
+requests to the primary, so it reads its own writes even while replicas
+lag behind.
+"""
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+PIN_COOKIE = "db_primary_pin"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Per-request routing state: whether replicas may serve reads and
+# whether the request has written.
+_replica_reads = ContextVar("replica_reads", default=False)
+_wrote = ContextVar("wrote", default=None)
+
+
+class ReplicaPool:
+    """Round-robin over replicas, skipping those failing health checks."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.position = 0
+        self.health = {}
+
+    def is_healthy(self, alias):
+        """Whether ``alias`` answered ``SELECT 1`` recently (cached)."""
+        now = time.monotonic()
+        healthy, checked_at = self.health.get(alias, (True, None))
+        if checked_at is not None and (
+                now - checked_at < settings.REPLICA_HEALTH_CHECK_SECONDS):
+            return healthy
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT 1")
+            healthy = True
+        except Exception:  # pylint: disable=broad-except
+            connections[alias].close()
+            healthy = False
+        self.health[alias] = (healthy, now)
+        return healthy
+
+    def choose(self):
+        """The next healthy replica, or the primary if none is."""
+        replicas = settings.DATABASE_REPLICAS
+        with self.lock:
+            start = self.position
+            self.position = (self.position + 1) % max(len(replicas), 1)
+        for offset in range(len(replicas)):
+            alias = replicas[(start + offset) % len(replicas)]
+            if self.is_healthy(alias):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+
+POOL = ReplicaPool()
+
+
+class ReplicaRouter:
+    """Send replica-safe reads to replicas and everything else to the
+    primary."""
+
+    def db_for_read(self, model, **hints):
+        if (
+            not _replica_reads.get() or
+            _wrote.get() or
+            not settings.DATABASE_REPLICAS or
+            connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return POOL.choose()
+
+    def db_for_write(self, model, **hints):
+        wrote = _wrote.get()
+        if wrote is not None:
+            wrote.append(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication.
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaPinningMiddleware:
+    """Mark replica-safe requests and pin recent writers to the primary."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def start(request):
+        """Set the routing state for this request."""
+        return (
+            _replica_reads.set(
+                request.method in SAFE_METHODS and
+                PIN_COOKIE not in request.COOKIES
+            ),
+            _wrote.set([]),
+        )
+
+    @staticmethod
+    def finish(response, tokens):
+        """Pin the client if the request wrote, then reset the state."""
+        if _wrote.get():
+            response.set_cookie(
+                PIN_COOKIE, "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        replica_token, wrote_token = tokens
+        _replica_reads.reset(replica_token)
+        _wrote.reset(wrote_token)
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = self.start(request)
+        return self.finish(self.get_response(request), tokens)
+
+    async def __acall__(self, request):
+        tokens = self.start(request)
+        return self.finish(await self.get_response(request), tokens)
@@ -0,0 +1,70 @@
+"""
+Embargoed articles going live at their ``publish_at`` time.
+
+An approved article with ``publish_at`` set stays out of every public
+read (``models.PUBLISHED``) until ``publish_due`` clears the field. Due
+articles are found through the ``publish_at`` index and taken live in
+batches: one UPDATE and one outbox INSERT per batch, so a morning drop
+of hundreds of stories is announced in a single digest per subscriber.
+``manage.py run_publish_scheduler`` sleeps until ``next_publish_time``
+and is woken early by ``schedule_version`` changing when an article is
+scheduled (``signals.wake_publish_scheduler``).
+"""
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .caching import SCHEDULE_VERSION_KEY, bump_versions, get_versions
+from .models import Article
+from .notifications import enqueue_article_notifications
+
+
+def embargoed():
+    """Approved articles still waiting for their ``publish_at``."""
+    return Article.objects.filter(approved=True, publish_at__isnull=False)
+
+
+def next_publish_time():
+    """The earliest pending ``publish_at``, or ``None``."""
+    return embargoed().order_by("publish_at").values_list(
+        "publish_at", flat=True
+    ).first()
+
+
+def schedule_version():
+    """Counter bumped whenever an article is scheduled."""
+    return get_versions([SCHEDULE_VERSION_KEY])[SCHEDULE_VERSION_KEY]
+
+
+def publish_batch(now, batch_size):
+    """Take up to ``batch_size`` due articles live; returns them."""
+    queryset = embargoed().filter(publish_at__lte=now).order_by(
+        "publish_at", "id"
+    )
+    if connection.features.has_select_for_update_skip_locked:
+        # Concurrent schedulers split the due rows between them.
+        queryset = queryset.select_for_update(skip_locked=True)
+
+    with transaction.atomic():
+        articles = list(queryset.only(
+            "id", "journalist_id", "publishing_house_id"
+        )[:batch_size])
+        if not articles:
+            return []
+        Article.objects.filter(
+            id__in=[article.id for article in articles]
+        ).update(publish_at=None, updated_at=timezone.now())
+        enqueue_article_notifications(articles, digest=True)
+
+    bump_versions(articles)
+    return articles
+
+
+def publish_due(batch_size, now=None):
+    """Take every article due by ``now`` live. Returns how many."""
+    now = now or timezone.now()
+    published = 0
+    while True:
+        articles = publish_batch(now, batch_size)
+        if not articles:
+            return published
+        published += len(articles)
@@ -0,0 +1,134 @@
+"""
+Full-text search over article titles and content.
+
+SQLite (development) uses an FTS5 table and MySQL (production) a FULLTEXT
+index; both sit behind ``SearchBackend`` so views and the admin do not
+care which database is in use. The index is kept in sync by the
+``post_save``/``post_delete`` receivers in ``signals.py``.
+"""
+import re
+
+from django.db import connection
+
+FTS_TABLE = "news_app_article_fts"
+ARTICLE_TABLE = "news_app_article"
+
+
+class SearchBackend:
+    """Interface for article search backends.
+
+    ``search`` returns article ids ordered by relevance.
+    """
+
+    def index(self, articles):
+        """Add or refresh ``articles`` in the index."""
+
+    def remove(self, article_ids):
+        """Drop the given article ids from the index."""
+
+    def rebuild(self):
+        """Re-index every article from scratch."""
+
+    def search(self, query, approved_only=True, limit=20, offset=0):
+        """Return up to ``limit`` matching article ids, best first.
+
+        ``approved_only`` restricts the results to published articles
+        (``models.PUBLISHED``), leaving out embargoed ones.
+        """
+        raise NotImplementedError
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """FTS5 table ranked with BM25, titles weighted above body text."""
+
+    @staticmethod
+    def match_expression(query):
+        """Turn free text into a safe FTS5 query (all terms, last prefix)."""
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def index(self, articles):
+        rows = [(a.id, a.title, a.content) for a in articles]
+        if not rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [(row[0],) for row in rows],
+            )
+            cursor.executemany(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, content) "
+                "VALUES (%s, %s, %s)",
+                rows,
+            )
+
+    def remove(self, article_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {FTS_TABLE} WHERE rowid = %s",
+                [(article_id,) for article_id in article_ids],
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, content) "
+                f"SELECT id, title, content FROM {ARTICLE_TABLE}"
+            )
+
+    def search(self, query, approved_only=True, limit=20, offset=0):
+        expression = self.match_expression(query)
+        if expression is None:
+            return []
+        approved = (
+            "AND a.approved AND a.publish_at IS NULL" if approved_only
+            else ""
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT a.id FROM {FTS_TABLE} "
+                f"JOIN {ARTICLE_TABLE} a ON a.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s {approved} "
+                f"ORDER BY bm25({FTS_TABLE}, 10.0, 1.0) "
+                "LIMIT %s OFFSET %s",
+                [expression, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class MySQLFullTextBackend(SearchBackend):
+    """InnoDB FULLTEXT index; MySQL keeps it in sync by itself."""
+
+    def search(self, query, approved_only=True, limit=20, offset=0):
+        if not query.strip():
+            return []
+        approved = (
+            "AND approved AND publish_at IS NULL" if approved_only else ""
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id FROM {ARTICLE_TABLE} "
+                "WHERE MATCH (title, content) AGAINST "
+                f"(%s IN NATURAL LANGUAGE MODE) {approved} "
+                "ORDER BY MATCH (title, content) AGAINST "
+                "(%s IN NATURAL LANGUAGE MODE) DESC "
+                "LIMIT %s OFFSET %s",
+                [query, query, limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+BACKENDS = {
+    "sqlite": SQLiteFTS5Backend,
+    "mysql": MySQLFullTextBackend,
+}
+
+
+def get_search_backend():
+    """Return the search backend for the default database."""
+    return BACKENDS[connection.vendor]()
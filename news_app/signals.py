@@ -1,20 +1,30 @@
 # news_app/signals.py
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+)
 from django.dispatch import receiver
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from django.conf import settings
-from django.core.mail import send_mail
-import requests
-from django.db import models
-from .models import Article, CustomUser
-import tweepy
-import logging
-
-try:
-    import tweepy
-except ImportError:
-    tweepy = None
+from .backends import invalidate_user
+from .caching import (
+    bump_house_version,
+    bump_schedule_version,
+    bump_versions,
+)
+from .feeds import backfill_feeds, prune_feeds
+from .models import (
+    Article,
+    CustomUser,
+    JournalistSubscription,
+    PublishingHouse,
+    PublishingHouseSubscription,
+)
+from .notifications import enqueue_article_notifications
+from .search import get_search_backend
+from .subscriptions import invalidate_subscription_ids
 
 
 @receiver(post_migrate)
@@ -54,62 +64,143 @@ def assign_groups(sender, instance, created, **kwargs):
             instance.save()
 
 
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the user's cached snapshot so the next request reloads it."""
+    invalidate_user(instance.pk)
+
+
 @receiver(post_save, sender=Article)
 def notify_on_article_approval(sender, instance, created, **kwargs):
-    """Send notifications when an article is approved."""
-    if not instance.approved or instance.notified:
+    """Queue notifications when an article is approved.
+
+    Delivery happens in ``run_notification_worker``; here we only write
+    the outbox rows, in the same transaction as the approval. Embargoed
+    articles are announced by ``run_publish_scheduler`` when they go live.
+    """
+    if not instance.approved or instance.publish_at is not None:
         return
 
-    subscribed_readers = CustomUser.objects.filter(
-        role='reader'
-    ).filter(
-        models.Q(subscribed_publishers=instance.publisher) |
-        models.Q(subscribed_journalists=instance.journalist)
-    ).distinct()
-
-    email_list = [user.email for user in subscribed_readers if user.email]
-
-    if email_list:
-        send_mail(
-            subject=f"New Article Published: {instance.title}",
-            message=f"""
-A new article has been published.
-
-Title: {instance.title}
-Author: {instance.journalist.username}
-
-{instance.content[:300]}...
-""",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=email_list,
-            fail_silently=True,
-        )
+    enqueue_article_notifications([instance])
+
+
+@receiver(post_save, sender=Article)
+def index_article_for_search(sender, instance, update_fields=None, **kwargs):
+    """Keep the full-text index in step with the article's text."""
+    if update_fields and not {"title", "content"} & set(update_fields):
+        return
+    get_search_backend().index([instance])
+
+
+@receiver(post_delete, sender=Article)
+def remove_article_from_search(sender, instance, **kwargs):
+    """Drop a deleted article from the full-text index."""
+    get_search_backend().remove([instance.id])
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_article_pages(sender, instance, **kwargs):
+    """Expire cached pages, payloads and fragments showing the article.
+
+    The list version is bumped for every article, not only approved
+    ones: an article that was just unapproved, rejected or embargoed
+    must leave the cached lists too, and the previous state is not known
+    here.
+    """
+    bump_versions([instance])
+
+
+@receiver(post_save, sender=Article)
+def wake_publish_scheduler(sender, instance, **kwargs):
+    """Let the publish scheduler see a newly scheduled article."""
+    if instance.approved and instance.publish_at is not None:
+        bump_schedule_version()
+
+
+@receiver(post_save, sender=PublishingHouse)
+def invalidate_publishing_house_pages(sender, instance, **kwargs):
+    """Expire cached payloads that show the publishing house's name."""
+    bump_house_version(instance)
 
-    post_to_x(instance)
-    Article.objects.filter(id=instance.id).update(notified=True)
 
+@receiver(post_save, sender=JournalistSubscription)
+@receiver(post_delete, sender=JournalistSubscription)
+@receiver(post_save, sender=PublishingHouseSubscription)
+@receiver(post_delete, sender=PublishingHouseSubscription)
+def invalidate_reader_subscriptions(sender, instance, **kwargs):
+    """Drop the cached subscription ids of the affected reader."""
+    invalidate_subscription_ids([instance.reader_id])
 
-logger = logging.getLogger(__name__)
 
+def _followed_field(sender):
+    """Article field matching the target of a subscription model."""
+    if sender is JournalistSubscription:
+        return "journalist_id"
+    return "publishing_house_id"
 
-def post_to_x(article):
-    """Posts article summary to X using OAuth 1.0a."""
-    try:
-        client = tweepy.Client(
-            consumer_key=settings.X_API_KEY,
-            consumer_secret=settings.X_API_SECRET,
-            access_token=settings.X_ACCESS_TOKEN,
-            access_token_secret=settings.X_ACCESS_TOKEN_SECRET,
+
+@receiver(post_save, sender=JournalistSubscription)
+@receiver(post_save, sender=PublishingHouseSubscription)
+def backfill_feed_on_subscribe(sender, instance, created, **kwargs):
+    """Add the followed target's recent articles to the reader's feed."""
+    if created:
+        field = _followed_field(sender)
+        backfill_feeds(
+            [instance.reader_id], field,
+            [getattr(instance, field)]
         )
 
-        tweet_text = f"📰 {article.title}\n\n{article.content[:200]}..."
-        client.create_tweet(text=tweet_text)
 
-        logger.info("Article successfully posted to X")
+@receiver(post_delete, sender=JournalistSubscription)
+@receiver(post_delete, sender=PublishingHouseSubscription)
+def prune_feed_on_unsubscribe(sender, instance, **kwargs):
+    """Remove the unfollowed target's articles from the reader's feed.
+
+    Also covers the relations' ``remove``/``clear``, which delete the
+    through rows one signal at a time.
+    """
+    field = _followed_field(sender)
+    prune_feeds([instance.reader_id], field, [getattr(instance, field)])
+
 
-    except Exception:
-        logger.exception("Failed to post article to X")
-        raise
-    if tweepy is None:
-        logger.warning("Tweepy not installed; skipping X post")
-        return
\ No newline at end of file
+@receiver(m2m_changed, sender=JournalistSubscription)
+@receiver(m2m_changed, sender=PublishingHouseSubscription)
+def backfill_feed_on_add(sender, instance, action, reverse, pk_set,
+                         **kwargs):
+    """``add`` bulk-inserts through rows without ``post_save``."""
+    if action != "post_add" or not pk_set:
+        return
+    field = _followed_field(sender)
+    if reverse:
+        backfill_feeds(pk_set, field, [instance.pk])
+    else:
+        backfill_feeds([instance.pk], field, pk_set)
+
+
+@receiver(m2m_changed, sender=JournalistSubscription)
+@receiver(m2m_changed, sender=PublishingHouseSubscription)
+def invalidate_changed_subscriptions(sender, instance, action, reverse,
+                                     pk_set, **kwargs):
+    """Drop cached ids after ``add``/``remove``/``clear`` on a relation.
+
+    From the reader's side the reader is ``instance``; from the followed
+    side ``pk_set`` holds the readers, except for ``clear`` where they
+    are looked up before the rows go.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_subscription_ids([instance.pk])
+    elif action in ("post_add", "post_remove"):
+        invalidate_subscription_ids(pk_set)
+    elif action == "pre_clear":
+        target = (
+            "journalist_id" if sender is JournalistSubscription
+            else "publishing_house_id"
+        )
+        invalidate_subscription_ids(
+            sender.objects.filter(
+                **{target: instance.pk}
+            ).values_list("reader_id", flat=True)
+        )
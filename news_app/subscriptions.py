@@ -0,0 +1,144 @@
+"""
+Reader subscriptions to publishing houses and journalists.
+
+Each reader's subscribed ids are cached as one small entry and dropped
+whenever a subscription row changes (see ``signals.py``), so building a
+feed needs no subscription query at all. The reverse direction, readers
+of an approved article, uses the ``(target, reader)`` indexes of the
+through tables.
+"""
+from collections import defaultdict
+from typing import NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from .models import (
+    CustomUser,
+    JournalistSubscription,
+    PublishingHouseSubscription,
+)
+
+JOURNALISTS = "journalists"
+PUBLISHING_HOUSES = "publishing-houses"
+
+# Subscription kind -> (through model, id field of the followed object).
+KINDS = {
+    JOURNALISTS: (JournalistSubscription, "journalist_id"),
+    PUBLISHING_HOUSES: (PublishingHouseSubscription, "publishing_house_id"),
+}
+
+
+class SubscriptionIds(NamedTuple):
+    """Ids a reader follows."""
+    journalists: frozenset
+    publishing_houses: frozenset
+
+
+def subscription_cache_key(reader_id):
+    """Cache key of a reader's subscribed ids."""
+    return f"subscriptions:{reader_id}"
+
+
+def subscription_ids(reader):
+    """The reader's subscribed journalist and house ids, cached."""
+    key = subscription_cache_key(reader.pk)
+    ids = cache.get(key)
+    if ids is None:
+        ids = SubscriptionIds(
+            journalists=frozenset(
+                JournalistSubscription.objects.filter(
+                    reader_id=reader.pk
+                ).values_list("journalist_id", flat=True)
+            ),
+            publishing_houses=frozenset(
+                PublishingHouseSubscription.objects.filter(
+                    reader_id=reader.pk
+                ).values_list("publishing_house_id", flat=True)
+            ),
+        )
+        cache.set(key, ids, settings.SUBSCRIPTION_CACHE_SECONDS)
+    return ids
+
+
+async def asubscription_ids(reader):
+    """Async ``subscription_ids``; the database is only read on a miss."""
+    ids = await cache.aget(subscription_cache_key(reader.pk))
+    if ids is None:
+        ids = await sync_to_async(subscription_ids)(reader)
+    return ids
+
+
+def invalidate_subscription_ids(reader_ids):
+    """Forget the cached subscription ids of ``reader_ids``."""
+    cache.delete_many([
+        subscription_cache_key(reader_id) for reader_id in reader_ids
+    ])
+
+
+def subscribe(reader, kind, target_id):
+    """Follow a journalist or house; return True if it is new."""
+    model, field = KINDS[kind]
+    _, created = model.objects.get_or_create(
+        reader_id=reader.pk, **{field: target_id}
+    )
+    return created
+
+
+def unsubscribe(reader, kind, target_id):
+    """Stop following a journalist or house; return True if followed."""
+    model, field = KINDS[kind]
+    deleted, _ = model.objects.filter(
+        reader_id=reader.pk, **{field: target_id}
+    ).delete()
+    return bool(deleted)
+
+
+def subscribed_readers(article, include_house=True):
+    """Return the readers subscribed to the article's author or house.
+
+    ``include_house=False`` limits the result to followers of the
+    journalist.
+    """
+    condition = Q(id__in=JournalistSubscription.objects.filter(
+        journalist_id=article.journalist_id
+    ).values("reader_id"))
+    if include_house and article.publishing_house_id:
+        condition |= Q(id__in=PublishingHouseSubscription.objects.filter(
+            publishing_house_id=article.publishing_house_id
+        ).values("reader_id"))
+    return CustomUser.objects.filter(role="reader").filter(condition)
+
+
+def articles_by_subscriber(articles):
+    """Group ``articles`` by the email of every reader subscribed to them.
+
+    Returns ``{email: [article, ...]}`` built from two joins (house and
+    journalist subscriptions), whatever the number of articles.
+    """
+    by_house = defaultdict(list)
+    by_journalist = defaultdict(list)
+    for article in articles:
+        if article.publishing_house_id:
+            by_house[article.publishing_house_id].append(article)
+        by_journalist[article.journalist_id].append(article)
+
+    grouped = defaultdict(dict)
+    for model, field, targets in (
+        (PublishingHouseSubscription, "publishing_house_id", by_house),
+        (JournalistSubscription, "journalist_id", by_journalist),
+    ):
+        for email, target_id in model.objects.filter(
+            reader__role="reader",
+            **{f"{field}__in": list(targets)}
+        ).exclude(reader__email="").values_list(
+            "reader__email", field
+        ).iterator():
+            for article in targets[target_id]:
+                grouped[email][article.id] = article
+
+    return {
+        email: list(found.values()) for email, found in grouped.items()
+    }
@@ -0,0 +1,26 @@
+"""
+Template tags that render cached per-article fragments.
+
+    {% article_cards articles as cards %}
+    {% for article, card in cards %}...{{ card }}...{% endfor %}
+
+    {% article_body article %}
+"""
+from django import template
+
+from news_app.caching import render_article_fragments
+
+register = template.Library()
+
+
+@register.simple_tag
+def article_cards(articles):
+    """``(article, card_html)`` pairs for a page of articles."""
+    articles = list(articles)
+    return list(zip(articles, render_article_fragments("card", articles)))
+
+
+@register.simple_tag
+def article_body(article):
+    """The cached title and content block of the detail page."""
+    return render_article_fragments("body", [article])[0]
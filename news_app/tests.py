@@ -1,8 +1,71 @@
 """Unit tests for user registration, role assignment, and article workflow. """
-from django.test import TestCase
+import asyncio
+import contextlib
+import csv
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core import mail
+from django.core.management import CommandError, call_command
+from django.core.cache import cache, caches
+from django.db import connection, connections
+from django.db.backends.sqlite3 import base as sqlite3_base
+from django.db.utils import ConnectionHandler
+from django.test import (
+    AsyncClient,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from django.http import HttpResponse
 from django.urls import reverse
-from .models import Article
+from django.utils import timezone
+from . import (
+    assets,
+    backends,
+    caching,
+    feeds,
+    notifications,
+    pool,
+    publishers,
+    reviews,
+    routers,
+    scheduling,
+    subscriptions,
+)
+from .metrics import REGISTRY, render_prometheus
+from .mailer import BulkMailer
+from .pagination import paginate_articles
+from .search import get_search_backend
+from .api.serializers import ArticleListSerializer
+from .benchmarks.runner import BenchmarkRunner
+from .exports import ArticleExport
+from .management.commands.run_publish_scheduler import (
+    Command as PublishSchedulerCommand,
+)
+from .models import (
+    Article,
+    FeedEntry,
+    ImportCheckpoint,
+    NotificationJob,
+    PublishingHouse,
+)
 
 User = get_user_model()
 
@@ -76,3 +139,1901 @@ class ArticleWorkflowTest(TestCase):
         article.save()
 
         self.assertTrue(article.approved)
+
+
+@override_settings(NOTIFICATION_CHANNELS=["email", "x"],
+                   NOTIFICATION_MAX_ATTEMPTS=2)
+class NotificationOutboxTest(TestCase):
+    """Tests for the article approval notification outbox."""
+    def setUp(self):
+        self.journalist = User.objects.create_user(
+            username='outbox_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.article = Article.objects.create(
+            title='Outbox Article',
+            content='Outbox content',
+            journalist=self.journalist
+        )
+
+    def test_approval_enqueues_one_job_per_channel(self):
+        """Test that approving queues jobs once, however often it's saved."""
+        self.assertFalse(NotificationJob.objects.exists())
+
+        self.article.approved = True
+        self.article.save()
+        self.article.save()
+
+        self.assertEqual(
+            sorted(self.article.notification_jobs.values_list(
+                'channel', flat=True)),
+            ['email', 'x']
+        )
+
+    def test_worker_retries_then_gives_up(self):
+        """Test that a failing channel is retried and finally marked failed."""
+        self.article.approved = True
+        self.article.save()
+        failing = mock.Mock(side_effect=RuntimeError('smtp down'))
+        sent = mock.Mock()
+
+        with mock.patch.dict(notifications.CHANNEL_HANDLERS,
+                             {'email': failing, 'x': sent}):
+            for job_id in notifications.claim_due_jobs(10, 'worker'):
+                notifications.run_job(job_id, 'worker')
+
+            email_job = self.article.notification_jobs.get(channel='email')
+            self.assertEqual(email_job.status, NotificationJob.STATUS_PENDING)
+            self.assertEqual(notifications.claim_due_jobs(10, 'worker'), [])
+
+            email_job.available_at = email_job.created_at
+            email_job.save()
+            for job_id in notifications.claim_due_jobs(10, 'worker'):
+                notifications.run_job(job_id, 'worker')
+
+        statuses = dict(self.article.notification_jobs.values_list(
+            'channel', 'status'))
+        self.assertEqual(statuses['email'], NotificationJob.STATUS_FAILED)
+        self.assertEqual(statuses['x'], NotificationJob.STATUS_DONE)
+        sent.assert_called_once()
+
+    @override_settings(NOTIFICATION_LEASE_TIMEOUT=60)
+    def test_job_whose_lease_passed_to_another_worker_is_not_run_twice(self):
+        """Test that a stale worker neither delivers nor records a job."""
+        self.article.approved = True
+        self.article.save()
+        handler = mock.Mock()
+        job = self.article.notification_jobs.get(channel='email')
+        notifications.claim_due_jobs(10, 'slow')
+        NotificationJob.objects.filter(id=job.id).update(
+            locked_at=timezone.now() - timedelta(seconds=120)
+        )
+        notifications.release_stale_jobs()
+        notifications.claim_due_jobs(10, 'fast')
+
+        with mock.patch.dict(notifications.CHANNEL_HANDLERS,
+                             {'email': handler}):
+            self.assertIsNone(notifications.run_job(job.id, 'slow'))
+            handler.assert_not_called()
+
+            self.assertEqual(notifications.run_job(job.id, 'fast'),
+                             NotificationJob.STATUS_DONE)
+            handler.assert_called_once()
+
+    def test_partly_failed_email_is_retried_for_the_rest_only(self):
+        """Test that a retry only emails the readers that failed before."""
+        for name in ('lucky', 'unlucky'):
+            reader = User.objects.create_user(
+                username=name,
+                email=f'{name}@example.com',
+                password='password123',
+                role='reader'
+            )
+            reader.subscribed_journalists.add(self.journalist)
+        self.article.approved = True
+        self.article.save()
+        job = self.article.notification_jobs.get(channel='email')
+        backend = mail.get_connection()
+        send_messages = type(backend).send_messages
+
+        def flaky(connection, messages):
+            if messages[0].to == ['unlucky@example.com']:
+                raise RuntimeError('smtp down')
+            return send_messages(connection, messages)
+
+        notifications.claim_due_jobs(10, 'worker')
+        with mock.patch.object(type(backend), 'send_messages', flaky):
+            notifications.run_job(job.id, 'worker')
+        job.refresh_from_db()
+        self.assertEqual(job.status, NotificationJob.STATUS_PENDING)
+        self.assertEqual(job.payload, {'emails': ['unlucky@example.com']})
+        self.assertEqual([message.to for message in mail.outbox],
+                         [['lucky@example.com']])
+
+        job.available_at = timezone.now()
+        job.save()
+        notifications.claim_due_jobs(10, 'worker')
+        notifications.run_job(job.id, 'worker')
+        job.refresh_from_db()
+        self.assertEqual(job.status, NotificationJob.STATUS_DONE)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         ['lucky@example.com', 'unlucky@example.com'])
+
+
+class StubXHandler(BaseHTTPRequestHandler):
+    """Answers with the server's scripted responses, recording requests."""
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Record the request and play back the next scripted response."""
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append((dict(self.headers), json.loads(body)))
+        status, headers = self.server.script.pop(0)
+        time.sleep(self.server.delay)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{"data": {"id": "1"}}')
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@override_settings(NOTIFICATION_CHANNELS=["x"])
+class XPublisherTest(TestCase):
+    """Tests for the X publisher against a local stub of the API."""
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubXHandler)
+        self.server.script, self.server.received = [], []
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def publisher(self, **options):
+        """A publisher for the stub with fast retries."""
+        options = {
+            'credentials': ('key', 'secret', 'token', 'token-secret'),
+            'base_url': self.url, 'timeout': 5, 'queue_size': 10,
+            'max_retries': 2, 'backoff_base': 0.001, 'backoff_max': 0.01,
+            'breaker': publishers.CircuitBreaker(5, 60),
+            'max_rate_limit_wait': 0, **options,
+        }
+        return publishers.XPublisher(**options)
+
+    def x_job(self):
+        """The X notification job of a newly approved article."""
+        journalist = User.objects.create_user(
+            username='x_journalist', password='password123',
+            role='journalist'
+        )
+        article = Article.objects.create(
+            title='Breaking', content='Content', journalist=journalist
+        )
+        article.approved = True
+        article.save()
+        return article.notification_jobs.get(channel='x')
+
+    def run_x_job(self, job, max_wait):
+        """Deliver ``job`` through a fresh publisher aimed at the stub."""
+        with override_settings(X_API_URL=self.url), \
+                mock.patch.object(publishers, '_publisher', None), \
+                mock.patch.object(
+                    publishers.XPublisher, 'max_wait', max_wait):
+            notifications.claim_due_jobs(10, 'worker')
+            notifications.run_job(job.id, 'worker')
+            publisher = publishers.get_x_publisher()
+        publisher.queue.join()
+        job.refresh_from_db()
+        return publisher
+
+    def test_server_errors_are_retried_until_the_post_succeeds(self):
+        """Test that a 503 is retried and the post is signed."""
+        self.server.script = [(503, {}), (201, {})]
+
+        result = self.publisher().submit('Hello').result(timeout=5)
+
+        self.assertEqual(result, {'data': {'id': '1'}})
+        self.assertEqual(len(self.server.received), 2)
+        headers, body = self.server.received[-1]
+        self.assertEqual(body, {'text': 'Hello'})
+        self.assertTrue(headers['Authorization'].startswith('OAuth '))
+        self.assertIn('oauth_signature=', headers['Authorization'])
+
+    def test_circuit_breaker_fails_fast_once_open(self):
+        """Test that repeated failures stop further calls to the API."""
+        self.server.script = [(500, {}), (500, {})]
+        publisher = self.publisher(
+            max_retries=1, breaker=publishers.CircuitBreaker(2, 60)
+        )
+
+        with self.assertRaises(publishers.PublishError):
+            publisher.submit('First').result(timeout=5)
+        with self.assertRaises(publishers.PublisherUnavailable) as raised:
+            publisher.submit('Second')
+
+        self.assertEqual(len(self.server.received), 2)
+        self.assertGreater(raised.exception.retry_at, time.time() + 50)
+
+    def test_unreachable_api_is_retried(self):
+        """Test that a refused connection, which sent nothing, is retried."""
+        self.server.server_close()
+        publisher = self.publisher(max_retries=1)
+
+        with self.assertRaises(publishers.PublishError):
+            publisher.submit('Hello').result(timeout=5)
+
+        self.assertEqual(publisher.breaker.failures, 2)
+
+    def test_read_timeout_is_not_retried(self):
+        """Test that a request that may have been posted is not re-sent."""
+        self.server.delay = 0.3
+        self.server.script = [(201, {}), (201, {})]
+        publisher = self.publisher(timeout=0.1)
+
+        with self.assertRaises(publishers.PostInFlight):
+            publisher.submit('Hello').result(timeout=5)
+
+        time.sleep(0.4)
+        self.assertEqual(len(self.server.received), 1)
+
+    def test_rate_limited_job_waits_for_the_reset_time(self):
+        """Test that a 429 reschedules the job for the reported reset."""
+        job = self.x_job()
+        reset = int(time.time()) + 900
+        self.server.script = [(429, {'x-rate-limit-reset': str(reset)})]
+
+        publisher = self.run_x_job(job, max_wait=5)
+
+        self.assertRaises(
+            publishers.PublisherUnavailable, publisher.submit, 'Again'
+        )
+        self.assertEqual(job.status, NotificationJob.STATUS_PENDING)
+        self.assertEqual(job.available_at.timestamp(), reset)
+        self.assertEqual(len(self.server.received), 1)
+
+    def test_slow_post_is_awaited_instead_of_retried(self):
+        """Test that a post already being sent is waited for."""
+        self.server.delay = 0.3
+        self.server.script = [(201, {})]
+        job = self.x_job()
+
+        self.run_x_job(job, max_wait=0.2)
+
+        self.assertEqual(job.status, NotificationJob.STATUS_DONE)
+        self.assertEqual(len(self.server.received), 1)
+
+    def test_post_outliving_its_job_is_not_retried(self):
+        """Test that an in-flight post fails the job instead of retrying."""
+        self.server.delay = 0.3
+        self.server.script = [(201, {})]
+        job = self.x_job()
+
+        self.run_x_job(job, max_wait=0.05)
+
+        self.assertEqual(job.status, NotificationJob.STATUS_FAILED)
+        self.assertIn('PostInFlight', job.last_error)
+        self.assertEqual(len(self.server.received), 1)
+
+
+@override_settings(NOTIFICATION_CHANNELS=["email"], CACHE_SHARED=True)
+class ScheduledPublishingTest(TestCase):
+    """Tests for embargoed articles and the publish scheduler."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='embargo_journalist', password='password123',
+            role='journalist'
+        )
+        now = timezone.now()
+        self.due = [
+            self.approve(f'Due {number}', now - timedelta(minutes=1))
+            for number in range(3)
+        ]
+        self.later = self.approve('Later', now + timedelta(hours=1))
+
+    def approve(self, title, publish_at):
+        """An article approved with an embargo."""
+        article = Article.objects.create(
+            title=title, content='Embargoed content',
+            journalist=self.journalist, publish_at=publish_at
+        )
+        article.approved = True
+        article.save()
+        return article
+
+    def test_embargoed_articles_are_hidden_and_not_announced(self):
+        """Test that approval alone neither shows nor announces them."""
+        response = self.client.get(reverse('article_list'))
+        detail = self.client.get(
+            reverse('article_detail', args=[self.due[0].id])
+        )
+
+        self.assertEqual(list(response.context['articles']), [])
+        self.assertEqual(detail.status_code, 404)
+        self.assertFalse(NotificationJob.objects.exists())
+        self.assertEqual(
+            scheduling.next_publish_time(), self.due[0].publish_at
+        )
+
+    @override_settings(CACHE_SHARED=False)
+    def test_scheduler_refuses_a_process_local_cache(self):
+        """Test that the scheduler will not run on a per-process cache."""
+        with self.assertRaises(CommandError):
+            call_command('run_publish_scheduler', '--once')
+
+        self.assertFalse(Article.objects.filter(
+            publish_at__isnull=True, approved=True).exists())
+
+    def test_scheduler_publishes_due_articles_and_notifies_once(self):
+        """Test that due articles go live in batches with one digest."""
+        self.client.get(reverse('article_list'))
+
+        call_command('run_publish_scheduler', '--once', stdout=io.StringIO())
+        call_command('run_publish_scheduler', '--once', stdout=io.StringIO())
+
+        response = self.client.get(reverse('article_list'))
+        self.assertEqual(
+            {article.title for article in response.context['articles']},
+            {'Due 0', 'Due 1', 'Due 2'}
+        )
+        job = NotificationJob.objects.get()
+        self.assertEqual(job.channel, 'email_digest')
+        self.assertEqual(
+            sorted(job.payload['article_ids']),
+            [article.id for article in self.due]
+        )
+        self.assertEqual(
+            scheduling.next_publish_time(), self.later.publish_at
+        )
+
+    def test_scheduler_wakes_when_an_article_is_scheduled(self):
+        """Test that the scheduler's sleep ends when the schedule changes."""
+        scheduling.publish_due(100)
+
+        def schedule(seconds):
+            if sleep.call_count > 1:
+                raise AssertionError('The scheduler did not wake up')
+            self.approve('Sooner', timezone.now() + timedelta(minutes=5))
+
+        with mock.patch('time.sleep', side_effect=schedule) as sleep:
+            PublishSchedulerCommand.wait(max_sleep=300)
+
+        sleep.assert_called_once()
+
+
+class BulkMailerTest(TestCase):
+    """Tests for chunked subscriber email delivery."""
+    def setUp(self):
+        for number in range(5):
+            User.objects.create_user(
+                username=f'reader{number}',
+                email=f'reader{number}@example.com',
+                password='password123',
+                role='reader'
+            )
+        User.objects.create_user(
+            username='no_email_reader',
+            password='password123',
+            role='reader'
+        )
+
+    def test_sends_individual_messages_in_chunks(self):
+        """Test that every reader gets their own message, in chunks."""
+        mailer = BulkMailer('Subject', 'Body', chunk_size=2)
+
+        report = mailer.send(User.objects.filter(role='reader'))
+
+        self.assertEqual(len(report.batches), 3)
+        self.assertEqual((report.sent, report.failed), (5, 0))
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertTrue(all(len(message.to) == 1 for message in mail.outbox))
+
+
+@override_settings(ARTICLES_PAGE_SIZE=2)
+class KeysetPaginationTest(TestCase):
+    """Tests for cursor pagination of approved articles."""
+    def setUp(self):
+        journalist = User.objects.create_user(
+            username='paged_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.articles = [
+            Article.objects.create(
+                title=f'Article {number}',
+                content='Content',
+                journalist=journalist,
+                approved=True
+            )
+            for number in range(5)
+        ]
+
+    def test_walks_forwards_and_back(self):
+        """Test that next/prev cursors visit every article exactly once."""
+        queryset = Article.objects.all()
+        newest_first = self.articles[::-1]
+
+        first = paginate_articles(queryset)
+        second = paginate_articles(queryset, first.next_cursor)
+        third = paginate_articles(queryset, second.next_cursor)
+
+        self.assertEqual(first.items + second.items + third.items,
+                         newest_first)
+        self.assertIsNone(first.prev_cursor)
+        self.assertIsNone(third.next_cursor)
+        self.assertEqual(
+            paginate_articles(queryset, second.prev_cursor).items,
+            first.items
+        )
+
+    def test_article_list_links_to_older_page(self):
+        """Test that the article list renders one page and an older link."""
+        response = self.client.get(reverse('article_list'))
+
+        self.assertEqual(len(response.context['articles']), 2)
+        self.assertContains(response, response.context['page'].next_cursor)
+
+
+@override_settings(FEED_MODE="write", NOTIFICATION_CHANNELS=["email"],
+                   ARTICLES_PAGE_SIZE=2)
+class MaterializedFeedTest(TestCase):
+    """Tests for fan-out-on-write reader feeds."""
+    def setUp(self):
+        self.reader = User.objects.create_user(
+            username='feed_reader',
+            password='password123',
+            role='reader'
+        )
+        self.journalist = User.objects.create_user(
+            username='feed_journalist',
+            password='password123',
+            role='journalist'
+        )
+        cache.set(feeds.LARGE_HOUSES_CACHE_KEY, set())
+        self.addCleanup(cache.delete, feeds.LARGE_HOUSES_CACHE_KEY)
+
+    def test_approval_queues_feed_fan_out(self):
+        """Test that feed mode adds a fan-out job to the outbox."""
+        article = Article.objects.create(
+            title='Fan out',
+            content='Content',
+            journalist=self.journalist,
+            approved=True
+        )
+
+        self.assertEqual(
+            sorted(article.notification_jobs.values_list(
+                'channel', flat=True)),
+            ['email', 'feed']
+        )
+
+    def test_feed_pages_newest_first(self):
+        """Test that a stored feed is paged newest first."""
+        articles = []
+        for number in range(3):
+            article = Article.objects.create(
+                title=f'Feed {number}',
+                content='Content',
+                journalist=self.journalist,
+                approved=True
+            )
+            FeedEntry.objects.create(
+                reader=self.reader,
+                article=article,
+                created_at=article.created_at
+            )
+            articles.append(article)
+
+        first = feeds.reader_feed_page(self.reader)
+        second = feeds.reader_feed_page(self.reader, first.next_cursor)
+
+        self.assertEqual(first.items, articles[:0:-1])
+        self.assertEqual(second.items, articles[:1])
+
+    def test_feeds_follow_subscriptions_and_article_state(self):
+        """Test backfill on follow, pruning on unfollow and hiding
+        articles that stop being public."""
+        house = PublishingHouse.objects.create(name='Feed House')
+        kept, dropped = [
+            Article.objects.create(
+                title=title, content='Content', journalist=self.journalist,
+                publishing_house=house if title == 'Kept' else None,
+                approved=True
+            )
+            for title in ('Kept', 'Dropped')
+        ]
+
+        subscriptions.subscribe(
+            self.reader, subscriptions.JOURNALISTS, self.journalist.id
+        )
+        house.subscribers.add(self.reader)
+        self.assertEqual(
+            set(feeds.reader_feed_page(self.reader).items), {kept, dropped}
+        )
+
+        subscriptions.unsubscribe(
+            self.reader, subscriptions.JOURNALISTS, self.journalist.id
+        )
+        self.assertEqual(feeds.reader_feed_page(self.reader).items, [kept])
+
+        kept.approved = False
+        kept.save()
+        self.assertEqual(feeds.reader_feed_page(self.reader).items, [])
+
+
+class ArticleSearchTest(TestCase):
+    """Tests for full-text article search."""
+    def setUp(self):
+        journalist = User.objects.create_user(
+            username='search_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.body_match = Article.objects.create(
+            title='Council meeting',
+            content='The budget for the harbour was approved.',
+            journalist=journalist,
+            approved=True
+        )
+        self.title_match = Article.objects.create(
+            title='Harbour budget doubles',
+            content='Officials confirmed the figures.',
+            journalist=journalist,
+            approved=True
+        )
+        self.pending = Article.objects.create(
+            title='Harbour leak',
+            content='Not yet approved.',
+            journalist=journalist
+        )
+
+    def test_ranks_title_matches_first_and_hides_pending(self):
+        """Test that results are ranked and limited to approved articles."""
+        backend = get_search_backend()
+
+        self.assertEqual(
+            backend.search('harbour'),
+            [self.title_match.id, self.body_match.id]
+        )
+        self.assertIn(
+            self.pending.id, backend.search('harbour', approved_only=False)
+        )
+
+    def test_index_follows_edits_and_deletes(self):
+        """Test that saving and deleting articles updates the index."""
+        backend = get_search_backend()
+        self.body_match.content = 'Nothing about boats.'
+        self.body_match.save()
+        self.title_match.delete()
+
+        self.assertEqual(backend.search('harbour'), [])
+
+    def test_search_endpoint(self):
+        """Test that the search API returns ranked, serialized articles."""
+        response = self.client.get(
+            reverse('api_article_search'), {'q': 'harb'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [article['id'] for article in response.json()['results']],
+            [self.title_match.id, self.body_match.id]
+        )
+
+
+class PageCacheTest(TestCase):
+    """Tests for cached public article pages."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='cache_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.article = Article.objects.create(
+            title='Breaking story',
+            content='First draft',
+            journalist=self.journalist,
+            approved=True
+        )
+
+    def test_repeat_hits_skip_the_database(self):
+        """Test that a cached detail page is served without queries."""
+        url = reverse('article_detail', args=[self.article.id])
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertContains(response, 'First draft')
+        self.assertEqual(caching.stats(), {'hits': 1, 'misses': 1})
+
+    def test_edit_and_approval_invalidate_pages(self):
+        """Test that edits and new approvals show up immediately."""
+        self.client.get(reverse('article_detail', args=[self.article.id]))
+        self.client.get(reverse('article_list'))
+
+        self.article.content = 'Corrected text'
+        self.article.save()
+        Article.objects.create(
+            title='Second story',
+            content='More news',
+            journalist=self.journalist,
+            approved=True
+        )
+
+        self.assertContains(
+            self.client.get(
+                reverse('article_detail', args=[self.article.id])),
+            'Corrected text'
+        )
+        self.assertContains(
+            self.client.get(reverse('article_list')), 'Second story'
+        )
+
+    def test_unapproval_removes_article_from_cached_lists(self):
+        """Test that an unapproved article leaves the cached list."""
+        self.assertContains(
+            self.client.get(reverse('article_list')), 'Breaking story'
+        )
+
+        self.article.approved = False
+        self.article.save()
+
+        self.assertNotContains(
+            self.client.get(reverse('article_list')), 'Breaking story'
+        )
+
+
+class ArticleFragmentCacheTest(TestCase):
+    """Tests for cached per-article template fragments."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='fragment_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.article = Article.objects.create(
+            title='Shared card',
+            content='Rendered once',
+            journalist=self.journalist,
+            approved=True
+        )
+        self.client.force_login(self.journalist)
+
+    @staticmethod
+    def rendered(response, name):
+        """How many times template ``name`` was rendered for a response."""
+        return [template.name for template in response.templates].count(name)
+
+    def test_cards_are_shared_across_pages(self):
+        """Test that the list and the dashboard reuse one rendered card."""
+        first = self.client.get(reverse('article_list'))
+        second = self.client.get(reverse('journalist_dashboard'))
+
+        card = 'news_app/_article_card.html'
+        self.assertEqual(self.rendered(first, card), 1)
+        self.assertEqual(self.rendered(second, card), 0)
+        self.assertContains(second, 'Shared card')
+
+    def test_saving_an_article_renders_a_fresh_fragment(self):
+        """Test that edits invalidate the fragments of pending articles."""
+        self.article.approved = False
+        self.article.save()
+        self.client.get(reverse('journalist_dashboard'))
+
+        self.article.title = 'Edited card'
+        self.article.save()
+
+        self.assertContains(
+            self.client.get(reverse('journalist_dashboard')), 'Edited card'
+        )
+
+
+class ArticleListSerializationTest(TestCase):
+    """Tests for the compact, single-query list serializer."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='list_journalist',
+            password='password123',
+            role='journalist'
+        )
+
+    def create_articles(self, count):
+        """Create ``count`` approved articles mentioning 'election'."""
+        for number in range(count):
+            Article.objects.create(
+                title=f'Election update {number}',
+                content='Election ' + 'results are in. ' * 100,
+                journalist=self.journalist,
+                approved=True
+            )
+
+    def test_list_payload_uses_excerpt(self):
+        """Test that list payloads carry the excerpt, not the content."""
+        self.create_articles(1)
+        queryset = ArticleListSerializer.optimize_queryset(
+            Article.objects.all()
+        )
+
+        with self.assertNumQueries(1):
+            data = ArticleListSerializer(queryset, many=True).data
+
+        self.assertNotIn('content', data[0])
+        self.assertEqual(data[0]['journalist'], 'list_journalist')
+        self.assertLessEqual(len(data[0]['excerpt']), 300)
+
+    def test_query_count_is_independent_of_page_size(self):
+        """Test that a bigger result page costs no extra queries."""
+        url = reverse('api_article_search')
+        self.create_articles(2)
+        with self.assertNumQueries(2):
+            self.client.get(url, {'q': 'election'})
+
+        self.create_articles(8)
+        cache.clear()
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {'q': 'election'})
+        self.assertEqual(len(response.json()['results']), 10)
+
+
+class ArticleDerivedFieldsTest(TestCase):
+    """Tests for fields computed from the content at write time."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='derived_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.article = Article.objects.create(
+            title='Long read',
+            content='<b>First</b> paragraph ' + 'word ' * 400 +
+                    '\n\nSecond paragraph',
+            journalist=self.journalist,
+            approved=True
+        )
+
+    def test_fields_are_computed_on_save_and_lists_skip_content(self):
+        """Test the stored values and that pages never load the body."""
+        self.assertEqual(self.article.word_count, 404)
+        self.assertEqual(self.article.reading_minutes, 3)
+        self.assertIn('&lt;b&gt;First&lt;/b&gt;', self.article.body_html)
+        self.assertEqual(self.article.body_html.count('<p>'), 2)
+
+        with CaptureQueriesContext(connection) as queries:
+            listing = self.client.get(reverse('article_list'))
+            detail = self.client.get(
+                reverse('article_detail', args=[self.article.id])
+            )
+        self.assertContains(listing, '3 min read')
+        self.assertContains(detail, '<p>Second paragraph</p>', html=True)
+        for query in queries:
+            self.assertNotIn('"content"', query['sql'])
+
+    def test_backfill_fills_existing_rows(self):
+        """Test that the backfill command recomputes unfilled rows."""
+        Article.objects.update(body_html='', word_count=0)
+
+        call_command(
+            'backfill_article_fields', batch_size=1, stdout=io.StringIO()
+        )
+
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 404)
+        self.assertIn('<p>Second paragraph</p>', self.article.body_html)
+
+
+@override_settings(ARTICLES_PAGE_SIZE=5)
+class JournalistDashboardTest(TestCase):
+    """Tests for the paginated journalist dashboard and its aggregates."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='dashboard_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.client.force_login(self.journalist)
+
+    def write(self, count, **fields):
+        """Create ``count`` articles by the journalist."""
+        for number in range(count):
+            Article.objects.create(
+                title=f'Piece {number}',
+                content='Text',
+                journalist=self.journalist,
+                **fields
+            )
+
+    def queries_for_dashboard(self):
+        """Render the dashboard; return the response and query count."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('journalist_dashboard'))
+        return response, len(queries)
+
+    def test_counts_months_and_first_page(self):
+        """Test the status counts, monthly output and page size."""
+        self.write(4, approved=True)
+        self.write(2)
+        self.write(1, rejected=True)
+        Article.objects.filter(title='Piece 3', approved=True).update(
+            created_at=timezone.now() - timedelta(days=400)
+        )
+
+        response, _ = self.queries_for_dashboard()
+
+        self.assertEqual(response.context['counts'], {
+            'total': 7, 'approved': 4, 'pending': 2, 'rejected': 1,
+        })
+        months = response.context['months']
+        self.assertEqual(len(months), settings.DASHBOARD_MONTHS)
+        self.assertEqual(months[0][1], 6)
+        self.assertEqual(len(response.context['articles']), 5)
+        self.assertIsNotNone(response.context['page'].next_cursor)
+
+    def test_query_count_is_independent_of_archive_size(self):
+        """Test that a large archive costs no extra queries."""
+        self.write(3)
+        self.queries_for_dashboard()  # loads the session into the cache
+        _, small = self.queries_for_dashboard()
+        self.write(40, approved=True)
+        _, large = self.queries_for_dashboard()
+
+        self.assertEqual(small, large)
+
+
+@override_settings(EXPORT_CHUNK_SIZE=2)
+class ArticleExportTest(TestCase):
+    """Tests for the streaming article export."""
+    def setUp(self):
+        journalist = User.objects.create_user(
+            username='export_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.articles = [
+            Article.objects.create(
+                title=f'Export {number}',
+                content='Body',
+                journalist=journalist,
+                approved=number != 4
+            )
+            for number in range(5)
+        ]
+
+    def test_command_exports_incrementally(self):
+        """Test that --since/--after-id resumes after the last export."""
+        last = self.articles[1]
+        stderr = io.StringIO()
+        output = os.path.join(tempfile.mkdtemp(), 'export.ndjson.gz')
+        self.addCleanup(os.remove, output)
+
+        call_command(
+            'export_articles', '--gzip', '--output', output,
+            '--since', last.updated_at.isoformat(),
+            '--after-id', str(last.id),
+            stderr=stderr,
+        )
+
+        with gzip.open(output, 'rt') as export:
+            rows = [json.loads(line) for line in export]
+        self.assertEqual([row['title'] for row in rows],
+                         ['Export 2', 'Export 3'])
+        self.assertIn(f'--after-id {self.articles[3].id}', stderr.getvalue())
+
+    def test_articles_approved_after_an_export_are_exported_next_time(self):
+        """Test that approving an older article moves it past the cursor."""
+        older = self.articles[0]
+        Article.objects.filter(id=older.id).update(approved=False)
+        first = ArticleExport()
+        self.assertNotIn(older.id, [row['id'] for row in first.rows()])
+
+        older.approved = True
+        older.save()
+        since, after_id = first.last_key
+        rows = list(ArticleExport(since=since, after_id=after_id).rows())
+
+        self.assertEqual([row['id'] for row in rows], [older.id])
+
+    def test_embargoed_articles_are_exported_only_on_request(self):
+        """Test that embargoed articles stay out of default exports."""
+        embargoed = self.articles[1]
+        embargoed.publish_at = timezone.now() + timedelta(hours=1)
+        embargoed.save()
+
+        published = [row['id'] for row in ArticleExport().rows()]
+        everything = {
+            row['id']: row for row in ArticleExport(approved_only=False).rows()
+        }
+
+        self.assertNotIn(embargoed.id, published)
+        self.assertEqual(
+            everything[embargoed.id]['publish_at'],
+            embargoed.publish_at.isoformat()
+        )
+
+    def test_api_streams_csv_to_staff_only(self):
+        """Test that the export endpoint streams CSV for staff users."""
+        url = reverse('api_article_export')
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        User.objects.create_user(
+            username='analyst',
+            password='password123',
+            role='reader',
+            is_staff=True
+        )
+        self.client.login(username='analyst', password='password123')
+        response = self.client.get(url, {'export_format': 'csv'})
+        body = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0]['journalist'], 'export_journalist')
+
+        invalid = self.client.get(url, {'after_id': 'last'})
+        self.assertEqual(invalid.status_code, 400)
+        self.assertEqual(list(invalid.json()), ['after_id'])
+
+
+class ArticleImportTest(TestCase):
+    """Tests for the bulk article import command."""
+    def setUp(self):
+        User.objects.create_user(
+            username='archive_journalist',
+            password='password123',
+            role='journalist'
+        )
+        PublishingHouse.objects.create(name='Daily Archive')
+        rows = [
+            {
+                'title': f'Archived {number}',
+                'content': 'From the archive',
+                'journalist': 'archive_journalist',
+                'publishing_house': 'Daily Archive',
+                'approved': True,
+                'created_at': f'2019-01-0{number + 1}T08:00:00+00:00',
+            }
+            for number in range(4)
+        ]
+        rows.insert(2, {'title': 'Orphan', 'journalist': 'nobody'})
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, 'archive.jsonl')
+        with open(self.path, 'w', encoding='utf-8') as source:
+            source.writelines(json.dumps(row) + '\n' for row in rows)
+        self.addCleanup(os.remove, self.path)
+
+    def test_imports_in_batches_without_notifications(self):
+        """Test that rows are bulk inserted with their original dates."""
+        call_command('import_articles', self.path, '--batch-size', '2',
+                     stdout=io.StringIO())
+
+        self.assertEqual(Article.objects.count(), 4)
+        self.assertFalse(NotificationJob.objects.exists())
+        first = Article.objects.get(title='Archived 0')
+        self.assertEqual(first.created_at.year, 2019)
+        self.assertEqual(first.excerpt, 'From the archive')
+        self.assertEqual(len(get_search_backend().search('archived')), 4)
+
+    def test_resume_skips_committed_rows(self):
+        """Test that --resume continues after the last checkpoint."""
+        ImportCheckpoint.objects.create(source=self.path, rows_done=3)
+
+        call_command('import_articles', self.path, '--resume',
+                     stdout=io.StringIO())
+
+        self.assertEqual(
+            sorted(Article.objects.values_list('title', flat=True)),
+            ['Archived 2', 'Archived 3']
+        )
+
+    def test_checkpoint_commits_with_its_batch(self):
+        """Test that a failed batch rolls back its checkpoint too."""
+        bulk_create = Article.objects.bulk_create
+        calls = []
+
+        def fail_second_batch(articles):
+            calls.append(articles)
+            if len(calls) == 2:
+                raise OSError('disk full')
+            return bulk_create(articles)
+
+        with mock.patch.object(Article.objects, 'bulk_create',
+                               fail_second_batch), \
+                self.assertRaises(CommandError):
+            call_command('import_articles', self.path, '--batch-size', '2',
+                         stdout=io.StringIO())
+        self.assertEqual(
+            ImportCheckpoint.objects.get(source=self.path).rows_done, 2
+        )
+
+        call_command('import_articles', self.path, '--batch-size', '2',
+                     '--resume', stdout=io.StringIO())
+
+        self.assertEqual(Article.objects.count(), 4)
+
+
+@override_settings(NOTIFICATION_CHANNELS=["email"])
+class BulkReviewTest(TestCase):
+    """Tests for bulk approve/reject of pending articles."""
+    def setUp(self):
+        self.house = PublishingHouse.objects.create(name='Morning Post')
+        other_house = PublishingHouse.objects.create(name='Evening Post')
+        self.editor = User.objects.create_user(
+            username='bulk_editor',
+            password='password123',
+            role='editor',
+            publishing_house=self.house
+        )
+        User.objects.filter(pk=self.editor.pk).update(is_active=True)
+        self.journalist = User.objects.create_user(
+            username='bulk_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.pending = [self.create_article(self.house) for _ in range(3)]
+        self.foreign = self.create_article(other_house)
+
+    def create_article(self, house):
+        """Create a pending article in ``house``."""
+        return Article.objects.create(
+            title='Pending story',
+            content='Content',
+            journalist=self.journalist,
+            publishing_house=house
+        )
+
+    def test_dashboard_bulk_approve_is_scoped_and_batched(self):
+        """Test that one POST approves only the editor's own articles."""
+        self.client.force_login(self.editor)
+        ids = [article.id for article in self.pending + [self.foreign]]
+
+        response = self.client.post(reverse('bulk_review_articles'), {
+            'action': 'approve',
+            'article_ids': ids,
+        })
+
+        self.assertRedirects(response, reverse('editor_dashboard'))
+        self.assertEqual(
+            Article.objects.filter(approved=True).count(), 3
+        )
+        self.assertFalse(
+            Article.objects.get(pk=self.foreign.pk).approved
+        )
+        job = NotificationJob.objects.get()
+        self.assertEqual(job.channel, 'email_digest')
+        self.assertEqual(sorted(job.payload['article_ids']),
+                         sorted(article.id for article in self.pending))
+
+    def test_query_count_does_not_grow_with_selection(self):
+        """Test that approving more articles costs no extra queries."""
+        with CaptureQueriesContext(connection) as few:
+            reviews.bulk_review(
+                self.editor, [self.pending[0].id], reviews.APPROVE
+            )
+        more = [self.create_article(self.house).id for _ in range(5)]
+        with CaptureQueriesContext(connection) as many:
+            reviews.bulk_review(self.editor, more, reviews.APPROVE)
+
+        self.assertEqual(len(few), len(many))
+
+    def test_api_rejects_selected_articles(self):
+        """Test that the review API rejects articles for editors."""
+        self.client.force_login(self.editor)
+
+        response = self.client.post(
+            reverse('api_bulk_review'),
+            {'action': 'reject', 'article_ids': [self.pending[0].id]},
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.json(), {'action': 'reject', 'updated': 1})
+        self.assertNotIn(
+            self.pending[0], reviews.pending_for_editor(self.editor)
+        )
+
+
+@override_settings(REVIEW_CLAIM_BATCH=2)
+class ReviewQueueTest(TestCase):
+    """Tests for the claimable editor review queue."""
+    def setUp(self):
+        self.house = PublishingHouse.objects.create(name='Queue Post')
+        self.editors = []
+        for number in range(3):
+            editor = User.objects.create_user(
+                username=f'queue_editor_{number}',
+                password='password123',
+                role='editor',
+                publishing_house=self.house
+            )
+            self.editors.append(editor)
+        journalist = User.objects.create_user(
+            username='queue_journalist',
+            password='password123',
+            role='journalist'
+        )
+        for number in range(5):
+            Article.objects.create(
+                title=f'Queued {number}',
+                content='Content',
+                journalist=journalist,
+                publishing_house=self.house
+            )
+
+    def test_editors_claim_disjoint_batches(self):
+        """Test both claim strategies hand out each article once."""
+        for skip_locked in (False, True):
+            with self.subTest(skip_locked=skip_locked), mock.patch.object(
+                connection.features, 'has_select_for_update_skip_locked',
+                skip_locked
+            ):
+                Article.objects.update(claimed_by=None, claimed_until=None)
+                claims = [
+                    {article.id for article in reviews.claim_next(editor)}
+                    for editor in self.editors
+                ]
+
+                self.assertEqual([len(ids) for ids in claims], [2, 2, 1])
+                self.assertEqual(len(set.union(*claims)), 5)
+                self.assertEqual(
+                    {a.id for a in reviews.claim_next(self.editors[0])},
+                    claims[0]
+                )
+
+    def test_expired_claims_return_to_the_queue(self):
+        """Test claim expiry, review scoping and the queue stats."""
+        first, second = self.editors[:2]
+        claimed = list(reviews.claim_next(first))
+        updated = reviews.bulk_review(
+            second, [article.id for article in claimed], reviews.APPROVE
+        )
+        self.assertEqual(updated, 0)
+
+        Article.objects.filter(claimed_by=first).update(
+            claimed_until=timezone.now() - timedelta(seconds=1)
+        )
+        stats, = reviews.queue_stats(self.house.id)
+        self.assertEqual((stats['depth'], stats['claimed']), (5, 0))
+        self.assertGreaterEqual(stats['age'], 0)
+
+        reclaimed = {a.id for a in reviews.claim_next(second)}
+        self.assertEqual(reclaimed, {article.id for article in claimed})
+        self.assertIn(
+            f'news_review_queue_depth{{house="{self.house.id}"}} 5',
+            self.client.get(reverse('metrics')).content.decode()
+        )
+
+    def test_approving_a_rejected_article_clears_the_rejection(self):
+        """Test that an approved article is never also rejected."""
+        article = Article.objects.filter(publishing_house=self.house)[0]
+        editor = self.editors[0]
+        reviews.bulk_review(editor, [article.id], reviews.REJECT)
+        User.objects.filter(pk=editor.pk).update(is_active=True)
+        self.client.force_login(editor)
+
+        self.client.get(reverse('approve_article', args=[article.id]))
+
+        article.refresh_from_db()
+        self.assertEqual((article.approved, article.rejected), (True, False))
+
+
+class MetricsTest(TestCase):
+    """Tests for per-view request metrics."""
+    def setUp(self):
+        cache.clear()
+        REGISTRY.reset()
+
+    def test_requests_are_recorded_per_url_name(self):
+        """Test that latency, queries and size are exported per view."""
+        self.client.get(reverse('article_list'))
+        self.client.get(reverse('article_list'))
+
+        body = self.client.get(reverse('metrics')).content.decode()
+
+        self.assertIn(
+            'news_http_request_duration_seconds_count'
+            '{view="article_list"} 2', body
+        )
+        self.assertIn(
+            'news_http_requests_total{view="article_list",status="200"} 2',
+            body
+        )
+        self.assertIn('news_db_queries_total{view="article_list"}', body)
+        self.assertIn('news_page_cache_hit_ratio 0.5', body)
+
+    def test_snapshots_of_other_processes_are_summed(self):
+        """Test that /metrics adds up every worker's snapshot file."""
+        directory = tempfile.mkdtemp()
+        with open(os.path.join(directory, '1.json'), 'w',
+                  encoding='utf-8') as snapshot:
+            json.dump({'requests': {'article_list\t200': 3}}, snapshot)
+        self.addCleanup(os.remove, os.path.join(directory, '1.json'))
+
+        with override_settings(METRICS_DIR=directory):
+            self.client.get(reverse('article_list'))
+            body = self.client.get(reverse('metrics')).content.decode()
+
+        self.assertIn(
+            'news_http_requests_total{view="article_list",status="200"} 4',
+            body
+        )
+        os.remove(os.path.join(directory, f'{os.getpid()}.json'))
+
+
+class BenchmarkTest(TestCase):
+    """Tests for the synthetic dataset and the benchmark runner."""
+    def setUp(self):
+        call_command(
+            'seed_synthetic', publishing_houses=2, journalists=4, editors=2,
+            readers=5, subscriptions=10, articles=30, stdout=io.StringIO(),
+            stderr=io.StringIO()
+        )
+
+    def test_seed_is_reproducible(self):
+        """Test that reseeding with the same seed yields the same data."""
+        titles = list(
+            Article.objects.order_by('title').values_list('title', flat=True)
+        )
+        call_command(
+            'seed_synthetic', publishing_houses=2, journalists=4, editors=2,
+            readers=5, subscriptions=10, articles=30, clear=True,
+            stdout=io.StringIO(), stderr=io.StringIO()
+        )
+
+        self.assertEqual(len(titles), 30)
+        self.assertEqual(titles, list(
+            Article.objects.order_by('title').values_list('title', flat=True)
+        ))
+
+    def test_runner_reports_percentiles_queries_and_memory(self):
+        """Test that each scenario reports latency, queries and memory."""
+        report = BenchmarkRunner(iterations=3, warmup=1).run(
+            ['article_detail', 'journalist_dashboard']
+        )
+
+        self.assertEqual(
+            set(report['scenarios']),
+            {'article_detail', 'journalist_dashboard'}
+        )
+        for result in report['scenarios'].values():
+            self.assertEqual(result['status_codes'], {'200': 3})
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertGreater(result['peak_memory_kib'], 0)
+        self.assertGreater(
+            report['scenarios']['journalist_dashboard']['max_queries'], 0
+        )
+
+
+def plan_indexes(sql):
+    """The index each table access in ``EXPLAIN sql`` reads through:
+    ``PRIMARY`` for primary key lookups, ``None`` for table scans."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            accesses = []
+            for row in cursor.fetchall():
+                if not re.match(r'(SEARCH|SCAN) ', row[-1]):
+                    continue
+                index = re.search(r'USING (?:COVERING )?INDEX (\w+)',
+                                  row[-1])
+                accesses.append(
+                    index.group(1) if index else
+                    'PRIMARY' if 'PRIMARY KEY' in row[-1] else None
+                )
+            return accesses
+        cursor.execute(f'EXPLAIN {sql}')
+        columns = [column[0] for column in cursor.description]
+        return [
+            row.get('key')
+            for row in map(dict, (zip(columns, r) for r in cursor))
+        ]
+
+
+class QueryPlanTest(TestCase):
+    """Tests that the hot article queries are served by indexes."""
+    def setUp(self):
+        cache.clear()
+        self.house = PublishingHouse.objects.create(name='Index Times')
+        self.journalist = User.objects.create_user(
+            username='plan_journalist',
+            password='password123',
+            role='journalist',
+            publishing_house=self.house
+        )
+        self.editor = User.objects.create_user(
+            username='plan_editor',
+            password='password123',
+            role='editor',
+            publishing_house=self.house
+        )
+        User.objects.filter(pk=self.editor.pk).update(is_active=True)
+        for number in range(45):
+            Article.objects.create(
+                title=f'Story {number}',
+                content='Content',
+                journalist=self.journalist,
+                publishing_house=self.house,
+                approved=number % 3 != 0
+            )
+
+    def assertIndexed(self, run, *indexes, table='news_app_article'):
+        """Run ``run`` and fail unless every query on ``table`` reads
+        through ``indexes`` (and primary keys) only."""
+        with CaptureQueriesContext(connection) as context:
+            run()
+        selects = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT') and table in query['sql']
+        ]
+        self.assertTrue(selects)
+        for sql in selects:
+            used = plan_indexes(sql)
+            self.assertLessEqual(set(used), {*indexes, 'PRIMARY'}, sql)
+            self.assertTrue(set(used) & set(indexes), sql)
+
+    def test_public_list_pages(self):
+        """Test the public list and its next page."""
+        response = self.client.get(reverse('article_list'))
+        self.assertIndexed(lambda: self.client.get(
+            reverse('article_list'),
+            {'cursor': response.context['page'].next_cursor}
+        ), 'article_recent_idx')
+        cache.clear()
+        self.assertIndexed(
+            lambda: self.client.get(reverse('article_list')),
+            'article_recent_idx'
+        )
+
+    def test_dashboards(self):
+        """Test the editor queue and the journalist dashboard."""
+        self.client.force_login(self.editor)
+        self.assertIndexed(
+            lambda: self.client.get(reverse('editor_dashboard')),
+            'article_pending_queue_idx'
+        )
+        self.client.force_login(self.journalist)
+        self.assertIndexed(
+            lambda: self.client.get(reverse('journalist_dashboard')),
+            'article_journalist_recent_idx'
+        )
+
+    def test_subscriptions(self):
+        """Test the subscribed feed and the readers of an article."""
+        reader = User.objects.create_user(
+            username='plan_reader',
+            password='password123',
+            role='reader'
+        )
+        reader.subscribed_journalists.add(self.journalist)
+        reader.subscribed_publishing_houses.add(self.house)
+        self.client.force_login(reader)
+
+        article = Article.objects.first()
+        self.assertIndexed(
+            lambda: self.client.get(reverse('api_articles')),
+            'article_journalist_recent_idx', 'article_house_recent_idx'
+        )
+        self.assertIndexed(
+            lambda: list(subscriptions.subscribed_readers(article)),
+            'journalist_subscribers_idx', 'house_subscribers_idx',
+            table='news_app_customuser'
+        )
+
+    def test_export(self):
+        """Test the keyset-chunked export."""
+        self.assertIndexed(
+            lambda: list(ArticleExport(chunk_size=10).rows()),
+            'article_updated_idx'
+        )
+
+    def test_publish_scheduler(self):
+        """Test the scheduler's search for the next and due articles."""
+        Article.objects.filter(title='Story 1').update(
+            publish_at=timezone.now()
+        )
+        self.assertIndexed(
+            scheduling.next_publish_time, 'article_publish_at_idx'
+        )
+        self.assertIndexed(
+            lambda: scheduling.publish_due(10), 'article_publish_at_idx'
+        )
+
+
+@override_settings(NOTIFICATION_CHANNELS=["email"])
+class SubscriptionTest(TestCase):
+    """Tests for reader subscriptions and what they deliver."""
+    def setUp(self):
+        cache.clear()
+        self.house = PublishingHouse.objects.create(name='Subscribed Times')
+        self.journalist = User.objects.create_user(
+            username='followed_journalist',
+            password='password123',
+            role='journalist',
+            publishing_house=self.house
+        )
+        self.reader = User.objects.create_user(
+            username='follower',
+            email='follower@example.com',
+            password='password123',
+            role='reader'
+        )
+        self.client.force_login(self.reader)
+
+    @staticmethod
+    def drain_outbox():
+        """Deliver every due notification job in this thread."""
+        for job_id in notifications.claim_due_jobs(100, 'worker'):
+            notifications.run_job(job_id, 'worker')
+
+    def create_article(self, **fields):
+        """Create an article by the followed journalist."""
+        return Article.objects.create(
+            title='Followed story',
+            content='Content',
+            journalist=self.journalist,
+            publishing_house=self.house,
+            **fields
+        )
+
+    def test_subscribe_and_unsubscribe_via_api(self):
+        """Test that the API changes subscriptions and the cached ids."""
+        url = reverse(
+            'api_journalist_subscription', args=[self.journalist.id]
+        )
+        self.assertEqual(self.client.post(url).status_code, 201)
+        self.assertEqual(self.client.post(url).status_code, 200)
+        self.client.post(reverse(
+            'api_publishing_house_subscription', args=[self.house.id]
+        ))
+        self.assertEqual(
+            self.client.get(reverse('api_subscriptions')).json(),
+            {'journalists': [self.journalist.id],
+             'publishing_houses': [self.house.id]}
+        )
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        self.assertEqual(
+            subscriptions.subscription_ids(self.reader).journalists,
+            frozenset()
+        )
+        self.assertEqual(self.client.post(reverse(
+            'api_journalist_subscription', args=[self.reader.id]
+        )).status_code, 404)
+
+    def test_approval_emails_each_subscriber_once(self):
+        """Test that following both author and house sends one email."""
+        self.reader.subscribed_journalists.add(self.journalist)
+        self.reader.subscribed_publishing_houses.add(self.house)
+
+        self.create_article(approved=True)
+        self.drain_outbox()
+
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [['follower@example.com']]
+        )
+
+    def test_bulk_approval_sends_one_digest(self):
+        """Test that a bulk approval mails subscribers one digest."""
+        self.house.subscribers.add(self.reader)
+        editor = User.objects.create_user(
+            username='digest_editor',
+            password='password123',
+            role='editor',
+            publishing_house=self.house
+        )
+        pending = [self.create_article(), self.create_article()]
+
+        reviews.bulk_review(
+            editor, [article.id for article in pending], reviews.APPROVE
+        )
+        self.drain_outbox()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['follower@example.com'])
+
+    def test_feed_in_both_modes(self):
+        """Test that read-time and fanned-out feeds list the article."""
+        self.reader.subscribed_journalists.add(self.journalist)
+        article = self.create_article(approved=True)
+
+        response = self.client.get(reverse('api_articles'))
+        self.assertEqual(
+            [item['id'] for item in response.json()['results']],
+            [article.id]
+        )
+
+        with override_settings(FEED_MODE='write'):
+            feeds.fan_out_article(article)
+            response = self.client.get(reverse('api_articles'))
+        self.assertEqual(
+            [item['id'] for item in response.json()['results']],
+            [article.id]
+        )
+        self.assertTrue(
+            FeedEntry.objects.filter(reader=self.reader).exists()
+        )
+
+
+@override_settings(
+    SESSION_ENGINE='django.contrib.sessions.backends.cache',
+    CACHE_SHARED=True
+)
+class CachedAuthTest(TestCase):
+    """Tests for cached sessions and the cached request.user."""
+    def setUp(self):
+        cache.clear()
+        self.reader = User.objects.create_user(
+            username='cached_reader',
+            password='password123',
+            role='reader'
+        )
+        self.client.login(username='cached_reader', password='password123')
+
+    def test_authenticated_api_call_needs_no_queries(self):
+        """Test that session, user and subscriptions come from the cache."""
+        url = reverse('api_subscriptions')
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            self.client.get(reverse('article_list')), 'cached_reader'
+        )
+
+    def test_saving_the_user_refreshes_the_snapshot(self):
+        """Test that changes to the user row apply on the next request."""
+        url = reverse('api_subscriptions')
+        self.client.get(url)
+
+        self.reader.role = 'journalist'
+        self.reader.save()
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.reader.set_password('new-password123')
+        self.reader.save()
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_process_local_cache_keeps_no_snapshot(self):
+        """Test that users are not snapshotted into a per-process cache."""
+        self.client.get(reverse('api_subscriptions'))
+
+        self.assertIsNone(cache.get(backends.user_cache_key(self.reader.pk)))
+
+
+@override_settings(ROOT_URLCONF='news_project.asgi_urls')
+class AsyncReadPathTest(TestCase):
+    """Tests for the async public views served under ASGI."""
+    def setUp(self):
+        cache.clear()
+        self.journalist = User.objects.create_user(
+            username='async_journalist',
+            password='password123',
+            role='journalist'
+        )
+        self.article = Article.objects.create(
+            title='Async story',
+            content='Served from the event loop',
+            journalist=self.journalist,
+            approved=True
+        )
+        self.reader = User.objects.create_user(
+            username='async_reader',
+            password='password123',
+            role='reader'
+        )
+        self.reader.subscribed_journalists.add(self.journalist)
+
+    async def test_public_pages_are_async(self):
+        """Test that list and detail resolve to the async views."""
+        client = AsyncClient()
+
+        listing = await client.get(reverse('article_list'))
+        detail = await client.get(
+            reverse('article_detail', args=[self.article.id])
+        )
+
+        self.assertEqual(listing.resolver_match.func.__name__,
+                         'aarticle_list')
+        self.assertContains(listing, 'async_journalist')
+        self.assertContains(detail, 'Served from the event loop')
+        cached = await client.get(
+            reverse('article_detail', args=[self.article.id])
+        )
+        self.assertContains(cached, 'Served from the event loop')
+
+    async def test_subscribed_api(self):
+        """Test the async API for readers and its DRF fallback."""
+        client = AsyncClient()
+        self.assertEqual(
+            (await client.get(reverse('api_articles'))).status_code, 403
+        )
+
+        await client.aforce_login(self.reader)
+        response = await client.get(reverse('api_articles'))
+        invalid = await client.get(reverse('api_articles'), {'cursor': 'x'})
+
+        self.assertEqual(
+            [item['id'] for item in response.json()['results']],
+            [self.article.id]
+        )
+        self.assertEqual(invalid.status_code, 400)
+
+    async def test_post_to_subscribed_api_is_not_allowed(self):
+        """Test that the async API rejects writes like the DRF view."""
+        client = AsyncClient()
+        await client.aforce_login(self.reader)
+
+        response = await client.post(reverse('api_articles'))
+
+        self.assertEqual(response.status_code, 405)
+
+    async def test_cache_is_not_used_on_the_event_loop(self):
+        """Test that async views do their cache I/O in a thread."""
+        backend = caches['default']
+        on_loop = []
+
+        def off_loop(method):
+            def checked(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    on_loop.append(method.__name__)
+                except RuntimeError:
+                    pass
+                return method(*args, **kwargs)
+            return checked
+
+        client = AsyncClient()
+        with contextlib.ExitStack() as stack:
+            for name in ('get', 'get_many', 'set', 'set_many', 'add', 'incr'):
+                stack.enter_context(mock.patch.object(
+                    backend, name, off_loop(getattr(backend, name))
+                ))
+            await client.get(reverse('article_list'))
+            await client.get(reverse('article_list'))
+            await client.aforce_login(self.reader)
+            await client.get(reverse('api_articles'))
+
+        self.assertEqual(on_loop, [])
+
+    async def test_async_queries_are_counted_in_metrics(self):
+        """Test that ORM queries of async views reach the recorder."""
+        REGISTRY.reset()
+
+        await AsyncClient().get(reverse('article_list'))
+
+        queries = REGISTRY.snapshot()['db_queries']
+        self.assertGreater(queries['article_list'], 0)
+
+
+@override_settings(DATABASE_REPLICAS=['replica1', 'replica2', 'replica3'])
+class ReplicaRouterTest(SimpleTestCase):
+    """Tests for replica routing and read-your-writes pinning."""
+    def setUp(self):
+        now = time.monotonic()
+        health = {
+            'replica1': (True, now),
+            'replica2': (False, now),
+            'replica3': (True, now),
+        }
+        patcher = mock.patch.object(routers.POOL, 'health', health)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        routers.POOL.position = 0
+        self.router = routers.ReplicaRouter()
+
+    def serve(self, request, write=False):
+        """Run a request through the middleware; return reads and
+        response."""
+        reads = []
+
+        def view(request):
+            reads.append(self.router.db_for_read(Article))
+            if write:
+                self.router.db_for_write(Article)
+            reads.append(self.router.db_for_read(Article))
+            return HttpResponse()
+
+        response = routers.ReplicaPinningMiddleware(view)(request)
+        return reads, response
+
+    def test_reads_round_robin_over_healthy_replicas(self):
+        """Test that safe requests alternate replicas, skipping bad ones."""
+        reads, _ = self.serve(RequestFactory().get('/'))
+
+        self.assertEqual(reads, ['replica1', 'replica3'])
+        self.assertEqual(self.router.db_for_read(Article), 'default')
+
+    def test_writers_are_pinned_to_the_primary(self):
+        """Test that a write pins the client's next reads to the primary."""
+        reads, response = self.serve(RequestFactory().post('/'), write=True)
+        self.assertEqual(reads, ['default', 'default'])
+        self.assertIn(routers.PIN_COOKIE, response.cookies)
+
+        request = RequestFactory().get('/')
+        request.COOKIES[routers.PIN_COOKIE] = '1'
+        reads, response = self.serve(request)
+        self.assertEqual(reads, ['default', 'default'])
+        self.assertNotIn(routers.PIN_COOKIE, response.cookies)
+
+    def test_reads_after_a_write_in_the_request_use_the_primary(self):
+        """Test that a GET that writes reads its own write."""
+        reads, response = self.serve(RequestFactory().get('/'), write=True)
+
+        self.assertEqual(reads, ['replica1', 'default'])
+        self.assertIn(routers.PIN_COOKIE, response.cookies)
+
+
+@override_settings(DATABASE_REPLICAS=['test_replica'])
+class ReplicaDatabaseTest(TransactionTestCase):
+    """Tests for replica routing against a real replica alias.
+
+    ``test_replica`` is a second connection to the test database. This is
+    a ``TransactionTestCase`` because the router sends every read inside
+    a transaction to the primary.
+    """
+    databases = {'default', 'test_replica'}
+
+    def setUp(self):
+        patcher = mock.patch.object(routers.POOL, 'health', {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.journalist = User.objects.create_user(
+            username='replica_journalist',
+            password='password123',
+            role='journalist'
+        )
+
+    def test_reads_after_a_write_in_the_request_use_the_primary(self):
+        """Test that a GET reads its own write from the primary."""
+        found = []
+
+        def view(request):
+            found.append(Article.objects.filter(title='Fresh').exists())
+            Article.objects.create(
+                title='Fresh', content='Content', journalist=self.journalist
+            )
+            found.append(Article.objects.filter(title='Fresh').exists())
+            return HttpResponse()
+
+        with CaptureQueriesContext(connections['test_replica']) as replica:
+            routers.ReplicaPinningMiddleware(view)(RequestFactory().get('/'))
+
+        self.assertEqual(found, [False, True])
+        self.assertEqual(
+            [query['sql'] for query in replica.captured_queries
+             if 'news_app_article' in query['sql']],
+            [replica.captured_queries[-1]['sql']]
+        )
+
+
+class PooledSQLiteWrapper(
+    pool.PooledDatabaseWrapperMixin, sqlite3_base.DatabaseWrapper
+):
+    """SQLite stand-in for news_app.db_backends.mysql in tests."""
+
+
+class ConnectionPoolTest(SimpleTestCase):
+    """Tests for the pooled database backend."""
+    def setUp(self):
+        handle, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        self.settings_dict = ConnectionHandler({'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': path,
+            'OPTIONS': {'pool': {'max_size': 2, 'timeout': 5}},
+        }}).settings['default']
+
+    def serve_requests(self, count):
+        """Run ``count`` requests on one thread's connection wrapper."""
+        wrapper = PooledSQLiteWrapper(self.settings_dict, 'pooled')
+        for _ in range(count):
+            with wrapper.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            # What the request_finished signal does (CONN_MAX_AGE = 0).
+            wrapper.close_if_unusable_or_obsolete()
+
+    def test_connections_are_reused_across_requests_and_threads(self):
+        """Test that 20 requests on 4 threads share two connections."""
+        self.addCleanup(lambda: pool.POOLS.pop('pooled').close_idle())
+        threads = [
+            threading.Thread(target=self.serve_requests, args=(5,))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.pool_stats()['pooled']
+        self.assertLessEqual(stats['created'], 2)
+        self.assertEqual(stats['created'] + stats['reused'], 20)
+        self.assertEqual((stats['in_use'], stats['timeouts']), (0, 0))
+        body = render_prometheus(
+            REGISTRY.collect(), {'hits': 0, 'misses': 0}
+        )
+        self.assertIn(
+            f'news_db_pool_reused_total{{alias="pooled"}} '
+            f'{stats["reused"]}', body
+        )
+
+    def test_exhaustion_times_out_and_dead_connections_are_replaced(self):
+        """Test the wait timeout and the health check on checkout."""
+        connections = pool.ConnectionPool(
+            max_size=1, max_lifetime=60, timeout=0.05, check_idle=0
+        )
+        first, _ = connections.acquire(mock.Mock)
+        with self.assertRaises(pool.PoolTimeout):
+            connections.acquire(mock.Mock)
+
+        connections.release(first)
+        dead = mock.Mock(side_effect=Exception('server has gone away'))
+        second, reused = connections.acquire(mock.Mock, dead)
+
+        self.assertIsNot(second, first)
+        self.assertFalse(reused)
+        first.close.assert_called_once()
+        stats = connections.stats()
+        self.assertEqual(
+            (stats['timeouts'], stats['failed_checks'], stats['created']),
+            (1, 1, 2)
+        )
+
+
+class StaticAssetTest(SimpleTestCase):
+    """Tests for the hashed, precompressed static asset pipeline."""
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        storages = {
+            'default': {
+                'BACKEND': 'django.core.files.storage.FileSystemStorage',
+            },
+            'staticfiles': {
+                'BACKEND': 'news_app.assets.'
+                           'CompressedManifestStaticFilesStorage',
+            },
+        }
+        overrides = override_settings(STATIC_ROOT=root, STORAGES=storages)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        assets.hashed_names.cache_clear()
+        self.addCleanup(assets.hashed_names.cache_clear)
+        call_command('collectstatic', interactive=False, verbosity=0)
+        self.hashed = staticfiles_storage.stored_name(
+            'news_app/css/styles.css'
+        )
+
+    def test_hashed_assets_are_served_precompressed_and_immutable(self):
+        """Test that gzip clients get the .gz variant, cached forever."""
+        response = self.client.get(
+            f'/static/{self.hashed}', headers={
+                'accept-encoding': 'gzip, br;q=0'
+            }
+        )
+        body = gzip.decompress(b''.join(response.streaming_content))
+
+        self.assertNotEqual(self.hashed, 'news_app/css/styles.css')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertEqual(response['Cache-Control'], assets.IMMUTABLE)
+        self.assertIn(b'.navbar-brand', body)
+
+    def test_unhashed_names_are_served_plain_and_briefly_cached(self):
+        """Test the identity fallback and the short max-age."""
+        response = self.client.get('/static/news_app/css/styles.css')
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertIn(b'.navbar-brand', b''.join(response.streaming_content))
+        self.assertEqual(response['Cache-Control'], 'public, max-age=300')
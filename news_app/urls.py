@@ -21,6 +21,8 @@ urlpatterns = [
     path("editor/", views.editor_dashboard, name="editor_dashboard"),
     path("approve/<int:article_id>/", views.approve_article,
          name="approve_article"),
+    path("editor/review/", views.bulk_review_articles,
+         name="bulk_review_articles"),
 
     path("journalist/dashboard/", journalist_dashboard,
          name="journalist_dashboard"),
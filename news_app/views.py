@@ -2,13 +2,38 @@
 HTML views for the news app.
 """
 
-from django.shortcuts import render, redirect, get_object_or_404
+from asgiref.sync import sync_to_async
+from django.shortcuts import (
+    aget_object_or_404,
+    get_object_or_404,
+    redirect,
+    render,
+)
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
-from news_app.models import Article
+from django.db import transaction
+from news_app.models import PUBLISHED, Article
+from .caching import cache_public_page, detail_page_key, list_page_key
+from .dashboards import monthly_output, status_counts
 from .forms import UserRegisterForm, ArticleForm
+from .pagination import (
+    InvalidCursor,
+    apaginate_articles,
+    paginate_articles,
+)
+from .reviews import (
+    ACTIONS,
+    bulk_review,
+    claim_next,
+    is_claimed_by_other,
+    queue_stats,
+)
+
+# Article bodies are never shown on list pages; cards use the stored
+# excerpt and reading time.
+LIST_DEFERRED = ("content", "body_html")
 
 # -------------------------
 # REGISTRATION VIEW
@@ -87,13 +112,62 @@ def user_logout(request):
 # PUBLIC VIEWS
 # -------------------------
 
+@cache_public_page(list_page_key)
 def article_list(request):
-    """List approved articles for readers."""
-    articles = Article.objects.filter(approved=True)
+    """List approved articles for readers, newest first, one page at a time."""
+    articles = Article.objects.filter(
+        PUBLISHED
+    ).select_related("journalist").defer(*LIST_DEFERRED)
+
+    try:
+        page = paginate_articles(articles, request.GET.get("cursor"))
+    except InvalidCursor:
+        page = paginate_articles(articles)
+
     return render(
         request,
         "news_app/article_list.html",
-        {"articles": articles}
+        {"articles": page.items, "page": page}
+    )
+
+
+# Async versions of the public views, routed by news_project.asgi_urls.
+# request.user is resolved up front, and templates (which read cached
+# fragments) render in a thread, so the event loop never waits on the
+# database or the cache.
+
+@cache_public_page(list_page_key)
+async def aarticle_list(request):
+    """Async ``article_list`` for the ASGI deployment."""
+    request.user = await request.auser()
+    articles = Article.objects.filter(
+        PUBLISHED
+    ).select_related("journalist").defer(*LIST_DEFERRED)
+
+    try:
+        page = await apaginate_articles(articles, request.GET.get("cursor"))
+    except InvalidCursor:
+        page = await apaginate_articles(articles)
+
+    return await sync_to_async(render)(
+        request,
+        "news_app/article_list.html",
+        {"articles": page.items, "page": page}
+    )
+
+
+@cache_public_page(detail_page_key)
+async def aarticle_detail(request, article_id):
+    """Async ``article_detail`` for the ASGI deployment."""
+    request.user = await request.auser()
+    article = await aget_object_or_404(
+        Article.objects.filter(PUBLISHED).defer("content"),
+        id=article_id
+    )
+    return await sync_to_async(render)(
+        request,
+        "news_app/article_detail.html",
+        {"article": article}
     )
 
 
@@ -103,21 +177,20 @@ def article_list(request):
 
 @login_required
 def editor_dashboard(request):
-    """Dashboard for editors."""
+    """Dashboard for editors: the pending articles claimed for them from
+    their house's review queue, plus the queue's depth and age."""
     if request.user.role != "editor":
         raise PermissionDenied
 
-    publishing_house = request.user.publishing_house
-
-    articles = Article.objects.filter(
-        approved=False,
-        publishing_house=publishing_house
-    )
+    articles = claim_next(request.user).select_related(
+        "journalist"
+    ).defer(*LIST_DEFERRED)
+    queue = queue_stats(request.user.publishing_house_id)
 
     return render(
         request,
         "news_app/editor_dashboard.html",
-        {"articles": articles}
+        {"articles": articles, "queue": queue[0] if queue else None}
     )
 
 
@@ -130,12 +203,41 @@ def approve_article(request, article_id):
     article = get_object_or_404(
         Article,
         id=article_id,
-        publishing_house=request.user.publishing_house
+        publishing_house_id=request.user.publishing_house_id
     )
+    if is_claimed_by_other(article, request.user):
+        messages.error(request, "Another editor is reviewing that article.")
+        return redirect("editor_dashboard")
+
+    # The notification outbox rows commit together with the approval.
+    with transaction.atomic():
+        article.approved = True
+        article.rejected = False
+        article.claimed_by = None
+        article.claimed_until = None
+        article.save()
 
-    article.approved = True
-    article.save()
+    return redirect("editor_dashboard")
 
+
+@login_required
+def bulk_review_articles(request):
+    """Approve or reject all selected articles in one request."""
+    if request.user.role != "editor":
+        raise PermissionDenied
+
+    action = request.POST.get("action")
+    if request.method != "POST" or action not in ACTIONS:
+        return redirect("editor_dashboard")
+
+    article_ids = [
+        int(article_id)
+        for article_id in request.POST.getlist("article_ids")
+        if article_id.isdigit()
+    ]
+    count = bulk_review(request.user, article_ids, action)
+
+    messages.success(request, f"{count} article(s) {action}d.")
     return redirect("editor_dashboard")
 
 
@@ -145,15 +247,29 @@ def approve_article(request, article_id):
 
 @login_required
 def journalist_dashboard(request):
-    """Dashboard for journalists."""
+    """Dashboard for journalists: a page of their articles, newest first,
+    with status counts and recent monthly output."""
     if request.user.role != "journalist":
         raise PermissionDenied
 
-    articles = Article.objects.filter(journalist=request.user)
+    articles = Article.objects.filter(
+        journalist=request.user
+    ).select_related("journalist").defer(*LIST_DEFERRED)
+
+    try:
+        page = paginate_articles(articles, request.GET.get("cursor"))
+    except InvalidCursor:
+        page = paginate_articles(articles)
+
     return render(
         request,
         "news_app/journalist_dashboard.html",
-        {"articles": articles}
+        {
+            "articles": page.items,
+            "page": page,
+            "counts": status_counts(request.user),
+            "months": monthly_output(request.user),
+        }
     )
 
 
@@ -183,12 +299,12 @@ def submit_article(request):
     )
 
 
+@cache_public_page(detail_page_key)
 def article_detail(request, article_id):
     """View details of an approved article."""
     article = get_object_or_404(
-        Article,
-        id=article_id,
-        approved=True
+        Article.objects.filter(PUBLISHED).defer("content"),
+        id=article_id
     )
     return render(
         request,
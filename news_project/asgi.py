@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'news_project.settings')
+# Serve the public read path with async views (see asgi_urls.py).
+os.environ.setdefault('ROOT_URLCONF', 'news_project.asgi_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,20 @@
+"""
+URL configuration for the ASGI deployment.
+
+Routes the public read path (article list, article detail and the
+subscribed articles API) to async views and everything else to the same
+views as ``news_project.urls``. ``asgi.py`` selects it via ROOT_URLCONF.
+"""
+from django.urls import path
+
+from news_app.api.views import asubscribed_articles
+from news_app.views import aarticle_detail, aarticle_list
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('', aarticle_list, name='article_list'),
+    path('articles/<int:article_id>/', aarticle_detail,
+         name='article_detail'),
+    path('api/articles/', asubscribed_articles, name='api_articles'),
+] + sync_urlpatterns
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 
 # Build paths inside the project: BASE_DIR / 'subdir'.
@@ -45,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'news_app.metrics.MetricsMiddleware',
+    'news_app.routers.ReplicaPinningMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -54,14 +57,22 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'news_project.urls'
+# asgi.py switches to news_project.asgi_urls (async public views).
+ROOT_URLCONF = os.getenv('ROOT_URLCONF', 'news_project.urls')
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Compiled templates stay in memory for the process lifetime;
+            # runserver's autoreloader resets them when a template changes.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
@@ -92,6 +103,42 @@ if ENVIRONMENT == 'production':
             'PORT': os.getenv('DB_PORT', '3306'),
         },
     }
+    # Connection reuse. DB_POOL_SIZE > 0 switches to the pooled backend:
+    # each request borrows a connection and returns it when it finishes
+    # (stats at /metrics). Otherwise each worker thread keeps a persistent
+    # connection for DB_CONN_MAX_AGE seconds, health-checked before reuse.
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '0'))
+    if DB_POOL_SIZE:
+        DATABASES['default'].update({
+            'ENGINE': 'news_app.db_backends.mysql',
+            'CONN_MAX_AGE': 0,
+            'OPTIONS': {
+                'pool': {
+                    'max_size': DB_POOL_SIZE,
+                    'max_lifetime': float(
+                        os.getenv('DB_POOL_MAX_LIFETIME', '1800')
+                    ),
+                    'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+                    'check_idle': float(
+                        os.getenv('DB_POOL_CHECK_IDLE', '1')
+                    ),
+                },
+            },
+        })
+    else:
+        DATABASES['default'].update({
+            'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
+        })
+    # Read replicas: DB_REPLICA_HOSTS=host1,host2 (same credentials).
+    for number, host in enumerate(
+        filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1
+    ):
+        DATABASES[f'replica{number}'] = {
+            **DATABASES['default'],
+            'HOST': host.strip(),
+            'TEST': {'MIRROR': 'default'},
+        }
 else:
     DATABASES = {
         'default': {
@@ -99,6 +146,78 @@ else:
             'NAME': BASE_DIR / 'db.sqlite3',
             }
         }
+    # SQLITE_REPLICAS=N adds N SQLite files standing in for replicas
+    # (copy db.sqlite3 to db.replicaN.sqlite3 to populate them).
+    for number in range(1, int(os.getenv('SQLITE_REPLICAS', '0')) + 1):
+        DATABASES[f'replica{number}'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / f'db.replica{number}.sqlite3',
+            'TEST': {'MIRROR': 'default'},
+        }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+if sys.argv[1:2] == ['test']:
+    # A second connection to the test database, for tests that route
+    # reads to a real replica alias (they add it to DATABASE_REPLICAS).
+    DATABASES['test_replica'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['news_app.routers.ReplicaRouter']
+# Seconds a client that wrote reads from the primary only.
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '10'))
+# Seconds a replica health check result is trusted.
+REPLICA_HEALTH_CHECK_SECONDS = int(
+    os.getenv('REPLICA_HEALTH_CHECK_SECONDS', '5')
+)
+
+# Cache: CACHE_BACKEND selects locmem, file or redis (any
+# Redis-compatible server, e.g. Valkey or KeyDB). Cached pages are
+# invalidated by bumping version counters in the cache, which other
+# processes only see in a shared cache, so locmem is only the default
+# for development.
+CACHE_BACKEND = os.getenv(
+    'CACHE_BACKEND',
+    'locmem' if DEBUG and ENVIRONMENT != 'production' else 'redis'
+)
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', '/var/tmp/news_app_cache'),
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'redis://127.0.0.1:6379'),
+    },
+}
+CACHES = {'default': CACHE_BACKENDS[CACHE_BACKEND]}
+# Whether every process sees the same cache. Anything invalidated in
+# one process and read in another (user snapshots, cache versions, the
+# publish scheduler wake-up) depends on it.
+CACHE_SHARED = CACHE_BACKEND != 'locmem'
+
+# Rendered public pages and API payloads; invalidated by version bumps.
+PAGE_CACHE_SECONDS = int(os.getenv('PAGE_CACHE_SECONDS', '300'))
+# Per-reader subscribed ids; dropped on every change, the timeout is a
+# safety net only.
+SUBSCRIPTION_CACHE_SECONDS = int(
+    os.getenv('SUBSCRIPTION_CACHE_SECONDS', '3600')
+)
+
+# Request metrics exposed at /metrics. With several worker processes set
+# METRICS_DIR to a directory they share so the endpoint sums all of them.
+METRICS_DIR = os.getenv('METRICS_DIR', '')
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', '5'))
+METRICS_LATENCY_BUCKETS = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+]
+METRICS_ALLOWED_IPS = [
+    ip for ip in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+    if ip
+]
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -147,11 +266,78 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+STATIC_ROOT = os.getenv('STATIC_ROOT', BASE_DIR / 'staticfiles')
 
-STATICFILES_DIRS = [BASE_DIR / 'news_app' / 'static']
+# Production assets are built by `manage.py collectstatic`: content-hashed
+# names plus .gz/.br variants, served by news_app.assets.serve with
+# immutable caching. Unhashed names get STATIC_MAX_AGE seconds.
+STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', '300'))
+if ENVIRONMENT == 'production':
+    STORAGES = {
+        'default': {
+            'BACKEND': 'django.core.files.storage.FileSystemStorage',
+        },
+        'staticfiles': {
+            'BACKEND': 'news_app.assets.CompressedManifestStaticFilesStorage',
+        },
+    }
 
 AUTH_USER_MODEL = 'news_app.CustomUser'
 
+# request.user is rebuilt from a cached snapshot instead of a query,
+# when CACHE_SHARED (otherwise other processes would miss invalidations).
+AUTHENTICATION_BACKENDS = ['news_app.backends.CachedModelBackend']
+USER_CACHE_SECONDS = int(os.getenv('USER_CACHE_SECONDS', '300'))
+
+# SESSION_MODE: cached_db (default; reads from the cache, writes through
+# to the database), cache (no database at all; needs a shared cache such
+# as redis), signed_cookies or db.
+SESSION_MODE = os.getenv('SESSION_MODE', 'cached_db')
+SESSION_ENGINE = {
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'db': 'django.contrib.sessions.backends.db',
+}[SESSION_MODE]
+
+# Keyset pagination for article listings and the API
+ARTICLES_PAGE_SIZE = 20
+ARTICLES_MAX_PAGE_SIZE = 100
+
+# Reader feeds: "read" builds feeds per request from subscriptions, "write"
+# fans approved articles out into FeedEntry rows. Houses with more followers
+# than FEED_FANOUT_MAX_FOLLOWERS are always merged in at read time.
+FEED_MODE = os.getenv("FEED_MODE", "read")
+FEED_FANOUT_BATCH_SIZE = 1000
+FEED_FANOUT_MAX_FOLLOWERS = int(
+    os.getenv("FEED_FANOUT_MAX_FOLLOWERS", "50000")
+)
+FEED_LARGE_HOUSES_CACHE_SECONDS = 60
+# Latest articles copied into a feed when the reader follows someone new.
+FEED_BACKFILL_ARTICLES = 100
+
+# Full-text search (SQLite FTS5 in development, MySQL FULLTEXT in production)
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGES = 50
+SEARCH_ADMIN_MAX_RESULTS = 1000
+
+# Rows fetched per keyset chunk by `manage.py export_articles` and the API
+EXPORT_CHUNK_SIZE = 2000
+
+# Rows per bulk_create transaction in `manage.py import_articles`
+IMPORT_BATCH_SIZE = 1000
+
+# Months of per-month output shown on the journalist dashboard
+DASHBOARD_MONTHS = 12
+
+# Editor review queue: each editor holds up to REVIEW_CLAIM_BATCH pending
+# articles for REVIEW_CLAIM_SECONDS, renewed whenever the dashboard loads.
+REVIEW_CLAIM_BATCH = int(os.getenv('REVIEW_CLAIM_BATCH', '10'))
+REVIEW_CLAIM_SECONDS = int(os.getenv('REVIEW_CLAIM_SECONDS', '900'))
+
+# Upper bound on articles per bulk approve/reject request
+BULK_REVIEW_MAX_ARTICLES = 500
+
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'news@app.com'
 
@@ -163,6 +349,39 @@ X_ACCESS_TOKEN = os.getenv("X_ACCESS_TOKEN")
 X_ACCESS_TOKEN_SECRET = os.getenv("X_ACCESS_TOKEN_SECRET")
 X_BEARER_TOKEN = os.getenv("X_BEARER_TOKEN")
 
+# X publisher (news_app/publishers.py): one pooled connection, a bounded
+# queue, backoff with jitter on 5xx/network errors and a circuit breaker
+# that fails posts fast for X_BREAKER_RESET_SECONDS after
+# X_BREAKER_THRESHOLD consecutive failures.
+X_API_URL = os.getenv("X_API_URL", "https://api.twitter.com")
+X_TIMEOUT = float(os.getenv("X_TIMEOUT", "10"))  # seconds per request
+X_QUEUE_SIZE = int(os.getenv("X_QUEUE_SIZE", "100"))
+X_MAX_RETRIES = int(os.getenv("X_MAX_RETRIES", "3"))
+X_BACKOFF_BASE = 1.0  # seconds, doubled on every retry
+X_BACKOFF_MAX = 30.0
+X_BREAKER_THRESHOLD = int(os.getenv("X_BREAKER_THRESHOLD", "5"))
+X_BREAKER_RESET_SECONDS = int(os.getenv("X_BREAKER_RESET_SECONDS", "60"))
+# Longer rate-limit pauses reschedule the job instead of waiting.
+X_MAX_RATE_LIMIT_WAIT = 60
+
+# Notification outbox (drained by `manage.py run_notification_worker`)
+NOTIFICATION_CHANNELS = ["email"] + (["x"] if X_API_KEY else [])
+NOTIFICATION_WORKERS = int(os.getenv("NOTIFICATION_WORKERS", "4"))
+NOTIFICATION_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "5"))
+NOTIFICATION_RETRY_BACKOFF = 30  # seconds, doubled on every retry
+NOTIFICATION_LEASE_TIMEOUT = 300  # seconds before a stuck job is retried
+NOTIFICATION_EMAIL_CHUNK_SIZE = int(
+    os.getenv("NOTIFICATION_EMAIL_CHUNK_SIZE", "500")
+)
+
+# Embargoed articles (`manage.py run_publish_scheduler`)
+PUBLISH_BATCH_SIZE = int(os.getenv("PUBLISH_BATCH_SIZE", "200"))
+# The scheduler sleeps until the next publish_at. Scheduling an article
+# bumps a cache counter it checks every PUBLISH_WAKE_CHECK_SECONDS, so it
+# needs a shared cache (CACHE_SHARED); PUBLISH_MAX_SLEEP is a safety net.
+PUBLISH_WAKE_CHECK_SECONDS = 1.0
+PUBLISH_MAX_SLEEP = 300
+
 # Logging configuration
 LOGGING = {
     "version": 1,